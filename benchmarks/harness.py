@@ -0,0 +1,173 @@
+"""
+CronoStar benchmark harness
+Reuses the Home Assistant stubs from tests/conftest.py and generates synthetic controllers
+"""
+
+import importlib.util
+import json
+import random
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+def install_ha_stubs() -> None:
+    """Install the HA stub modules used by the test-suite (no-op when already installed, e.g. under pytest)"""
+    if "homeassistant.core" in sys.modules:
+        return
+    spec = importlib.util.spec_from_file_location("cronostar_bench_conftest", REPO_ROOT / "tests" / "conftest.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["cronostar_bench_conftest"] = module
+    spec.loader.exec_module(module)
+
+
+install_ha_stubs()
+
+from custom_components.cronostar.const import DOMAIN  # noqa: E402
+from custom_components.cronostar.utils.filename_builder import build_profile_filename  # noqa: E402
+
+# Presets cycled through the synthetic controllers: (preset_type, target domain, min, max)
+PRESETS = [
+    ("thermostat", "climate", 15.0, 24.0),
+    ("ev_charging", "input_number", 0.0, 12.0),
+    ("generic_switch", "switch", 0.0, 1.0),
+    ("cover", "cover", 0.0, 100.0),
+]
+
+PROFILE_NAMES = ["Default", "Comfort", "Eco", "Away"]
+
+
+def make_hass(config_dir: Path) -> MagicMock:
+    """
+    Build a HomeAssistant stand-in equivalent to the tests' `hass` fixture
+
+    Args:
+        config_dir: Directory used as /config
+
+    Returns:
+        Mocked hass with a synchronous executor, a state store and a service registry
+    """
+    hass = MagicMock()
+    hass.config.path = lambda *parts: str(config_dir.joinpath(*parts))
+    hass.is_running = True
+    hass.data = {}
+
+    async def _exec(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = _exec
+
+    states = {}
+
+    def _set_state(entity_id, state, attributes=None):
+        obj = MagicMock()
+        obj.state = state
+        obj.attributes = attributes or {}
+        obj.entity_id = entity_id
+        states[entity_id] = obj
+        return obj
+
+    hass.states.get = states.get
+    hass.states.async_set = _set_state
+    hass.states.async_all = lambda domain=None: [s for s in states.values() if domain is None or s.entity_id.startswith(f"{domain}.")]
+
+    entries = {}
+    hass.config_entries._entries = entries
+    hass.config_entries.async_entries = lambda *args, **kwargs: list(entries.values())
+    hass.config_entries.async_update_entry = MagicMock(return_value=True)
+    hass.config_entries.flow.async_init = AsyncMock()
+
+    services = {}
+
+    def _register(domain, service, handler, schema=None, **kwargs):
+        services[(domain, service)] = handler
+
+    hass.services.async_register = _register
+    hass.services.async_call = AsyncMock()
+    hass.services.has_service = lambda domain, service: (domain, service) in services
+    hass.bench_services = services
+    hass.async_create_task = MagicMock(side_effect=lambda coro, *args, **kwargs: coro.close())
+    return hass
+
+
+def make_schedule(rng: random.Random, low: float, high: float, points: int) -> list[dict]:
+    """Return a sorted schedule with `points` breakpoints between 00:00 and 23:59"""
+    minutes = sorted(rng.sample(range(1, 1439), points - 2))
+    schedule = [{"time": "00:00", "value": round(rng.uniform(low, high), 1)}]
+    for minute in minutes:
+        schedule.append({"time": f"{minute // 60:02d}:{minute % 60:02d}", "value": round(rng.uniform(low, high), 1)})
+    schedule.append({"time": "23:59", "value": schedule[-1]["value"]})
+    return schedule
+
+
+def generate_controllers(hass: MagicMock, count: int, seed: int = 1) -> list:
+    """
+    Write `count` controller containers and register matching config entries and target states
+
+    Args:
+        hass: Harness hass (see make_hass)
+        count: Number of controllers
+        seed: Random seed (deterministic layouts)
+
+    Returns:
+        List of config entries (one per controller)
+    """
+    rng = random.Random(seed)
+    profiles_dir = Path(hass.config.path("cronostar/profiles"))
+    profiles_dir.mkdir(parents=True, exist_ok=True)
+
+    entries = []
+    for idx in range(count):
+        preset, domain, low, high = PRESETS[idx % len(PRESETS)]
+        prefix = f"cronostar_{preset}_bench{idx:04d}_"
+        target = f"{domain}.bench_{idx:04d}"
+        container = {
+            "meta": {
+                "global_prefix": prefix,
+                "preset_type": preset,
+                "target_entity": target,
+                "title": f"Bench {idx}",
+                "min_value": low,
+                "max_value": high,
+                "last_active_profile": "Default",
+                "is_enabled": True,
+            },
+            "profiles": {
+                name: {
+                    "schedule": make_schedule(rng, low, high, rng.randint(6, 48)),
+                    "updated_at": "2026-01-01T00:00:00",
+                }
+                for name in PROFILE_NAMES
+            },
+        }
+        filename = build_profile_filename(preset, prefix)
+        (profiles_dir / filename).write_text(json.dumps(container, indent=2), "utf-8")
+
+        entry = MagicMock()
+        entry.entry_id = f"bench_{idx:04d}"
+        entry.title = f"Bench {idx}"
+        entry.options = {}
+        entry.runtime_data = None  # set to the coordinator by the benchmark
+        entry.data = {
+            "name": f"Bench {idx}",
+            "preset_type": preset,
+            "target_entity": target,
+            "global_prefix": prefix,
+        }
+        hass.config_entries._entries[entry.entry_id] = entry
+        hass.states.async_set(target, "on" if domain == "switch" else "20", {"temperature": 20, "current_position": 50})
+        entries.append(entry)
+
+    hass.data.setdefault(DOMAIN, {})
+    return entries
+
+
+def make_call(data: dict) -> MagicMock:
+    """Build a ServiceCall stand-in"""
+    call = MagicMock()
+    call.data = data
+    return call
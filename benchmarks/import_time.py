@@ -0,0 +1,145 @@
+"""
+CronoStar import-time benchmark
+Times a cold import of the integration entry path in fresh interpreters
+
+Usage:
+    python benchmarks/import_time.py                         # entry modules, 5 runs each
+    python benchmarks/import_time.py --runs 20 --output import_times.json
+    python benchmarks/import_time.py --module custom_components.cronostar.config_flow
+
+Each run starts a new interpreter, installs the Home Assistant stubs from
+tests/conftest.py without importing the integration, then imports the module
+under test. Besides timings, the report lists which optional modules (NumPy,
+PyYAML, sqlite3, ...) were pulled in: they must only load on first use, so
+the run exits with status 1 when one of them is imported at bootstrap.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_MODULES = [
+    "custom_components.cronostar",
+    "custom_components.cronostar.coordinator",
+    "custom_components.cronostar.config_flow",
+]
+DEFAULT_RUNS = 5
+
+# Modules only needed by optional or admin features, or by the global setup run from
+# async_setup; none may load while importing the entry path
+DEFERRED_MODULES = [
+    "numpy",
+    "yaml",
+    "sqlite3",
+    "cProfile",
+    "pstats",
+    "custom_components.cronostar.setup",
+    "custom_components.cronostar.services.forecast_service",
+    "custom_components.cronostar.storage.sqlite_store",
+    "custom_components.cronostar.utils.bulk_evaluator",
+    "custom_components.cronostar.utils.profiler",
+]
+
+# Executed in the child interpreter: argv[1] is the module to import
+_CHILD = """
+import importlib, importlib.abc, importlib.util, json, sys, time
+sys.path.insert(0, {root!r})
+
+class _Block(importlib.abc.MetaPathFinder):
+    def find_spec(self, name, path=None, target=None):
+        if name.startswith("custom_components.cronostar"):
+            raise ImportError(name)
+
+# The stubs import the integration to patch it; keep it unloaded until the timed import
+blocker = _Block()
+sys.meta_path.insert(0, blocker)
+spec = importlib.util.spec_from_file_location("cronostar_bench_conftest", {conftest!r})
+stubs = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = stubs
+spec.loader.exec_module(stubs)
+sys.meta_path.remove(blocker)
+
+before = set(sys.modules)
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+elapsed = (time.perf_counter() - start) * 1000
+loaded = sorted(set(sys.modules) - before)
+print(json.dumps({{"ms": elapsed, "loaded": loaded}}))
+"""
+
+
+def measure(module: str) -> dict:
+    """
+    Import a module once in a fresh interpreter
+
+    Args:
+        module: Dotted module name
+
+    Returns:
+        {"ms": import time, "loaded": modules newly imported}
+    """
+    code = _CHILD.format(root=str(REPO_ROOT), conftest=str(REPO_ROOT / "tests" / "conftest.py"))
+    proc = subprocess.run([sys.executable, "-c", code, module], capture_output=True, text=True, check=True, cwd=REPO_ROOT)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def run_module(module: str, runs: int) -> dict:
+    """
+    Time `runs` cold imports of a module
+
+    Args:
+        module: Dotted module name
+        runs: Number of fresh interpreters
+
+    Returns:
+        Timing summary, integration module count and the deferred modules that were loaded
+    """
+    samples = [measure(module) for _ in range(runs)]
+    times = sorted(sample["ms"] for sample in samples)
+    loaded = samples[-1]["loaded"]
+    return {
+        "count": runs,
+        "median_ms": round(statistics.median(times), 3),
+        "min_ms": round(times[0], 3),
+        "max_ms": round(times[-1], 3),
+        "integration_modules": sum(1 for name in loaded if name.startswith("custom_components.cronostar")),
+        "deferred_loaded": [name for name in DEFERRED_MODULES if name in loaded],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="CronoStar import-time benchmark")
+    parser.add_argument("--module", dest="modules", action="append", help="Module to import (repeatable, default: entry modules)")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="Fresh interpreters per module")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    modules = {module: run_module(module, args.runs) for module in args.modules or DEFAULT_MODULES}
+    report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "modules": modules,
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output, "utf-8")
+    else:
+        print(output)
+
+    eager = [f"{module}: {', '.join(result['deferred_loaded'])}" for module, result in modules.items() if result["deferred_loaded"]]
+    for line in eager:
+        print(f"EAGER IMPORT: {line}", file=sys.stderr)
+    return 1 if eager else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
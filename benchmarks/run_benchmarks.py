@@ -0,0 +1,214 @@
+"""
+CronoStar benchmark suite
+Times StorageManager, ProfileService and the coordinator against synthetic installations
+
+Usage:
+    python benchmarks/run_benchmarks.py                      # 10/100/1000 controllers
+    python benchmarks/run_benchmarks.py --sizes 10 100 --output results.json
+    python benchmarks/run_benchmarks.py --baseline results.json --threshold 1.5
+
+Results are written as JSON (milliseconds). With --baseline, the run exits with
+status 1 when any scenario is slower than baseline * threshold.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from harness import PROFILE_NAMES, generate_controllers, make_call, make_hass
+
+from custom_components.cronostar.const import DOMAIN
+from custom_components.cronostar.coordinator import CronoStarCoordinator
+from custom_components.cronostar.setup import _preload_profile_cache
+from custom_components.cronostar.setup.dashboard import write_dashboard_yaml
+from custom_components.cronostar.setup.services import setup_services
+from custom_components.cronostar.storage.settings_manager import SettingsManager
+from custom_components.cronostar.storage.storage_manager import StorageManager
+
+DEFAULT_SIZES = [10, 100, 1000]
+DEFAULT_THRESHOLD = 1.5
+# Timings below this floor are too noisy to flag as regressions
+NOISE_FLOOR_MS = 5.0
+REGISTER_CARD_SAMPLES = 50
+SAVE_BURST = 20
+
+
+class Timer:
+    """Collects per-sample durations for one scenario"""
+
+    def __init__(self):
+        self.samples: list[float] = []
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.samples.append((time.perf_counter() - self._start) * 1000)
+
+    def summary(self) -> dict:
+        ordered = sorted(self.samples)
+        return {
+            "count": len(ordered),
+            "total_ms": round(sum(ordered), 3),
+            "median_ms": round(statistics.median(ordered), 3),
+            "p95_ms": round(ordered[max(0, int(len(ordered) * 0.95 + 0.5) - 1)], 3),
+            "max_ms": round(ordered[-1], 3),
+        }
+
+
+async def run_size(count: int, workdir: Path) -> dict:
+    """
+    Run every scenario against `count` synthetic controllers
+
+    Args:
+        count: Number of controllers
+        workdir: Empty directory used as /config
+
+    Returns:
+        Scenario name -> timing summary
+    """
+    hass = make_hass(workdir)
+    entries = generate_controllers(hass, count)
+    results = {}
+
+    # Startup warm-up: storage construction and cache preload
+    warmup = Timer()
+    with warmup:
+        storage = StorageManager(hass, hass.config.path("cronostar/profiles"))
+        settings = SettingsManager(hass, hass.config.path("cronostar"))
+        hass.data[DOMAIN].update({"storage_manager": storage, "settings_manager": settings})
+        await _preload_profile_cache(hass, storage)
+    results["startup_warmup"] = warmup.summary()
+
+    await setup_services(hass, storage)
+    services = hass.bench_services
+    profile_service = hass.data[DOMAIN]["profile_service"]
+
+    # One full coordinator tick across all controllers (cache warm)
+    coordinators = []
+    for entry in entries:
+        entry.runtime_data = CronoStarCoordinator(hass, entry)
+        coordinators.append(entry.runtime_data)
+    tick = Timer()
+    with tick:
+        for coordinator in coordinators:
+            await coordinator._async_update_data()
+    results["coordinator_tick"] = tick.summary()
+
+    # register_card on a sample of controllers
+    register = Timer()
+    for entry in entries[:REGISTER_CARD_SAMPLES]:
+        call = make_call({"card_id": entry.entry_id, "preset": entry.data["preset_type"], "global_prefix": entry.data["global_prefix"]})
+        with register:
+            await profile_service.register_card(call)
+    results["register_card"] = register.summary()
+
+    # list_all_profiles, cached and forced reload
+    list_all = services[(DOMAIN, "list_all_profiles")]
+    for name, force in (("list_all_profiles", False), ("list_all_profiles_reload", True)):
+        timer = Timer()
+        with timer:
+            await list_all(make_call({"force_reload": force}))
+        results[name] = timer.summary()
+
+    # save_profile burst on a single controller
+    first = entries[0].data
+    save = Timer()
+    for idx in range(SAVE_BURST):
+        call = make_call({
+            "profile_name": PROFILE_NAMES[idx % len(PROFILE_NAMES)],
+            "preset_type": first["preset_type"],
+            "global_prefix": first["global_prefix"],
+            "schedule": [{"time": "00:00", "value": float(idx)}, {"time": "12:00", "value": float(idx + 1)}],
+            "meta": {"target_entity": first["target_entity"]},
+        })
+        with save:
+            await profile_service.save_profile(call)
+    results["save_profile_burst"] = save.summary()
+
+    # Dashboard regeneration
+    dashboard = Timer()
+    with dashboard:
+        await write_dashboard_yaml(hass, "cronostar_dashboard_bench.yaml")
+    results["dashboard_regeneration"] = dashboard.summary()
+
+    await storage.async_close()
+    return results
+
+
+def check_regressions(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Compare total times against a previous results file
+
+    Args:
+        results: Current results ("sizes" section)
+        baseline: Baseline results ("sizes" section)
+        threshold: Allowed slowdown factor
+
+    Returns:
+        List of human-readable regression descriptions
+    """
+    regressions = []
+    for size, scenarios in results.items():
+        for name, summary in scenarios.items():
+            base = baseline.get(size, {}).get(name)
+            if not base:
+                continue
+            limit = max(base["total_ms"], NOISE_FLOOR_MS) * threshold
+            if summary["total_ms"] > limit:
+                regressions.append(f"{name} @ {size} controllers: {summary['total_ms']:.1f} ms > {limit:.1f} ms (baseline {base['total_ms']:.1f} ms)")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="CronoStar benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Controller counts to benchmark")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file (default: stdout)")
+    parser.add_argument("--baseline", type=Path, help="Previous results file to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed slowdown factor vs. baseline")
+    args = parser.parse_args(argv)
+
+    # The code under test logs heavily at INFO; keep the measurements about the code
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("custom_components.cronostar").setLevel(logging.CRITICAL)
+
+    sizes = {}
+    for count in args.sizes:
+        with tempfile.TemporaryDirectory(prefix="cronostar_bench_") as tmp:
+            sizes[str(count)] = asyncio.run(run_size(count, Path(tmp)))
+
+    report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": sizes,
+    }
+
+    regressions = []
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text("utf-8"))
+        regressions = check_regressions(sizes, baseline.get("sizes", {}), args.threshold)
+        report["regressions"] = regressions
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output, "utf-8")
+    else:
+        print(output)
+
+    for line in regressions:
+        print(f"REGRESSION: {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,37 +10,60 @@ This integration provides:
 
 """
 
+import json
 import logging
+import os
 import re
-from datetime import UTC
+from datetime import UTC, datetime
 from pathlib import Path
 
 import homeassistant.helpers.config_validation as cv
 from homeassistant.components import frontend
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.loader import async_get_integration
 
 from .const import (
+    CONF_APPLY_DEADBAND,
+    CONF_DISPATCH_BURST,
+    CONF_DISPATCH_JITTER,
+    CONF_DISPATCH_RATE,
     CONF_FRONTEND_VERSION_CHECK,
     CONF_GLOBAL_PREFIX,
     CONF_LANGUAGE,
     CONF_LOGGING_ENABLED,
     CONF_NAME,
+    CONF_PRECOMPUTE_SCHEDULES,
     CONF_PRESET,
+    CONF_STORAGE_BACKEND,
+    CONF_STORAGE_JOURNAL,
     CONF_TARGET_ENTITY,
+    DEFAULT_APPLY_DEADBAND,
+    DEFAULT_DISPATCH_BURST,
+    DEFAULT_DISPATCH_JITTER,
+    DEFAULT_DISPATCH_RATE,
     DOMAIN,
+    PANEL_URL_PATH,
     PLATFORMS,
+    STORAGE_BACKEND_JSON,
     STORAGE_DIR,
 )
+from .utils.dispatch_queue import get_dispatch_queue
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 from .coordinator import CronoStarCoordinator
-from .setup import async_setup_integration
-from .setup.dashboard import PANEL_URL_PATH
 
 _LOGGER = logging.getLogger(__name__)
 
+_VERSION_TAG_RE = re.compile(r"\s*\[v?\d+\.\d+\.\d+\]")
+
+
+async def async_setup_integration(hass: HomeAssistant, config: dict) -> bool:
+    """Run the global setup (services, websocket, dashboard), importing it on first use."""
+    from .setup import async_setup_integration as setup_integration
+
+    return await setup_integration(hass, config)
+
 
 async def async_setup(hass: HomeAssistant, _config: dict) -> bool:
     """Set up CronoStar component from YAML (deprecated, kept for backward compatibility)."""
@@ -110,8 +133,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             CONF_LOGGING_ENABLED: entry.options.get(CONF_LOGGING_ENABLED, False),
             CONF_FRONTEND_VERSION_CHECK: entry.options.get(CONF_FRONTEND_VERSION_CHECK, True),
             CONF_LANGUAGE: entry.options.get(CONF_LANGUAGE, "default"),
+            CONF_STORAGE_JOURNAL: entry.options.get(CONF_STORAGE_JOURNAL, False),
+            CONF_STORAGE_BACKEND: entry.options.get(CONF_STORAGE_BACKEND, STORAGE_BACKEND_JSON),
+            CONF_PRECOMPUTE_SCHEDULES: entry.options.get(CONF_PRECOMPUTE_SCHEDULES, False),
+            CONF_DISPATCH_RATE: entry.options.get(CONF_DISPATCH_RATE, DEFAULT_DISPATCH_RATE),
+            CONF_DISPATCH_BURST: entry.options.get(CONF_DISPATCH_BURST, DEFAULT_DISPATCH_BURST),
+            CONF_DISPATCH_JITTER: entry.options.get(CONF_DISPATCH_JITTER, DEFAULT_DISPATCH_JITTER),
+            CONF_APPLY_DEADBAND: entry.options.get(CONF_APPLY_DEADBAND, DEFAULT_APPLY_DEADBAND),
         }
         hass.data[DOMAIN]["global_config"] = global_config
+
+        # Rate limits for target service calls, per integration
+        get_dispatch_queue(hass).configure(
+            global_config[CONF_DISPATCH_RATE],
+            global_config[CONF_DISPATCH_BURST],
+            global_config[CONF_DISPATCH_JITTER],
+        )
+
+        # Apply the storage backend and journal mode; when off, fold any journal left by a previous session
+        storage_manager = hass.data[DOMAIN].get("storage_manager")
+        if storage_manager is not None:
+            storage_manager.journal_enabled = global_config[CONF_STORAGE_JOURNAL]
+            await storage_manager.async_set_backend(global_config[CONF_STORAGE_BACKEND])
+            if not storage_manager.journal_enabled:
+                hass.async_create_task(storage_manager.async_compact())
         _LOGGER.info("✅ CronoStar: Global component entry set up. Config: %s", global_config)
         return True
 
@@ -125,8 +170,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Auto-update controller title (clean any legacy version tags like [v6.3.0])
     if "[" in entry.title:
-        import re
-        new_title = re.sub(r"\s*\[v?\d+\.\d+\.\d+\]", "", entry.title)
+        new_title = _VERSION_TAG_RE.sub("", entry.title)
         if entry.title != new_title:
             _LOGGER.info("Cleaning controller title: %s -> %s", entry.title, new_title)
             hass.config_entries.async_update_entry(entry, title=new_title)
@@ -143,17 +187,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Create and store coordinator in runtime_data
         _LOGGER.debug("[ENTRY_SETUP] [%s] Creating coordinator instance", entry.title)
         coordinator = CronoStarCoordinator(hass, entry)
-        
+
+        # While HA is starting, publish cached state only; the schedule is applied once for all
+        # controllers by the batched pass on EVENT_HOMEASSISTANT_STARTED (see setup/events.py)
+        coordinator.apply_deferred = hass.state != CoreState.running
+
         # ✅ MANDATORY: Initialize coordinator first (load profiles, restore state)
         _LOGGER.info("🛠️ [ENTRY_SETUP] [%s] Initializing coordinator (restoring state)...", entry.title)
         await coordinator.async_initialize()
         _LOGGER.debug("✅ [ENTRY_SETUP] [%s] Coordinator initialization complete", entry.title)
 
-        # Use standard HA pattern for first refresh
+        # Use standard HA pattern for first refresh (applies the schedule unless deferred)
         _LOGGER.info("📡 [ENTRY_SETUP] [%s] Performing first refresh...", entry.title)
         await coordinator.async_config_entry_first_refresh()
         _LOGGER.info("✅ [ENTRY_SETUP] [%s] First refresh completed successfully", entry.title)
 
+        # From now on target availability is pushed by state changes instead of polled each tick,
+        # and profile saves/deletes by the storage change bus instead of forced re-reads
+        coordinator.async_track_target()
+        coordinator.async_track_storage()
+
         # Store coordinator in ConfigEntry.runtime_data (HA 2024.4+) or fallback to hass.data
         if hasattr(entry, "runtime_data"):
             entry.runtime_data = coordinator
@@ -187,6 +240,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if entry.data.get("component_installed"):
         # Installation-only entry: remove global data and services will be handled by HA
         if DOMAIN in hass.data:
+            retry_queue = hass.data[DOMAIN].get("retry_queue")
+            if retry_queue is not None:
+                retry_queue.clear()
+            apply_summary = hass.data[DOMAIN].get("apply_log_summary")
+            if apply_summary is not None:
+                apply_summary.async_stop()
+            settings_manager = hass.data[DOMAIN].get("settings_manager")
+            if settings_manager is not None:
+                settings_manager.async_stop()
+            storage_manager = hass.data[DOMAIN].get("storage_manager")
+            if storage_manager is not None:
+                storage_manager.async_stop()
             hass.data.pop(DOMAIN)
 
         # Remove sidebar panel
@@ -200,6 +265,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return True
 
     if unloaded and not entry.data.get("component_installed"):
+        coordinator = getattr(entry, "runtime_data", None) or hass.data.get(DOMAIN, {}).get(entry.entry_id)
+        if isinstance(coordinator, CronoStarCoordinator):
+            # Cancel the armed transition callback
+            await coordinator.async_shutdown()
         if DOMAIN in hass.data and entry.entry_id in hass.data[DOMAIN]:
             hass.data[DOMAIN].pop(entry.entry_id)
 
@@ -223,9 +292,6 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     the user the option to import/restore them.
     Backup files are always preserved to allow manual recovery.
     """
-    import json
-    from datetime import datetime
-
     if entry.data.get("component_installed"):
         _LOGGER.info("🗑️ CronoStar: Global component entry removed")
         return
@@ -242,6 +308,15 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
         profiles_dir = Path(hass.config.path(STORAGE_DIR))
         filepath = profiles_dir / filename
 
+        # ── SQLite backend: materialize the container as JSON so it is preserved the same way ──
+        storage_manager = hass.data.get(DOMAIN, {}).get("storage_manager")
+        if storage_manager is not None and getattr(storage_manager, "backend", None) is not None:
+            try:
+                await storage_manager.async_export_json([filename])
+                await storage_manager.delete_controller_files(global_prefix, preset_type)
+            except Exception as e:
+                _LOGGER.error("❌ CronoStar: Failed to export profile '%s' from database: %s", filename, e)
+
         # ── Mark the profile file as deleted (preserving data for future import) ──
         try:
             def _mark_as_deleted() -> str | None:
@@ -285,9 +360,6 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
 async def _async_repair_entries(hass: HomeAssistant) -> None:
     """Scan profile files and recreate missing config entries or fix incomplete ones."""
-    import json
-    import os
-
     _LOGGER.info("🔍 [REPAIR] Starting CronoStar profile repair task...")
     profiles_dir = Path(hass.config.path(STORAGE_DIR))
     if not await hass.async_add_executor_job(profiles_dir.exists):
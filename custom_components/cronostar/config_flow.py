@@ -6,6 +6,7 @@ Provides two flows:
 """
 
 import logging
+import re
 
 import voluptuous as vol
 from homeassistant import config_entries
@@ -14,6 +15,10 @@ from homeassistant.helpers.selector import selector
 
 from .const import (
     CONF_ALLOW_MAX_VALUE,
+    CONF_APPLY_DEADBAND,
+    CONF_DISPATCH_BURST,
+    CONF_DISPATCH_JITTER,
+    CONF_DISPATCH_RATE,
     CONF_FRONTEND_VERSION_CHECK,
     CONF_GLOBAL_PREFIX,
     CONF_LANGUAGE,
@@ -21,18 +26,29 @@ from .const import (
     CONF_MAX_VALUE,
     CONF_MIN_VALUE,
     CONF_NAME,
+    CONF_PRECOMPUTE_SCHEDULES,
     CONF_PRESET,
     CONF_STEP_VALUE,
+    CONF_STORAGE_BACKEND,
+    CONF_STORAGE_JOURNAL,
     CONF_TARGET_ENTITY,
     CONF_TITLE,
     CONF_UNIT_OF_MEASUREMENT,
     CONF_Y_AXIS_LABEL,
+    DEFAULT_APPLY_DEADBAND,
+    DEFAULT_DISPATCH_BURST,
+    DEFAULT_DISPATCH_JITTER,
+    DEFAULT_DISPATCH_RATE,
     DOMAIN,
+    STORAGE_BACKEND_JSON,
+    STORAGE_BACKEND_SQLITE,
 )
 from .utils.prefix_normalizer import PRESETS_CONFIG
 
 _LOGGER = logging.getLogger(__name__)
 
+_VERSION_TAG_RE = re.compile(r"\s*\[v\d+\.\d+\.\d+\]")
+
 
 class CronoStarConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle config flow for CronoStar component and controller entries."""
@@ -318,6 +334,13 @@ class CronoStarOptionsFlow(config_entries.OptionsFlow):
             # Load current global settings
             current_logging = self._config_entry.options.get(CONF_LOGGING_ENABLED, False)
             current_language = self._config_entry.options.get(CONF_LANGUAGE, "default")
+            current_journal = self._config_entry.options.get(CONF_STORAGE_JOURNAL, False)
+            current_backend = self._config_entry.options.get(CONF_STORAGE_BACKEND, STORAGE_BACKEND_JSON)
+            current_precompute = self._config_entry.options.get(CONF_PRECOMPUTE_SCHEDULES, False)
+            current_rate = self._config_entry.options.get(CONF_DISPATCH_RATE, DEFAULT_DISPATCH_RATE)
+            current_burst = self._config_entry.options.get(CONF_DISPATCH_BURST, DEFAULT_DISPATCH_BURST)
+            current_jitter = self._config_entry.options.get(CONF_DISPATCH_JITTER, DEFAULT_DISPATCH_JITTER)
+            current_deadband = self._config_entry.options.get(CONF_APPLY_DEADBAND, DEFAULT_APPLY_DEADBAND)
 
             return self.async_show_form(
                 step_id="init",
@@ -336,6 +359,23 @@ class CronoStarOptionsFlow(config_entries.OptionsFlow):
                                 }
                             }
                         ),
+                        vol.Optional(CONF_STORAGE_JOURNAL, default=current_journal): bool,
+                        vol.Optional(CONF_STORAGE_BACKEND, default=current_backend): selector(
+                            {
+                                "select": {
+                                    "options": [
+                                        {"value": STORAGE_BACKEND_JSON, "label": "JSON files"},
+                                        {"value": STORAGE_BACKEND_SQLITE, "label": "SQLite database"},
+                                    ],
+                                    "mode": "dropdown",
+                                }
+                            }
+                        ),
+                        vol.Optional(CONF_PRECOMPUTE_SCHEDULES, default=current_precompute): bool,
+                        vol.Optional(CONF_DISPATCH_RATE, default=float(current_rate)): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                        vol.Optional(CONF_DISPATCH_BURST, default=int(current_burst)): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                        vol.Optional(CONF_DISPATCH_JITTER, default=float(current_jitter)): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                        vol.Optional(CONF_APPLY_DEADBAND, default=float(current_deadband)): vol.All(vol.Coerce(float), vol.Range(min=0)),
                     }
                 ),
                 description_placeholders={"info": "Configure global defaults for new CronoStar instances."},
@@ -350,9 +390,7 @@ class CronoStarOptionsFlow(config_entries.OptionsFlow):
 
         # Schema with current values (Wizard Style Step 1)
         current_name = self._config_entry.data.get(CONF_NAME, self._config_entry.title)
-        import re
-
-        current_name = re.sub(r"\s*\[v\d+\.\d+\.\d+\]", "", current_name)
+        current_name = _VERSION_TAG_RE.sub("", current_name)
         if current_name.startswith("CronoStar: "):
             current_name = current_name[len("CronoStar: ") :]
 
@@ -447,9 +485,7 @@ class CronoStarOptionsFlow(config_entries.OptionsFlow):
 
             # Use name from options_data to build title
             new_name = self._options_data.get(CONF_NAME, self._config_entry.title)
-            import re
-
-            clean_name = re.sub(r"\s*\[v\d+\.\d+\.\d+\]", "", new_name)
+            clean_name = _VERSION_TAG_RE.sub("", new_name)
             if clean_name.startswith("CronoStar: "):
                 clean_name = clean_name[len("CronoStar: ") :]
 
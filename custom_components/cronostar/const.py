@@ -21,6 +21,13 @@ CONF_SCHEDULE = "schedule"
 CONF_LOGGING_ENABLED = "logging_enabled"
 CONF_LANGUAGE = "language"
 CONF_FRONTEND_VERSION_CHECK = "frontend_version_check"
+CONF_STORAGE_JOURNAL = "storage_journal"
+CONF_STORAGE_BACKEND = "storage_backend"
+CONF_PRECOMPUTE_SCHEDULES = "precompute_schedules"
+CONF_DISPATCH_RATE = "dispatch_rate"
+CONF_DISPATCH_BURST = "dispatch_burst"
+CONF_DISPATCH_JITTER = "dispatch_jitter"
+CONF_APPLY_DEADBAND = "apply_deadband"
 
 # Card configuration constants
 CONF_TITLE = "title"
@@ -42,7 +49,24 @@ SERVICE_APPLY_NOW = "apply_now"
 # Storage
 STORAGE_VERSION = 2
 STORAGE_DIR = "cronostar/profiles"
+STORAGE_BACKEND_JSON = "json"
+STORAGE_BACKEND_SQLITE = "sqlite"
+
+# Sidebar admin panel
+PANEL_URL_PATH = "cronostar-admin"
 
 # Defaults
 DEFAULT_NAME = "CronoStar Controller"
 DEFAULT_PRESET_TYPE = "thermostat"
+
+# Target service calls per second per integration (0 = unlimited), bucket size and max jitter (s)
+DEFAULT_DISPATCH_RATE = 0.0
+DEFAULT_DISPATCH_BURST = 5
+DEFAULT_DISPATCH_JITTER = 0.0
+
+# Minimum change of the (step-quantized) value before the target is called again (0 = any change)
+DEFAULT_APPLY_DEADBAND = 0.0
+
+# Forecast look-ahead in hours (default and cap)
+DEFAULT_HORIZON_HOURS = 24
+MAX_HORIZON_HOURS = 168
@@ -1,29 +1,46 @@
 """DataUpdateCoordinator for CronoStar."""
 
 import logging
+import time
+from bisect import bisect_left
 from datetime import datetime, timedelta
+from functools import partial
+from types import MappingProxyType
 
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time, async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
     CONF_ALLOW_MAX_VALUE,
+    CONF_APPLY_DEADBAND,
     CONF_FRONTEND_VERSION_CHECK,
     CONF_LOGGING_ENABLED,
     CONF_MAX_VALUE,
     CONF_MIN_VALUE,
     CONF_NAME,
+    CONF_PRECOMPUTE_SCHEDULES,
     CONF_PRESET_TYPE,
     CONF_STEP_VALUE,
     CONF_TARGET_ENTITY,
     CONF_TITLE,
     CONF_UNIT_OF_MEASUREMENT,
     CONF_Y_AXIS_LABEL,
+    DEFAULT_APPLY_DEADBAND,
     DOMAIN,
 )
+from .storage.compact_schedule import CompactSchedule
 from .storage.storage_manager import StorageManager
+from .utils.dispatch_queue import get_dispatch_queue
 from .utils.error_handler import log_operation
+from .utils.filename_builder import build_profile_filename
+from .utils.log_summary import get_apply_summary, is_global_logging_enabled
+from .utils.metrics import MetricsRegistry, get_metrics
+from .utils.prefix_normalizer import normalize_prefix, normalize_preset_type
+from .utils.retry_queue import get_retry_queue
+from .utils.schedule_table import ScheduleTable, compile_profile_table, is_stepped_preset
+from .utils.target_adapters import BoundTarget, resolve_target
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,6 +55,8 @@ class CronoStarCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=f"{DOMAIN}_{entry.entry_id}",
             update_interval=timedelta(minutes=1),
+            # Refreshes return comparable snapshots: listeners (and state writes) only fire on real changes
+            always_update=False,
         )
         self.entry = entry
 
@@ -52,6 +71,9 @@ class CronoStarCoordinator(DataUpdateCoordinator):
         # Version check preference
         self.version_check_enabled = entry.options.get(CONF_FRONTEND_VERSION_CHECK, global_config.get(CONF_FRONTEND_VERSION_CHECK, True))
 
+        # Minimum change before the target is called again (values are also quantized to step_value)
+        self.deadband = float(entry.options.get(CONF_APPLY_DEADBAND, global_config.get(CONF_APPLY_DEADBAND, DEFAULT_APPLY_DEADBAND)) or 0)
+
         if self.logging_enabled:
             _LOGGER.info("CronoStarCoordinator initialized for '%s' (entry_id: %s, logging=%s)", entry.title, entry.entry_id, self.logging_enabled)
 
@@ -94,54 +116,110 @@ class CronoStarCoordinator(DataUpdateCoordinator):
             sanitized_name = self.name.lower().replace(" ", "_").replace("-", "_")
             self.prefix = f"cronostar_{self.preset_type}_{sanitized_name}_"
 
+        # Canonical storage keys, computed once: profile lookups filter by plain string equality
+        self.canonical_preset = normalize_preset_type(self.preset_type)
+        self.canonical_prefix = normalize_prefix(self.prefix)
+        self.profile_filename = build_profile_filename(self.canonical_preset, self.canonical_prefix)
+
         if self.logging_enabled:
             _LOGGER.debug("Controller config: name=%s, preset_type=%s, target=%s, prefix=%s", self.name, self.preset_type, self.target_entity, self.prefix)
 
+        # Per-controller metrics (also aggregated in the integration-wide registry)
+        self.metrics = MetricsRegistry(parent=get_metrics(hass))
+
+        # Compiled breakpoint table: (weekdays, schedule, precompute, table) of the last profile seen
+        self._table_cache: tuple | None = None
+
+        # Set while Home Assistant is starting: refreshes only publish state until the batched
+        # startup pass (EVENT_HOMEASSISTANT_STARTED) applies the schedule
+        self.apply_deferred = False
+
+        # Point-in-time callback armed at the next breakpoint (the 1-minute poll drifts from
+        # wall-clock minutes, so a change at HH:MM could otherwise land up to a minute late)
+        self._unsub_transition: CALLBACK_TYPE | None = None
+        self._transition_due: datetime | None = None
+        # Breakpoint being applied by the transition callback, consumed by the apply lag metric
+        self._breakpoint_due: datetime | None = None
+
+        # Target availability pushed by a state listener (see async_track_target); until it is
+        # registered, each tick checks the state machine instead
+        self._unsub_target: CALLBACK_TYPE | None = None
+        self._target_available = False
+
+        # Last value the target confirmed: unchanged (quantized) values are not sent again
+        self._last_applied: float | None = None
+        # Value queued but not yet confirmed, and the value scheduled on the previous tick
+        self._applying: float | None = None
+        self._last_scheduled: float | None = None
+
+        # (entity_id, bound adapter call) of the target, resolved on first use
+        self._target_binding: tuple[str, BoundTarget | None] | None = None
+
+        # Container file last resolved for this controller, and the storage change bus
+        # listener updating profiles in memory after saves and deletes (see async_track_storage)
+        self._container_file: str | None = None
+        self._unsub_storage: CALLBACK_TYPE | None = None
+
     async def _async_update_data(self):
         """Fetch data and apply schedule - called every update_interval."""
         # Mark entities unavailable if target entity missing/unavailable
         # Quick check: if target entity not in state machine, skip apply and keep last value
-        if self.hass.states.get(self.target_entity) is None:
+        if self._unsub_target is not None:
+            if not self._target_available:
+                # Applied by the state listener as soon as the target comes back
+                return self._state_data()
+        elif self.hass.states.get(self.target_entity) is None:
             if self.logging_enabled:
                 _LOGGER.debug("Target entity '%s' not found in states; skipping update", self.target_entity)
-            return {
-                "selected_profile": self.selected_profile,
-                "is_enabled": self.is_enabled,
-                "current_value": self.current_value,
-                "available_profiles": self.available_profiles,
-                "card_config": self.card_config,
-                "integration_version": self.hass.data.get(DOMAIN, {}).get("version", "unknown"),
-                "version_check_enabled": self.version_check_enabled,
-            }
+            return self._state_data()
+        if self.apply_deferred and self.hass.state == CoreState.running:
+            # The batched startup pass missed this controller (set up after it ran, or never registered)
+            self.apply_deferred = False
+        if self.apply_deferred:
+            if self.logging_enabled:
+                _LOGGER.debug("Home Assistant still starting; deferring schedule application for '%s'", self.name)
+            # Publish the scheduled value (not the initial 0.0) without calling the target
+            await self._async_preview_value()
+            return self._state_data()
         if self.logging_enabled:
             _LOGGER.debug("Update cycle for '%s'", self.name)
 
         # Apply current schedule value
-        await self.apply_schedule()
+        with self.metrics.timer("coordinator.apply_schedule"):
+            await self.apply_schedule()
 
         # Return current state for entities
-        return {
+        return self._state_data()
+
+    def _state_data(self) -> MappingProxyType:
+        """Return an immutable snapshot of the controller state published to entities.
+
+        Values are copied, so the snapshot compares equal to the previous one exactly
+        when nothing entities show has changed.
+        """
+        return MappingProxyType({
             "selected_profile": self.selected_profile,
             "is_enabled": self.is_enabled,
             "current_value": self.current_value,
-            "available_profiles": self.available_profiles,
-            "card_config": self.card_config,
+            "available_profiles": tuple(self.available_profiles),
+            "card_config": MappingProxyType(dict(self.card_config)),
             "integration_version": self.hass.data.get(DOMAIN, {}).get("version", "unknown"),
             "version_check_enabled": self.version_check_enabled,
-        }
+        })
 
     async def async_initialize(self):
         """Initialize controller - load profiles and set initial state."""
         _LOGGER.info("🔧 [COORDINATOR] [%s] Initializing with prefix: %s", self.name, self.prefix)
         try:
             # List profile files matching this controller's prefix/preset_type
-            files = await self.storage_manager.list_profiles(preset_type=self.preset_type, prefix=self.prefix)
+            files = await self.storage_manager.list_profiles(preset_type=self.canonical_preset, prefix=self.canonical_prefix)
             _LOGGER.debug("🔍 [COORDINATOR] [%s] Found %d matching profile files", self.name, len(files))
 
             if files:
                 # Load first matching container
-                _LOGGER.info("📂 [COORDINATOR] [%s] Loading profile container: %s", self.name, files[0])
-                container = await self.storage_manager.load_profile_cached(files[0])
+                filename = self._container_file = self._container_filename(files)
+                _LOGGER.info("📂 [COORDINATOR] [%s] Loading profile container: %s", self.name, filename)
+                container = await self.storage_manager.load_profile_cached(filename)
 
                 if container and "profiles" in container:
                     # ✅ SYNC target_entity if missing in entry or coordinator but present in profile meta
@@ -187,9 +265,145 @@ class CronoStarCoordinator(DataUpdateCoordinator):
         except Exception as e:  # noqa: BLE001
             _LOGGER.error("❌ [COORDINATOR] [%s] Error during initialization: %s", self.name, e, exc_info=True)
 
-        # Apply initial schedule
-        _LOGGER.debug("📡 [COORDINATOR] [%s] Triggering initial schedule application", self.name)
-        await self.apply_schedule()
+        # No application here: the first refresh applies (or the batched startup pass, when deferred)
+
+    def _container_filename(self, files: list[str]) -> str:
+        """Pick this controller's container among matching files (its own filename first)."""
+        return self.profile_filename if self.profile_filename in files else files[0]
+
+    async def async_apply_deferred(self):
+        """Apply the schedule held back during startup and publish the resulting state."""
+        self.apply_deferred = False
+        await self._async_apply_and_publish()
+
+    async def _async_apply_and_publish(self) -> None:
+        """Apply the schedule outside the refresh cycle and publish the resulting state."""
+        with self.metrics.timer("coordinator.apply_schedule"):
+            await self.apply_schedule()
+        self.async_set_updated_data(self._state_data())
+
+    async def async_shutdown(self) -> None:
+        """Cancel the pending transition callback, retry and listeners, and stop refreshing."""
+        self._cancel_transition()
+        get_retry_queue(self.hass).discard(self.target_entity)
+        if self._unsub_target is not None:
+            self._unsub_target()
+            self._unsub_target = None
+        if self._unsub_storage is not None:
+            self._unsub_storage()
+            self._unsub_storage = None
+        await super().async_shutdown()
+
+    def async_track_storage(self) -> None:
+        """Follow profile saves and deletes through the storage manager's change bus."""
+        if self._unsub_storage is None:
+            self._unsub_storage = self.storage_manager.async_add_listener(self._async_storage_changed)
+
+    @callback
+    def _async_storage_changed(self, filename: str, container: dict | None) -> None:
+        """Update profiles from a container just written (no disk re-read) and re-apply."""
+        if filename not in (self.profile_filename, self._container_file):
+            return
+
+        if container and "profiles" in container:
+            self._sync_profiles(container)
+        elif self.logging_enabled:
+            _LOGGER.debug("Container '%s' of '%s' was deleted", filename, self.name)
+
+        self.hass.async_create_task(self._async_apply_container(container))
+
+    def _sync_profiles(self, container: dict) -> None:
+        """Take the available profiles from a container, keeping the selection valid."""
+        self.available_profiles = list(container["profiles"].keys())
+
+        # Ensure selected profile still exists
+        if self.selected_profile not in self.available_profiles:
+            if "Default" in self.available_profiles:
+                self.selected_profile = "Default"
+            elif self.available_profiles:
+                self.selected_profile = self.available_profiles[0]
+
+        if self.logging_enabled:
+            _LOGGER.info("Refreshed profiles for '%s': %s", self.name, self.available_profiles)
+
+    async def _async_apply_container(self, container: dict | None) -> None:
+        """Apply the schedule from a published container and publish the resulting state."""
+        if not self.apply_deferred and self._ready_to_apply():
+            with self.metrics.timer("coordinator.apply_schedule"):
+                await self._apply_container(container)
+        self.async_set_updated_data(self._state_data())
+
+    def async_track_target(self) -> None:
+        """Follow the target entity's availability through state change events."""
+        if self._unsub_target is not None:
+            return
+        self._target_available = self._is_available(self.hass.states.get(self.target_entity))
+        self._unsub_target = async_track_state_change_event(self.hass, [self.target_entity], self._async_target_changed)
+
+    @staticmethod
+    def _is_available(state) -> bool:
+        return state is not None and state.state not in (STATE_UNKNOWN, STATE_UNAVAILABLE)
+
+    async def _async_target_changed(self, event: Event) -> None:
+        """Apply as soon as the target becomes available; drop retries while it is gone."""
+        available = self._is_available(event.data.get("new_state"))
+        was_available = self._target_available
+        self._target_available = available
+        if available == was_available:
+            return
+
+        if not available:
+            if self.logging_enabled:
+                _LOGGER.debug("Target entity '%s' became unavailable; pausing '%s'", self.target_entity, self.name)
+            # The device may come back with any setpoint: send the value again on return
+            self._last_applied = None
+            # Nothing can be applied meanwhile; the comeback re-applies the current value
+            get_retry_queue(self.hass).discard(self.target_entity)
+            return
+
+        if self.logging_enabled:
+            _LOGGER.debug("Target entity '%s' available again; applying '%s'", self.target_entity, self.name)
+        if not self.apply_deferred:
+            await self._async_apply_and_publish()
+
+    def _schedule_transition(self, now: datetime, next_change: tuple[str, int] | None) -> None:
+        """Arm a point-in-time callback at the exact minute boundary of the next change."""
+        if next_change is None:
+            self._cancel_transition()
+            return
+
+        # Naive local wall-clock time, as used by the schedule, made aware for the event helper
+        due = (now.replace(second=0, microsecond=0) + timedelta(minutes=next_change[1])).astimezone()
+        if due == self._transition_due:
+            return
+        self._cancel_transition()
+        self._transition_due = due
+        self._unsub_transition = async_track_point_in_time(self.hass, self._async_handle_transition, due)
+        if self.logging_enabled:
+            _LOGGER.debug("Next transition for '%s' armed at %s", self.name, due.isoformat())
+
+    def _cancel_transition(self) -> None:
+        """Cancel the pending transition callback, if any."""
+        if self._unsub_transition is not None:
+            self._unsub_transition()
+        self._unsub_transition = None
+        self._transition_due = None
+
+    async def _async_handle_transition(self, _fired_at: datetime) -> None:
+        """Apply the schedule at a breakpoint and publish the new state."""
+        due = self._transition_due
+        self._unsub_transition = None
+        self._transition_due = None
+        if self.apply_deferred:
+            return
+
+        self._breakpoint_due = due
+        try:
+            with self.metrics.timer("coordinator.apply_schedule"):
+                await self.apply_schedule()
+        finally:
+            self._breakpoint_due = None
+        self.async_set_updated_data(self._state_data())
 
     async def async_refresh_profiles(self):
         """Refresh available profiles list (called after profile changes)."""
@@ -197,24 +411,14 @@ class CronoStarCoordinator(DataUpdateCoordinator):
             _LOGGER.debug("Refreshing profiles for '%s'", self.name)
 
         try:
-            files = await self.storage_manager.list_profiles(preset_type=self.preset_type, prefix=self.prefix)
+            files = await self.storage_manager.list_profiles(preset_type=self.canonical_preset, prefix=self.canonical_prefix)
 
             if files:
                 # Force reload from disk
-                container = await self.storage_manager.load_profile_cached(files[0], force_reload=True)
+                container = await self.storage_manager.load_profile_cached(self._container_filename(files), force_reload=True)
 
                 if container and "profiles" in container:
-                    self.available_profiles = list(container["profiles"].keys())
-
-                    # Ensure selected profile still exists
-                    if self.selected_profile not in self.available_profiles:
-                        if "Default" in self.available_profiles:
-                            self.selected_profile = "Default"
-                        elif self.available_profiles:
-                            self.selected_profile = self.available_profiles[0]
-
-                    if self.logging_enabled:
-                        _LOGGER.info("Refreshed profiles for '%s': %s", self.name, self.available_profiles)
+                    self._sync_profiles(container)
 
         except Exception as e:  # noqa: BLE001
             _LOGGER.warning("Error during initialization of '%s': %s", self.name, e)
@@ -246,6 +450,8 @@ class CronoStarCoordinator(DataUpdateCoordinator):
             _LOGGER.info("Setting enabled=%s for '%s'", enabled, self.name)
 
         self.is_enabled = enabled
+        # Re-enabling re-applies the current value even if it did not change
+        self._last_applied = None
 
         # Persist enabled state to metadata
         await self.storage_manager.update_enabled_state(self.preset_type, self.prefix, self.is_enabled)
@@ -254,153 +460,341 @@ class CronoStarCoordinator(DataUpdateCoordinator):
 
     async def apply_schedule(self):
         """Calculate and apply the current scheduled value to target entity."""
+        if not self._ready_to_apply():
+            return
+
+        # Load current profile's container
+        try:
+            container = await self._load_container()
+        except Exception as e:  # noqa: BLE001
+            _LOGGER.error("Error loading schedule for '%s': %s", self.name, e)
+            return
+
+        await self._apply_container(container)
+
+    async def _load_container(self) -> dict | None:
+        """Return this controller's profile container (served from the storage cache)."""
+        files = await self.storage_manager.list_profiles(preset_type=self.canonical_preset, prefix=self.canonical_prefix)
+        if not files:
+            return None
+        self._container_file = self._container_filename(files)
+        return await self.storage_manager.load_profile_cached(self._container_file)
+
+    async def _async_preview_value(self) -> None:
+        """Set current_value from the cached schedule without calling the target."""
+        try:
+            schedule, table = self._profile_schedule(await self._load_container())
+        except Exception as e:  # noqa: BLE001
+            _LOGGER.error("Error loading schedule for '%s': %s", self.name, e)
+            return
+
+        value = self._value_at(schedule, table, datetime.now())
+        if value is not None:
+            self.current_value = self._quantize(value)
+
+    def _ready_to_apply(self) -> bool:
+        """Whether the controller is enabled and its target can take a service call."""
         if not self.is_enabled:
             if self.logging_enabled:
                 _LOGGER.debug("Controller '%s' is disabled, skipping schedule application", self.name)
-            return
+            self._cancel_transition()
+            return False
 
         # If target entity is unknown/unavailable, do not try to call services
-        state = self.hass.states.get(self.target_entity)
-        if state is None or state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            if self.logging_enabled:
-                _LOGGER.debug("Target entity '%s' is %s; skipping service call", self.target_entity, state and state.state)
-            return
+        if self._unsub_target is not None:
+            if not self._target_available:
+                if self.logging_enabled:
+                    _LOGGER.debug("Target entity '%s' is unavailable; skipping service call", self.target_entity)
+                return False
+        else:
+            state = self.hass.states.get(self.target_entity)
+            if state is None or state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+                if self.logging_enabled:
+                    _LOGGER.debug("Target entity '%s' is %s; skipping service call", self.target_entity, state and state.state)
+                return False
+        return True
 
-        # Load current profile's schedule
+    def _profile_schedule(self, container: dict | None) -> tuple[list, ScheduleTable | None]:
+        """Return the selected profile's schedule and compiled table, syncing available profiles."""
         schedule = []
-        try:
-            files = await self.storage_manager.list_profiles(preset_type=self.preset_type, prefix=self.prefix)
+        table = None
+        if container and "profiles" in container:
+            # Sync available profiles if they changed on disk
+            new_profiles = list(container["profiles"].keys())
+            if set(new_profiles) != set(self.available_profiles):
+                self.available_profiles = new_profiles
+                if self.logging_enabled:
+                    _LOGGER.info("Available profiles for '%s' synchronized from filesystem: %s", self.name, self.available_profiles)
 
-            if files:
-                container = await self.storage_manager.load_profile_cached(files[0])
+            profile_data = container["profiles"].get(self.selected_profile)
 
-                if container and "profiles" in container:
-                    # Sync available profiles if they changed on disk
-                    new_profiles = list(container["profiles"].keys())
-                    if set(new_profiles) != set(self.available_profiles):
-                        self.available_profiles = new_profiles
-                        if self.logging_enabled:
-                            _LOGGER.info("Available profiles for '%s' synchronized from filesystem: %s", self.name, self.available_profiles)
-
-                    profile_data = container["profiles"].get(self.selected_profile)
-
-                    if profile_data:
-                        schedule = profile_data.get("schedule", [])
-
-                        if self.logging_enabled:
-                            _LOGGER.debug("Loaded schedule for '%s' / '%s': %d points", self.name, self.selected_profile, len(schedule))
-                    else:
-                        if self.logging_enabled:
-                            _LOGGER.warning("Profile '%s' not found in container for '%s'", self.selected_profile, self.name)
+            if profile_data:
+                schedule = profile_data.get("schedule", [])
+                table = self._get_schedule_table(profile_data)
+
+                if self.logging_enabled:
+                    _LOGGER.debug("Loaded schedule for '%s' / '%s': %d points", self.name, self.selected_profile, len(schedule))
+            else:
+                if self.logging_enabled:
+                    _LOGGER.warning("Profile '%s' not found in container for '%s'", self.selected_profile, self.name)
+        return schedule, table
+
+    def _value_at(self, schedule, table: ScheduleTable | None, now: datetime) -> float | None:
+        """Interpolate the value at now (weekly and precomputed profiles use their compiled table)."""
+        if table is not None:
+            return table.value_at(table.minute_of(now), stepped=self._is_stepped())
+        return self._interpolate_schedule(schedule, now)
+
+    async def _apply_container(self, container: dict | None) -> None:
+        """Apply the current scheduled value from an already loaded profile container."""
+        try:
+            schedule, table = self._profile_schedule(container)
         except Exception as e:  # noqa: BLE001
             _LOGGER.error("Error loading schedule for '%s': %s", self.name, e)
             return
 
-        # Interpolate current value
-        value = self._interpolate_schedule(schedule)
+        now = datetime.now()
+        value = self._value_at(schedule, table, now)
 
         if value is not None:
-            self.current_value = value
-
             # Compute next change time based on current schedule and value
-            next_change = self._get_next_change(schedule, value)
+            if table is not None:
+                next_change = table.next_change(table.minute_of(now), value)
+            else:
+                next_change = self._get_next_change(schedule, value, now)
+            self._schedule_transition(now, next_change)
 
-            await self._update_target_entity(value, next_change)
+            value = self._quantize(value)
+            self.current_value = value
+            if self._needs_apply(value, self._at_breakpoint(table, schedule, now)):
+                await self._update_target_entity(value, next_change)
+            else:
+                self.metrics.increment("coordinator.apply_skipped")
+                if self.logging_enabled:
+                    _LOGGER.debug("Value %s for '%s' already sent or within deadband of %s; not sent", value, self.name, self._last_applied)
         else:
+            self._cancel_transition()
             if self.logging_enabled:
                 _LOGGER.debug("No value interpolated for '%s', schedule may be empty", self.name)
 
     async def _update_target_entity(self, value: float, next_change: tuple[str, int] | None = None):
-        """Update the target entity with the scheduled value."""
-        entity_id = self.target_entity
-        domain = entity_id.split(".")[0]
-        success = False
-        service_called = "none"
+        """Queue the scheduled value for the target entity (the tick does not wait for the call)."""
+        target = self._target()
+        if target is None:
+            if self.logging_enabled:
+                _LOGGER.warning("Unsupported domain '%s' for target entity '%s'", self.target_entity.split(".")[0], self.target_entity)
+            return
+
+        domain, service, data = target(value)
+        # Rate limited per integration (a passthrough unless configured), drained in the background
+        done = partial(self._async_target_applied, target, value, f"{domain}.{service}", next_change, self._breakpoint_due)
+        self._breakpoint_due = None
+        get_dispatch_queue(self.hass).async_enqueue(target.entity_id, domain, service, data, done)
+        self._applying = value
+
+    @callback
+    def _async_target_applied(
+        self,
+        target: BoundTarget,
+        value: float,
+        service_called: str,
+        next_change: tuple[str, int] | None,
+        breakpoint_due: datetime | None,
+        error: Exception | None,
+    ) -> None:
+        """Record the outcome of a queued target service call."""
+        entity_id = target.entity_id
+        retries = get_retry_queue(self.hass)
+        if self._applying == value:
+            self._applying = None
+
+        if error is not None:
+            _LOGGER.error("Failed to update target entity '%s': %s", entity_id, error)
+            if self.logging_enabled:
+                log_operation("Apply scheduled value", False, name=self.name, entity=entity_id, error=str(error))
+            # Re-attempted in the background with backoff
+            retries.add(entity_id, value, partial(self._async_reapply, value))
+            return
+
+        # Applied: a pending retry of an older value is superseded
+        self._last_applied = value
+        retries.discard(entity_id)
+
+        if breakpoint_due is not None:
+            # Delay between the breakpoint and the service call it triggered
+            self.metrics.observe("coordinator.apply_lag", max(0.0, time.time() - breakpoint_due.timestamp()) * 1000)
+
+        if not (self.logging_enabled or is_global_logging_enabled(self.hass)):
+            # Quiet mode: one aggregated line per interval across all controllers
+            get_apply_summary(self.hass, _LOGGER).record(entity_id, value, self.selected_profile, service_called)
+            return
+
+        status = ("ON" if value > 0 else "OFF") if target.binary else str(value)
+
+        # Detailed logging enabled: log every application at INFO level
+        _LOGGER.info(
+            "🔷 [COORDINATOR] Applied '%s' to '%s' (Profile: %s, Status: %s, Service: %s)",
+            value,
+            entity_id,
+            self.selected_profile,
+            status,
+            service_called,
+        )
+
+        # Highlighted log line with profile and next scheduled change
+        if next_change:
+            next_time_str, minutes_until = next_change
+            _LOGGER.info(
+                "🔶⏱️ Next scheduled change for profile '%s' on %s at %s (in %d min)", self.selected_profile, entity_id, next_time_str, minutes_until
+            )
+        else:
+            _LOGGER.info("🔶⏱️ No further changes scheduled for profile '%s' on %s", self.selected_profile, entity_id)
+
+        log_operation(
+            "Apply scheduled value",
+            True,
+            name=self.name,
+            entity=entity_id,
+            value=value,
+            service=service_called,
+            profile=self.selected_profile,
+        )
+
+    async def _async_reapply(self, value: float) -> None:
+        """Re-apply a value from the retry queue, recording it once the target accepted it."""
+        if await self._call_target_service(value):
+            self._last_applied = value
 
+    async def _call_target_service(self, value: float) -> str | None:
+        """Call the service applying a value to the target entity.
+
+        Returns:
+            The service called, or None when the target domain is unsupported
+        """
+        target = self._target()
+        if target is None:
+            return None
+        domain, service, data = target(value)
+        # Rate limited per integration (a no-op passthrough unless configured)
+        await get_dispatch_queue(self.hass).async_call(target.entity_id, domain, service, data)
+        return f"{domain}.{service}"
+
+    def _target(self) -> BoundTarget | None:
+        """Return the target's bound adapter call, resolved once per target entity."""
+        binding = self._target_binding
+        if binding is None or binding[0] != self.target_entity:
+            binding = self._target_binding = (self.target_entity, resolve_target(self.target_entity))
+        return binding[1]
+
+    def _quantize(self, value: float) -> float:
+        """Round a value to the controller's step_value (on/off targets are left untouched)."""
+        step = self.card_config.get(CONF_STEP_VALUE)
+        target = self._target()
+        if not step or (target is not None and target.binary):
+            return value
         try:
-            if domain == "climate":
-                service_called = "climate.set_temperature"
-                await self.hass.services.async_call("climate", "set_temperature", {"entity_id": entity_id, "temperature": value}, blocking=False)
-                success = True
-            elif domain in ["switch", "light", "fan"]:
-                service = "turn_on" if value > 0 else "turn_off"
-                service_called = f"{domain}.{service}"
-                await self.hass.services.async_call(domain, service, {"entity_id": entity_id}, blocking=False)
-                success = True
-            elif domain == "input_number":
-                service_called = "input_number.set_value"
-                await self.hass.services.async_call("input_number", "set_value", {"entity_id": entity_id, "value": value}, blocking=False)
-                success = True
-            elif domain == "cover":
-                service_called = "cover.set_cover_position"
-                await self.hass.services.async_call("cover", "set_cover_position", {"entity_id": entity_id, "position": int(value)}, blocking=False)
-                success = True
-            else:
-                if self.logging_enabled:
-                    _LOGGER.warning("Unsupported domain '%s' for target entity '%s'", domain, entity_id)
-
-            if success:
-                status = "ON" if (domain in ["switch", "light", "fan"] and value > 0) else "OFF" if (domain in ["switch", "light", "fan"]) else str(value)
-
-                # Always log the application if it was successful, using INFO level
-                _LOGGER.info(
-                    "🔷 [COORDINATOR] Applied '%s' to '%s' (Profile: %s, Status: %s, Service: %s)",
-                    value,
-                    entity_id,
-                    self.selected_profile,
-                    status,
-                    service_called,
-                )
-
-                # Highlighted log line with profile and next scheduled change
-                if next_change:
-                    next_time_str, minutes_until = next_change
-                    _LOGGER.info(
-                        "🔶⏱️ Next scheduled change for profile '%s' on %s at %s (in %d min)", self.selected_profile, entity_id, next_time_str, minutes_until
-                    )
-                else:
-                    _LOGGER.info("🔶⏱️ No further changes scheduled for profile '%s' on %s", self.selected_profile, entity_id)
-
-                log_operation(
-                    "Apply scheduled value",
-                    True,
-                    name=self.name,
-                    entity=entity_id,
-                    value=value,
-                    service=service_called,
-                    profile=self.selected_profile,
-                )
+            step = float(step)
+        except (TypeError, ValueError):
+            return value
+        if step <= 0:
+            return value
+        # Keep the step's decimals so 0.1 steps do not produce 20.300000000000001
+        decimals = len(f"{step:g}".partition(".")[2])
+        return round(round(value / step) * step, decimals)
+
+    def _needs_apply(self, value: float, at_breakpoint: bool = False) -> bool:
+        """Return True when the value must be sent to the target.
+
+        Values already confirmed, in flight or waiting for a retry are skipped. The deadband only
+        holds back ramp steps: breakpoints, stepped presets and settled values (the same on two
+        consecutive ticks) always go out, so the target never stays off-schedule.
+        """
+        previous, self._last_scheduled = self._last_scheduled, value
+        last = self._last_applied
+        if value in (last, self._applying) or get_retry_queue(self.hass).pending_value(self.target_entity) == value:
+            return False
+        if last is None or self.deadband <= 0:
+            return True
+        if at_breakpoint or self._is_stepped() or value == previous:
+            return True
+        return abs(value - last) >= self.deadband
+
+    def _at_breakpoint(self, table: ScheduleTable | None, schedule, now: datetime) -> bool:
+        """Return True on the minute of a schedule point (or when its transition callback fired)."""
+        if self._breakpoint_due is not None:
+            return True
+        if table is not None:
+            minute = table.minute_of(now)
+            index = bisect_left(table.minutes, minute)
+            return index < len(table.minutes) and table.minutes[index] == minute
+        if isinstance(schedule, CompactSchedule):
+            minute = now.hour * 60 + now.minute
+            return any(point == minute for point, _ in schedule.as_tuples())
+        return any(item.get("time") == f"{now.hour:02d}:{now.minute:02d}" for item in schedule)
+
+    def _is_stepped(self) -> bool:
+        """Return True for presets that hold values instead of ramping between points."""
+        return is_stepped_preset(self.preset_type)
+
+    def _get_schedule_table(self, profile_data: dict) -> ScheduleTable | None:
+        """Return the compiled table for a profile, reusing it while the cached profile is unchanged.
+
+        Only weekly profiles need a table, unless the precompute option asks for a per-minute
+        value array (built once per profile load, then every tick is a single index).
+        """
+        weekdays = profile_data.get("weekdays")
+        precompute = bool(self.hass.data.get(DOMAIN, {}).get("global_config", {}).get(CONF_PRECOMPUTE_SCHEDULES, False))
+        if not weekdays and not precompute:
+            return None
 
-        except Exception as e:  # noqa: BLE001
-            _LOGGER.error("Failed to update target entity '%s': %s", entity_id, e)
-            if self.logging_enabled:
-                log_operation("Apply scheduled value", False, name=self.name, entity=entity_id, error=str(e))
+        schedule = profile_data.get("schedule")
+        cached = self._table_cache
+        if cached is not None and cached[0] is weekdays and cached[1] is schedule and cached[2] == precompute:
+            return cached[3]
 
-    def _interpolate_schedule(self, schedule: list) -> float | None:
+        table = compile_profile_table(profile_data)
+        if precompute:
+            table.precompute(stepped=self._is_stepped())
+        self._table_cache = (weekdays, schedule, precompute, table)
+        if self.logging_enabled:
+            _LOGGER.debug(
+                "Compiled schedule for '%s' / '%s': %d breakpoints over %d minutes (precomputed=%s)",
+                self.name,
+                self.selected_profile,
+                len(table),
+                table.period,
+                precompute,
+            )
+        return table
+
+    def _interpolate_schedule(self, schedule: list, now: datetime | None = None) -> float | None:
         """Interpolate schedule value for current time."""
         if not schedule:
             return None
 
-        now = datetime.now()
+        now = now or datetime.now()
         current_minutes = now.hour * 60 + now.minute
 
-        # Parse schedule into (minutes, value) tuples
-        points = []
-        for item in schedule:
-            time_str = item.get("time")
-            value = item.get("value")
+        # Parse schedule into (minutes, value) tuples (cached schedules are already packed)
+        if isinstance(schedule, CompactSchedule):
+            points = schedule.as_tuples()
+        else:
+            points = []
+            for item in schedule:
+                time_str = item.get("time")
+                value = item.get("value")
 
-            if not time_str or value is None:
-                continue
+                if not time_str or value is None:
+                    continue
 
-            try:
-                hours, minutes = map(int, time_str.split(":"))
-                total_minutes = hours * 60 + minutes
-                points.append((total_minutes, float(value)))
-            except (ValueError, AttributeError) as e:
-                if self.logging_enabled:
-                    _LOGGER.warning("Invalid schedule point in '%s': %s - %s", self.name, item, e)
-                continue
+                try:
+                    hours, minutes = map(int, time_str.split(":"))
+                    total_minutes = hours * 60 + minutes
+                    points.append((total_minutes, float(value)))
+                except (ValueError, AttributeError) as e:
+                    if self.logging_enabled:
+                        _LOGGER.warning("Invalid schedule point in '%s': %s - %s", self.name, item, e)
+                    continue
 
         if not points:
             return None
@@ -429,8 +823,8 @@ class CronoStarCoordinator(DataUpdateCoordinator):
         if prev_point[0] == current_minutes:
             return prev_point[1]
 
-        # For generic_switch presets, use stepped value (no interpolation)
-        if str(self.preset_type).lower() == "generic_switch":
+        # For stepped presets (generic_switch), hold the value (no interpolation)
+        if is_stepped_preset(self.preset_type):
             return prev_point[1]
 
         # Linear interpolation for continuous presets
@@ -459,28 +853,31 @@ class CronoStarCoordinator(DataUpdateCoordinator):
         minutes = total_minutes % 60
         return f"{hours:02d}:{minutes:02d}"
 
-    def _get_next_change(self, schedule: list, current_value: float) -> tuple[str, int] | None:
+    def _get_next_change(self, schedule: list, current_value: float, now: datetime | None = None) -> tuple[str, int] | None:
         """Return next change time (HH:MM) and minutes until it occurs, or None if no change.
 
         A change is defined as the next schedule point whose value differs from the current interpolated value.
         """
         try:
-            now = datetime.now()
+            now = now or datetime.now()
             current_minutes = now.hour * 60 + now.minute
 
             # Parse and sort points
-            points: list[tuple[int, float]] = []
-            for item in schedule:
-                time_str = item.get("time")
-                value = item.get("value")
-                if not time_str or value is None:
-                    continue
-                try:
-                    hours, minutes = map(int, time_str.split(":"))
-                    total = hours * 60 + minutes
-                    points.append((total, float(value)))
-                except Exception:  # noqa: BLE001
-                    continue
+            if isinstance(schedule, CompactSchedule):
+                points: list[tuple[int, float]] = schedule.as_tuples()
+            else:
+                points = []
+                for item in schedule:
+                    time_str = item.get("time")
+                    value = item.get("value")
+                    if not time_str or value is None:
+                        continue
+                    try:
+                        hours, minutes = map(int, time_str.split(":"))
+                        total = hours * 60 + minutes
+                        points.append((total, float(value)))
+                    except Exception:  # noqa: BLE001
+                        continue
 
             if not points:
                 return None
@@ -6,6 +6,8 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
+from .utils.metrics import MetricsRegistry
+from .utils.retry_queue import RetryQueue
 
 
 async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
@@ -35,12 +37,25 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigE
     if coordinator:
         data["controller_state"] = {
             "name": coordinator.name,
-            "preset": coordinator.preset,
+            "preset": getattr(coordinator, "preset_type", None),
             "target_entity": coordinator.target_entity,
             "selected_profile": coordinator.selected_profile,
             "is_enabled": coordinator.is_enabled,
             "current_value": coordinator.current_value,
             "available_profiles": coordinator.available_profiles,
         }
+        metrics = getattr(coordinator, "metrics", None)
+        if isinstance(metrics, MetricsRegistry):
+            data["controller_metrics"] = metrics.snapshot()
+
+    # Integration-wide timings and counters (storage, services, register_card)
+    global_metrics = hass.data.get(DOMAIN, {}).get("metrics")
+    if isinstance(global_metrics, MetricsRegistry):
+        data["metrics"] = global_metrics.snapshot()
+
+    # Failed target applications waiting for a background retry
+    retry_queue = hass.data.get(DOMAIN, {}).get("retry_queue")
+    if isinstance(retry_queue, RetryQueue):
+        data["pending_retries"] = retry_queue.pending_entities()
 
     return data
@@ -59,7 +59,7 @@ class CronoStarProfileSelect(CoordinatorEntity, SelectEntity):
         """Return available profile options."""
         if self.coordinator.data is None:
             return ["Default"]
-        return self.coordinator.data.get("available_profiles", ["Default"])
+        return list(self.coordinator.data.get("available_profiles", ["Default"]))
 
     @property
     def current_option(self) -> str | None:
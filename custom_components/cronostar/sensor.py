@@ -1,8 +1,10 @@
 """Sensor platform for CronoStar - Current scheduled value."""
 
 import logging
+from datetime import timedelta
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
@@ -18,6 +20,9 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Poll interval of the diagnostic metric sensors (the coordinator only notifies on state changes)
+SCAN_INTERVAL = timedelta(minutes=1)
+
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up CronoStar sensor entities from config entry."""
@@ -27,7 +32,14 @@ async def async_setup_entry(hass, entry, async_add_entities):
     else:
         coordinator = hass.data[DOMAIN][entry.entry_id]
     _LOGGER.info("[SENSOR] Setting up current value sensor for controller '%s' (prefix: %s)", coordinator.name, coordinator.prefix)
-    async_add_entities([CronoStarCurrentSensor(coordinator)])
+    async_add_entities(
+        [
+            CronoStarCurrentSensor(coordinator),
+            CronoStarApplyTimeSensor(coordinator),
+            CronoStarApplyLagSensor(coordinator),
+            CronoStarCacheHitRatioSensor(coordinator),
+        ]
+    )
 
 
 class CronoStarCurrentSensor(CoordinatorEntity, SensorEntity):
@@ -35,6 +47,22 @@ class CronoStarCurrentSensor(CoordinatorEntity, SensorEntity):
 
     _attr_has_entity_name = True
     _attr_state_class = SensorStateClass.MEASUREMENT
+    # Recorder rows keep only the value and active profile; the static/bulky attributes stay
+    # on the state for the card and are also served by the cronostar/get_controllers command
+    _unrecorded_attributes = frozenset(
+        {
+            "all_profiles",
+            "is_enabled",
+            "target_entity",
+            CONF_TITLE,
+            CONF_MIN_VALUE,
+            CONF_MAX_VALUE,
+            CONF_STEP_VALUE,
+            CONF_UNIT_OF_MEASUREMENT,
+            CONF_Y_AXIS_LABEL,
+            CONF_ALLOW_MAX_VALUE,
+        }
+    )
 
     def __init__(self, coordinator):
         """Initialize current value sensor."""
@@ -104,7 +132,7 @@ class CronoStarCurrentSensor(CoordinatorEntity, SensorEntity):
             "active_profile": self.coordinator.data.get("selected_profile"),
             "is_enabled": self.coordinator.data.get("is_enabled", True),
             "target_entity": self.coordinator.target_entity,
-            "all_profiles": self.coordinator.data.get("available_profiles", []),
+            "all_profiles": list(self.coordinator.data.get("available_profiles", [])),
         }
 
         # Merge card configuration into attributes
@@ -123,3 +151,84 @@ class CronoStarCurrentSensor(CoordinatorEntity, SensorEntity):
         letting the user see it's active.
         """
         return self.coordinator.last_update_success
+
+
+class CronoStarMetricSensor(CoordinatorEntity, SensorEntity):
+    """Base for diagnostic performance sensors (disabled by default)."""
+
+    _attr_has_entity_name = True
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    # Metrics move on every tick while the controller state rarely does: poll instead of
+    # waiting for coordinator notifications
+    _attr_should_poll = True
+
+    def __init__(self, coordinator, key: str):
+        """Initialize metric sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.prefix}{key}"
+        self._attr_translation_key = key
+        self._attr_device_info = {"identifiers": {(DOMAIN, coordinator.entry.entry_id)}}
+
+    async def async_update(self) -> None:
+        """Read metrics live from the registry (no coordinator refresh)."""
+
+
+class CronoStarApplyTimeSensor(CronoStarMetricSensor):
+    """p95 duration of the scheduled apply (update tick) for this controller."""
+
+    _attr_native_unit_of_measurement = "ms"
+    _attr_suggested_display_precision = 1
+
+    def __init__(self, coordinator):
+        """Initialize apply time sensor."""
+        super().__init__(coordinator, "apply_time_p95")
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the p95 apply time in milliseconds."""
+        return self.coordinator.metrics.percentile("coordinator.apply_schedule", 95)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the full timer statistics (count, p50, max, mean)."""
+        return self.coordinator.metrics.timer_stats("coordinator.apply_schedule") or {}
+
+
+class CronoStarApplyLagSensor(CronoStarMetricSensor):
+    """p95 delay from a schedule breakpoint to the service call applying it."""
+
+    _attr_native_unit_of_measurement = "ms"
+    _attr_suggested_display_precision = 1
+
+    def __init__(self, coordinator):
+        """Initialize apply lag sensor."""
+        super().__init__(coordinator, "apply_lag_p95")
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the p95 apply lag in milliseconds."""
+        return self.coordinator.metrics.percentile("coordinator.apply_lag", 95)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the full lag statistics (count, p50, max, mean)."""
+        return self.coordinator.metrics.timer_stats("coordinator.apply_lag") or {}
+
+
+class CronoStarCacheHitRatioSensor(CronoStarMetricSensor):
+    """Profile cache hit ratio of the shared storage manager."""
+
+    _attr_native_unit_of_measurement = "%"
+    _attr_suggested_display_precision = 0
+
+    def __init__(self, coordinator):
+        """Initialize cache hit ratio sensor."""
+        super().__init__(coordinator, "cache_hit_ratio")
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the cache hit ratio as a percentage."""
+        ratio = self.coordinator.storage_manager.metrics.ratio("storage.cache_hits", "storage.cache_misses")
+        return None if ratio is None else round(ratio * 100, 1)
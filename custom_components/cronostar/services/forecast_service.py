@@ -0,0 +1,212 @@
+# custom_components/cronostar/services/forecast_service.py
+"""
+Forecast service - upcoming and historical schedule values for many controllers at once
+Evaluates compiled schedule tables server-side in one pass over the cached containers
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+from homeassistant.exceptions import HomeAssistantError
+
+from ..const import DEFAULT_HORIZON_HOURS, DOMAIN, MAX_HORIZON_HOURS
+from ..utils.bulk_evaluator import BulkEvaluator
+from ..utils.schedule_table import compile_profile_table, is_stepped_preset
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_SAMPLES = 2016
+MAX_EVALUATIONS = 200_000
+
+
+def _norm_prefix(prefix: str) -> str:
+    return prefix if prefix.endswith("_") else f"{prefix}_"
+
+
+class ForecastService:
+    """Service answering "what will (or did) each controller schedule at these times" """
+
+    def __init__(self, hass: HomeAssistant, storage_manager):
+        """
+        Initialize ForecastService
+
+        Args:
+            hass: Home Assistant instance
+            storage_manager: StorageManager instance
+        """
+        self.hass = hass
+        self.storage = storage_manager
+
+    async def forecast(self, call: ServiceCall) -> ServiceResponse:
+        """
+        Forecast service handler
+
+        Expected data:
+            - prefixes: list of global prefixes (optional, default all controllers)
+            - horizon: hours ahead (optional, default 24)
+            - resolution: sample step in minutes (optional, transitions only when omitted)
+        """
+        return await self.async_forecast(
+            prefixes=call.data.get("prefixes"),
+            horizon_hours=call.data.get("horizon", DEFAULT_HORIZON_HOURS),
+            resolution=call.data.get("resolution"),
+        )
+
+    async def async_forecast(
+        self,
+        prefixes: list[str] | None = None,
+        horizon_hours: float = DEFAULT_HORIZON_HOURS,
+        resolution: int | None = None,
+        start: datetime | None = None,
+    ) -> dict[str, Any]:
+        """
+        Build the forecast for the selected controllers
+
+        Args:
+            prefixes: Global prefixes to include (None or empty for all)
+            horizon_hours: Look-ahead in hours (capped at MAX_HORIZON_HOURS)
+            resolution: Minutes between samples; None returns transitions only
+            start: Forecast start (defaults to the current minute)
+
+        Returns:
+            {"start", "horizon_minutes", "resolution", "controllers": [...]}
+        """
+        try:
+            horizon = int(round(max(0.0, min(float(horizon_hours), MAX_HORIZON_HOURS)) * 60))
+            step = int(resolution) if resolution else None
+        except (TypeError, ValueError) as e:
+            raise HomeAssistantError(f"Invalid forecast parameters: {e}") from e
+        if step is not None and (step < 1 or horizon // step + 1 > MAX_SAMPLES):
+            raise HomeAssistantError(f"Resolution must be at least 1 minute and yield at most {MAX_SAMPLES} samples")
+
+        start = (start or datetime.now()).replace(second=0, microsecond=0)
+        controllers = [self._forecast_controller(entry, container, start, horizon, step) for entry, container in await self._async_controllers(prefixes)]
+
+        _LOGGER.debug("[FORECAST] %d controllers, horizon=%d min, resolution=%s", len(controllers), horizon, step)
+        return {
+            "start": start.isoformat(),
+            "horizon_minutes": horizon,
+            "resolution": step,
+            "controllers": controllers,
+        }
+
+    async def evaluate(self, call: ServiceCall) -> ServiceResponse:
+        """
+        Evaluate schedules service handler
+
+        Expected data:
+            - timestamps: list of ISO 8601 timestamps
+            - prefixes: list of global prefixes (optional, default all controllers)
+        """
+        return await self.async_evaluate(call.data.get("timestamps") or [], prefixes=call.data.get("prefixes"))
+
+    async def async_evaluate(self, timestamps: list, prefixes: list[str] | None = None) -> dict[str, Any]:
+        """
+        Evaluate the active profile of every selected controller at every timestamp
+
+        Args:
+            timestamps: datetimes or ISO 8601 strings (naive values are local time)
+            prefixes: Global prefixes to include (None or empty for all)
+
+        Returns:
+            {"timestamps", "engine", "controllers": [{..., "values": [...]}]}
+        """
+        try:
+            moments = [ts if isinstance(ts, datetime) else datetime.fromisoformat(str(ts)) for ts in timestamps]
+        except ValueError as e:
+            raise HomeAssistantError(f"Invalid timestamp: {e}") from e
+
+        controllers = []
+        tables = []
+        stepped = []
+        for entry, container in await self._async_controllers(prefixes):
+            info = self._controller_info(entry, container)
+            profile_data = (container or {}).get("profiles", {}).get(info["profile"])
+            if isinstance(profile_data, dict):
+                info["row"] = len(tables)
+                tables.append(compile_profile_table(profile_data))
+                stepped.append(is_stepped_preset(info["preset_type"]))
+            else:
+                info["error"] = "Profile not found"
+            controllers.append(info)
+
+        if len(tables) * len(moments) > MAX_EVALUATIONS:
+            raise HomeAssistantError(f"Too many evaluations requested (max {MAX_EVALUATIONS} controller/timestamp pairs)")
+
+        # Large batches are CPU-bound: keep them off the event loop
+        evaluator = BulkEvaluator(tables, stepped)
+        grid = await self.hass.async_add_executor_job(evaluator.evaluate_grid, moments)
+        for info in controllers:
+            row = info.pop("row", None)
+            if row is not None:
+                info["values"] = grid[row]
+
+        return {
+            "timestamps": [moment.isoformat() for moment in moments],
+            "engine": "numpy" if evaluator.use_numpy else "bisect",
+            "controllers": controllers,
+        }
+
+    async def _async_controllers(self, prefixes: list[str] | None) -> list[tuple[Any, dict | None]]:
+        """Return (config entry, cached container) of the selected controllers"""
+        wanted = {_norm_prefix(p) for p in prefixes} if prefixes else None
+
+        # One pass over the cached containers, indexed by prefix
+        containers: dict[str, dict] = {}
+        for filename in await self.storage.list_profiles():
+            container = await self.storage.load_profile_cached(filename)
+            if not isinstance(container, dict):
+                continue
+            prefix = container.get("meta", {}).get("global_prefix")
+            if prefix:
+                containers.setdefault(_norm_prefix(prefix), container)
+
+        selected = []
+        for entry in self.hass.config_entries.async_entries(DOMAIN):
+            if entry.data.get("component_installed"):
+                continue
+            prefix = entry.data.get("global_prefix")
+            if not prefix or (wanted is not None and _norm_prefix(prefix) not in wanted):
+                continue
+            selected.append((entry, containers.get(_norm_prefix(prefix))))
+        return selected
+
+    def _controller_info(self, entry, container: dict | None) -> dict[str, Any]:
+        """Describe a controller and resolve its active profile"""
+        coordinator = getattr(entry, "runtime_data", None) or self.hass.data.get(DOMAIN, {}).get(entry.entry_id)
+        meta = container.get("meta", {}) if container else {}
+        return {
+            "entry_id": entry.entry_id,
+            "global_prefix": entry.data.get("global_prefix"),
+            "preset_type": entry.data.get("preset_type", "thermostat"),
+            "target_entity": entry.data.get("target_entity"),
+            "profile": getattr(coordinator, "selected_profile", None) or meta.get("last_active_profile") or "Default",
+            "enabled": getattr(coordinator, "is_enabled", True) is not False,
+        }
+
+    def _forecast_controller(self, entry, container: dict | None, start: datetime, horizon: int, step: int | None) -> dict[str, Any]:
+        """Evaluate one controller's active profile over the horizon"""
+        result = self._controller_info(entry, container)
+        profile_data = (container or {}).get("profiles", {}).get(result["profile"])
+        if not isinstance(profile_data, dict):
+            result["error"] = "Profile not found"
+            return result
+
+        table = compile_profile_table(profile_data)
+        stepped = is_stepped_preset(result["preset_type"])
+        minute = table.minute_of(start)
+        current = table.value_at(minute, stepped=stepped)
+
+        result["current_value"] = current
+        result["transitions"] = [
+            {"at": (start + timedelta(minutes=delta)).isoformat(), "in_minutes": delta, "value": value}
+            for delta, value in table.transitions(minute, horizon, current)
+        ]
+        if step is not None:
+            result["samples"] = [
+                {"at": (start + timedelta(minutes=offset)).isoformat(), "value": table.value_at((minute + offset) % table.period, stepped=stepped)}
+                for offset in range(0, horizon + 1, step)
+            ]
+        return result
@@ -6,6 +6,8 @@ Handles profile CRUD operations
 
 import json
 import logging
+import math
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -26,12 +28,17 @@ from ..const import (
     CONF_Y_AXIS_LABEL,
     DOMAIN,
 )
+from ..storage.compact_schedule import CompactSchedule
 from ..utils.error_handler import log_operation
 from ..utils.filename_builder import build_profile_filename
-from ..utils.prefix_normalizer import get_effective_prefix, normalize_preset_type
+from ..utils.metrics import get_metrics
+from ..utils.prefix_normalizer import PRESETS_CONFIG, get_effective_prefix, normalize_preset_type
+from ..utils.schedule_table import WEEKDAYS
 
 _LOGGER = logging.getLogger(__name__)
 
+_TIME_RE = re.compile(r"^\d{2}:\d{2}$")
+
 
 class ProfileService:
     """Service for managing CronoStar profiles"""
@@ -49,12 +56,6 @@ class ProfileService:
         self.storage = storage_manager
         self.settings = settings_manager
 
-    def _get_coordinator(self, entry):
-        """Get coordinator from entry (runtime_data) or hass.data (fallback)."""
-        if hasattr(entry, "runtime_data"):
-            return entry.runtime_data
-        return self.hass.data.get(DOMAIN, {}).get(entry.entry_id)
-
     async def add_profile(self, call: ServiceCall) -> None:
         """
         Add a new profile
@@ -86,12 +87,7 @@ class ProfileService:
                 profile_name=profile_name, preset_type=canonical_preset, profile_data=profile_data, metadata={}, global_prefix=effective_prefix
             )
 
-            # Notify coordinators to refresh available_profiles
-            for entry in self.hass.config_entries.async_entries("cronostar"):
-                if entry.data.get("global_prefix") == effective_prefix:
-                    coord = self._get_coordinator(entry)
-                    if coord:
-                        await coord.async_refresh_profiles()
+            # Coordinators pick up the new profile from the storage change bus
 
             log_operation("Add profile", True, profile=profile_name, preset=canonical_preset)
 
@@ -108,6 +104,7 @@ class ProfileService:
             - profile_name: str
             - preset_type: str
             - schedule: list (optional)
+            - weekdays: dict of weekday (mon..sun) -> schedule list (optional)
             - global_prefix: str (optional)
             - meta: dict (optional)
         """
@@ -117,6 +114,7 @@ class ProfileService:
             profile_name = call.data.get("profile_name")
             preset_type = call.data.get("preset_type", "thermostat")
             schedule = call.data.get("schedule")
+            weekdays = call.data.get("weekdays")
             global_prefix = call.data.get("global_prefix", "")
             meta = call.data.get("meta", {})
 
@@ -131,21 +129,36 @@ class ProfileService:
             metadata = self._build_metadata(canonical_preset, effective_prefix, meta)
 
             # 1. Prepare profile data
+            min_val = meta.get("min_value")
+            max_val = meta.get("max_value")
+            existing = None
+            if schedule is None or weekdays is None:
+                # Fetch existing profile data to preserve what the call does not carry
+                existing = await self.get_profile_data(profile_name, canonical_preset, effective_prefix)
+                if "error" in existing:
+                    existing = None
+
             if schedule is not None:
                 # Validate schedule
-                min_val = meta.get("min_value")
-                max_val = meta.get("max_value")
                 validated_schedule = self._validate_schedule(schedule, min_val, max_val)
                 profile_data = {"schedule": validated_schedule, "updated_at": datetime.now().isoformat()}
+            elif existing is None:
+                _LOGGER.info("Metadata update for new/missing profile '%s', using empty schedule", profile_name)
+                profile_data = {"schedule": [], "updated_at": datetime.now().isoformat()}
             else:
-                # Metadata update only: fetch existing profile data to preserve schedule
-                existing = await self.get_profile_data(profile_name, canonical_preset, effective_prefix)
-                if "error" in existing:
-                    _LOGGER.info("Metadata update for new/missing profile '%s', using empty schedule", profile_name)
-                    profile_data = {"schedule": [], "updated_at": datetime.now().isoformat()}
-                else:
-                    _LOGGER.debug("Metadata update for existing profile '%s', preserving schedule", profile_name)
-                    profile_data = {"schedule": existing.get("schedule", []), "updated_at": datetime.now().isoformat()}
+                _LOGGER.debug("Metadata update for existing profile '%s', preserving schedule", profile_name)
+                profile_data = {"schedule": existing.get("schedule", []), "updated_at": datetime.now().isoformat()}
+
+            # Optional per-weekday schedules (an empty dict clears them)
+            if weekdays is not None:
+                validated_weekdays = self._validate_weekdays(weekdays, min_val, max_val)
+            elif existing and str(existing.get("profile_name", "")).lower() == profile_name.lower():
+                # Not a Default/Comfort fallback: keep the profile's own weekday schedules
+                validated_weekdays = existing.get("weekdays")
+            else:
+                validated_weekdays = None
+            if validated_weekdays:
+                profile_data["weekdays"] = validated_weekdays
 
             _LOGGER.info(
                 "Saving profile: name=%s, preset=%s, prefix=%s, points=%d",
@@ -196,11 +209,7 @@ class ProfileService:
                         _LOGGER.info("Updating Config Entry for '%s' with new metadata", effective_prefix)
                         self.hass.config_entries.async_update_entry(entry, data=new_data)
 
-                    # Notify coordinator to refresh
-                    coord = self._get_coordinator(entry)
-                    if coord:
-                        _LOGGER.debug("Notifying coordinator for '%s' to refresh profiles", effective_prefix)
-                        await coord.async_refresh_profiles()
+                    # The coordinator already received the saved container through the storage change bus
 
             # 4. Update profile selectors (input_select entities)
             await self.async_update_profile_selectors()
@@ -364,6 +373,8 @@ class ProfileService:
                         "meta": res_meta,
                         "updated_at": content.get("updated_at"),
                     }
+                    if content.get("weekdays"):
+                        res["weekdays"] = self._validate_weekdays(content["weekdays"], min_val=meta.get("min_value"), max_val=meta.get("max_value"))
                     _LOGGER.info("[GET_PROFILE] Profile found, returning data to frontend: %s", key)
                     _LOGGER.debug("[GET_PROFILE] Found Data - Meta: %s, Profile: %s", res["meta"], res["schedule"])
                     return res
@@ -394,6 +405,8 @@ class ProfileService:
                         "meta": res_meta,
                         "updated_at": content.get("updated_at"),
                     }
+                    if content.get("weekdays"):
+                        res["weekdays"] = self._validate_weekdays(content["weekdays"], min_val=meta.get("min_value"), max_val=meta.get("max_value"))
                     _LOGGER.info("[GET_PROFILE] Default/Comfort found, returning data to frontend: %s", candidate)
                     _LOGGER.debug("[GET_PROFILE] Found Data - Meta: %s, Profile: %s", res["meta"], res["schedule"])
                     return res
@@ -451,13 +464,7 @@ class ProfileService:
             success = await self.storage.delete_profile(profile_name=profile_name, preset_type=canonical_preset, global_prefix=effective_prefix)
 
             if success:
-                # Notify coordinators to refresh available_profiles
-                for entry in self.hass.config_entries.async_entries("cronostar"):
-                    if entry.data.get("global_prefix") == effective_prefix:
-                        coord = self._get_coordinator(entry)
-                        if coord:
-                            await coord.async_refresh_profiles()
-
+                # Coordinators drop the profile through the storage change bus
                 log_operation("Delete profile", True, profile=profile_name, preset=canonical_preset)
             else:
                 log_operation("Delete profile", False, profile=profile_name, error="Not found or storage error")
@@ -542,6 +549,7 @@ class ProfileService:
         requested_profile = call.data.get("selected_profile")
 
         _LOGGER.debug("[REGISTER] Lovelace Card Connected: ID=%s, Preset=%s, Prefix=%s", card_id, preset, global_prefix)
+        phases = get_metrics(self.hass).phases("register_card")
 
         # PRESET AUTO-DETECTION: If preset is default "thermostat" but prefix is specific,
         # try to find the actual preset from storage metadata.
@@ -556,8 +564,11 @@ class ProfileService:
             except Exception as e:
                 _LOGGER.debug("[REGISTER] Preset auto-detection failed: %s", e)
 
+        phases.mark("preset_detect")
+
         # 1. Load global settings
         global_settings = await self.settings.load_settings()
+        phases.mark("settings")
 
         # Integration version and global preferences
         integration_version = self.hass.data.get(DOMAIN, {}).get("version", "unknown")
@@ -579,6 +590,7 @@ class ProfileService:
                 _LOGGER.debug("[REGISTER] Loaded preset defaults for '%s': %s", preset, preset_defaults)
         except Exception as e:
             _LOGGER.warning("[REGISTER] Error loading preset defaults for '%s': %s", preset, e)
+        phases.mark("preset_defaults")
 
         response = {
             "success": True,
@@ -669,7 +681,6 @@ class ProfileService:
                 # we only fill in MISSING fields. This prevents race conditions where
                 # HA hasn't finished updating the ConfigEntry but the JSON file is already correct.
                 if "meta" in data:
-                    from ..utils.prefix_normalizer import PRESETS_CONFIG
                     presets_defaults_internal = PRESETS_CONFIG.get(preset, {})
 
                     # If title is missing or default "Cronostar" (generic), use the preset specific title
@@ -709,6 +720,7 @@ class ProfileService:
                 _LOGGER.info("[REGISTER] No exact profile match found for prefix '%s'", global_prefix)
         except Exception as e:
             _LOGGER.error("[REGISTER] Critical error loading profile: %s", e)
+        phases.mark("profile")
 
         # 4. Perform dynamic validation for the card
         validation_errors = []
@@ -736,6 +748,7 @@ class ProfileService:
                 validation_errors.append(f"Target entity '{target_ent_check}' not found")
 
         response["validation"] = {"valid": len(validation_errors) == 0, "errors": validation_errors}
+        phases.mark("validation")
 
         # 5. Populate entity states using Entity Registry for accurate lookups
         try:
@@ -834,6 +847,8 @@ class ProfileService:
 
         except Exception as e:
             _LOGGER.debug("[REGISTER] Failed to populate entity_states: %s", e)
+        phases.mark("entity_states")
+        phases.done()
 
         _LOGGER.debug("[REGISTER] Sending response to frontend: %s", response)
         return response
@@ -907,6 +922,8 @@ class ProfileService:
         Returns:
             Validated schedule list
         """
+        if isinstance(schedule, CompactSchedule):
+            schedule = schedule.to_list()
         if not isinstance(schedule, list):
             _LOGGER.warning("Schedule is not a list, using empty schedule")
             return []
@@ -932,8 +949,6 @@ class ProfileService:
             # Validate value is numeric
             try:
                 numeric_value = float(value)
-                import math
-
                 if math.isnan(numeric_value):
                     _LOGGER.warning("Invalid value (NaN): %s", value)
                     continue
@@ -958,6 +973,35 @@ class ProfileService:
 
         return validated
 
+    def _validate_weekdays(self, weekdays: dict, min_val: float | None = None, max_val: float | None = None) -> dict:
+        """
+        Validate per-weekday schedules.
+
+        Args:
+            weekdays: Mapping of weekday (mon..sun) to raw schedule list
+            min_val: Minimum allowed value
+            max_val: Maximum allowed value
+
+        Returns:
+            Mapping of weekday to validated schedule, without unknown or empty days
+        """
+        if not isinstance(weekdays, dict):
+            _LOGGER.warning("Weekday schedules are not a mapping, ignoring them")
+            return {}
+
+        validated = {}
+        for day, schedule in weekdays.items():
+            key = str(day).lower()[:3]
+            if key not in WEEKDAYS:
+                _LOGGER.warning("Invalid weekday: %s", day)
+                continue
+            day_schedule = self._validate_schedule(schedule, min_val, max_val)
+            if day_schedule:
+                validated[key] = day_schedule
+
+        # Keep Monday..Sunday order for stable files
+        return {day: validated[day] for day in WEEKDAYS if day in validated}
+
     def _build_metadata(self, preset_type: str, global_prefix: str, user_meta: dict) -> dict:
         """
         Build metadata dictionary
@@ -998,9 +1042,7 @@ class ProfileService:
     @staticmethod
     def _is_valid_time(time_str: str) -> bool:
         """Check if time string is valid HH:MM format"""
-        import re
-
-        if not re.match(r"^\d{2}:\d{2}$", time_str):
+        if not _TIME_RE.match(time_str):
             return False
 
         try:
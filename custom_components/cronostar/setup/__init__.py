@@ -23,6 +23,8 @@ from homeassistant.loader import async_get_integration
 from ..const import DOMAIN
 from ..storage.settings_manager import SettingsManager
 from ..storage.storage_manager import StorageManager
+from ..utils.metrics import get_metrics
+from .assets import CARD_SCRIPTS, asset_url, build_asset_manifest
 from .dashboard import DASHBOARD_YAML_FILENAME, setup_dashboard
 from .panel_websocket import async_setup as setup_websocket
 from .events import setup_event_handlers
@@ -31,6 +33,8 @@ from .validators import validate_environment
 
 _LOGGER = logging.getLogger(__name__)
 
+CARD_URL_PATH = "/cronostar_card"
+
 
 async def async_setup_integration(hass: HomeAssistant, config: dict) -> bool:
     """Global component setup."""
@@ -44,8 +48,10 @@ async def async_setup_integration(hass: HomeAssistant, config: dict) -> bool:
 
     cronostar_dir = hass.config.path("cronostar")
     profiles_dir = hass.config.path("cronostar/profiles")
-    storage_manager = StorageManager(hass, profiles_dir)
+    storage_manager = StorageManager(hass, profiles_dir, metrics=get_metrics(hass))
+    storage_manager.async_start()
     settings_manager = SettingsManager(hass, cronostar_dir)
+    settings_manager.async_start()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN]["storage_manager"] = storage_manager
@@ -75,22 +81,23 @@ async def _setup_static_resources(hass: HomeAssistant) -> bool:
         if not await hass.async_add_executor_job(www_path.exists):
             return False
 
+        # Long-lived cache headers are safe: script URLs change with their content hash.
+        # Precompressed <name>.gz siblings are served to browsers accepting gzip.
         if "http" in hass.config.components:
             if HAS_STATIC_PATH_CONFIG:
-                await hass.http.async_register_static_paths([StaticPathConfig(url_path="/cronostar_card", path=www_path)])
+                await hass.http.async_register_static_paths([StaticPathConfig(url_path=CARD_URL_PATH, path=www_path, cache_headers=True)])
             else:
-                hass.http.async_register_static_path(url_path="/cronostar_card", path=str(www_path))
+                hass.http.async_register_static_path(url_path=CARD_URL_PATH, path=str(www_path), cache_headers=True)
 
         integration = await async_get_integration(hass, "cronostar")
-        version = integration.version
-        import time
-
-        boot_id = int(time.time())
+        assets = await hass.async_add_executor_job(build_asset_manifest, www_path)
+        _LOGGER.debug("CronoStar %s card assets: %s", integration.version, {name: entry["hash"] for name, entry in assets.items()})
 
         if "frontend" in hass.config.components:
-            url_params = f"v={version}&b={boot_id}"
-            add_extra_js_url(hass, f"/cronostar_card/cronostar-card.js?{url_params}")
-            add_extra_js_url(hass, f"/cronostar_card/card-picker-metadata.js?{url_params}")
+            # Only scripts confirmed by the manifest: a missing asset would 404 on every page load
+            for name in CARD_SCRIPTS:
+                if name in assets:
+                    add_extra_js_url(hass, asset_url(CARD_URL_PATH, name, assets[name]))
         return True
     except Exception as e:
         _LOGGER.error("Failed static resources: %s", e)
@@ -0,0 +1,93 @@
+# custom_components/cronostar/setup/assets.py
+"""
+Frontend asset manifest for CronoStar
+Content-hashes the card bundle and keeps precompressed gzip variants next to it
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+_LOGGER = logging.getLogger(__name__)
+
+ASSET_MANIFEST_FILENAME = "asset-manifest.json"
+
+# Scripts the card may ship; only those present in the manifest are registered
+CARD_SCRIPTS = ("cronostar-card.js", "card-picker-metadata.js")
+
+HASH_LENGTH = 16
+
+
+def build_asset_manifest(www_path: Path, names: tuple[str, ...] = CARD_SCRIPTS) -> dict[str, dict]:
+    """
+    Hash the existing assets and refresh their .gz variants (blocking)
+
+    Entries whose size and mtime match the stored manifest are reused, so an
+    unchanged bundle is neither re-hashed nor re-compressed on restart.
+
+    Args:
+        www_path: Directory served at /cronostar_card
+        names: Asset filenames to look for
+
+    Returns:
+        Asset filename -> {"hash", "size", "mtime_ns", "gzip"} for assets that exist
+    """
+    manifest_path = www_path / ASSET_MANIFEST_FILENAME
+    try:
+        previous = json.loads(manifest_path.read_text("utf-8")).get("assets", {})
+    except (OSError, ValueError, AttributeError):
+        previous = {}
+
+    assets = {}
+    for name in names:
+        path = www_path / name
+        try:
+            stat = path.stat()
+            cached = previous.get(name) or {}
+            unchanged = cached.get("size") == stat.st_size and cached.get("mtime_ns") == stat.st_mtime_ns
+            if unchanged and (not cached.get("gzip") or (www_path / cached["gzip"]).exists()):
+                assets[name] = cached
+                continue
+            data = path.read_bytes()
+        except OSError:
+            continue
+
+        assets[name] = {
+            "hash": hashlib.sha256(data).hexdigest()[:HASH_LENGTH],
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "gzip": _write_gzip(path, data),
+        }
+
+    if assets != previous:
+        try:
+            _write_atomic(manifest_path, json.dumps({"assets": assets}, indent=2).encode("utf-8"))
+        except OSError as e:
+            _LOGGER.debug("Asset manifest not written (%s); using in-memory manifest", e)
+    return assets
+
+
+def asset_url(url_path: str, name: str, entry: dict) -> str:
+    """Return the content-addressed URL of a manifest entry"""
+    return f"{url_path}/{name}?v={entry['hash']}"
+
+
+def _write_gzip(path: Path, data: bytes) -> str | None:
+    """Write the precompressed sibling served to gzip-capable browsers"""
+    gz_path = path.with_name(f"{path.name}.gz")
+    try:
+        # mtime=0 keeps the output reproducible for identical input
+        _write_atomic(gz_path, gzip.compress(data, compresslevel=9, mtime=0))
+    except OSError as e:
+        _LOGGER.debug("Precompressed %s not written: %s", gz_path.name, e)
+        return None
+    return gz_path.name
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
@@ -5,13 +5,12 @@ from pathlib import Path
 from datetime import datetime
 from homeassistant.components.frontend import async_register_built_in_panel
 from homeassistant.core import HomeAssistant
-from ..const import DOMAIN, STORAGE_DIR
+from ..const import DOMAIN, PANEL_URL_PATH, STORAGE_DIR
 from ..utils.filename_builder import build_profile_filename
 from datetime import timedelta
 from homeassistant.util import dt as dt_util
 
 _LOGGER = logging.getLogger(__name__)
-PANEL_URL_PATH = "cronostar-admin"
 DASHBOARD_YAML_FILENAME = "cronostar_dashboard_v600.yaml"
 CURRENT_VERSION = "v6.8.8"
 
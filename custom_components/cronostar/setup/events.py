@@ -4,11 +4,14 @@ Event handler registration for CronoStar
 Handles HA state changes and component startup
 """
 
+import asyncio
 import logging
 
-from homeassistant.const import EVENT_HOMEASSISTANT_START
+from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STARTED, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, Event, HomeAssistant
 
+from ..const import DOMAIN
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -42,6 +45,26 @@ async def setup_event_handlers(hass: HomeAssistant, storage_manager) -> None:
 
         _LOGGER.info("[CRONOSTAR] Initialization completed")
 
+    # --- Fold pending profile journals and release the storage backend on shutdown ---
+    async def handle_shutdown(event: Event | None = None):
+        """Handle Home Assistant stop"""
+        if storage_manager.journal_enabled:
+            compacted = await storage_manager.async_compact()
+            _LOGGER.info("[CRONOSTAR] Compacted %d profile journal(s) on shutdown", compacted)
+        await storage_manager.async_close()
+        profiler = hass.data.get(DOMAIN, {}).get("profiler")
+        if profiler is not None and profiler.running:
+            profiler.async_cancel()
+
+    # --- Apply the schedules held back during startup, in one batched pass ---
+    async def handle_started(event: Event | None = None):
+        """Handle Home Assistant started"""
+        await async_apply_deferred_controllers(hass)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, handle_shutdown)
+    if hass.state != CoreState.running:
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, handle_started)
+
     # Run immediately if HA is already running (e.g. reload), otherwise wait for start event
     if hass.state == CoreState.running:
         hass.async_create_task(handle_startup())
@@ -49,3 +72,33 @@ async def setup_event_handlers(hass: HomeAssistant, storage_manager) -> None:
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, handle_startup)
 
     _LOGGER.info("Event handlers registered successfully")
+
+
+async def async_apply_deferred_controllers(hass: HomeAssistant) -> int:
+    """
+    Apply the schedule of every controller whose first application was deferred
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        Number of controllers applied
+    """
+    coordinators = []
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.data.get("component_installed"):
+            continue
+        coordinator = getattr(entry, "runtime_data", None) or hass.data.get(DOMAIN, {}).get(entry.entry_id)
+        if getattr(coordinator, "apply_deferred", False) is True:
+            coordinators.append(coordinator)
+
+    if not coordinators:
+        return 0
+
+    results = await asyncio.gather(*(coordinator.async_apply_deferred() for coordinator in coordinators), return_exceptions=True)
+    for coordinator, result in zip(coordinators, results, strict=True):
+        if isinstance(result, Exception):
+            _LOGGER.error("[CRONOSTAR] Deferred schedule application failed for '%s': %s", coordinator.name, result)
+
+    _LOGGER.info("[CRONOSTAR] Applied deferred schedules for %d controller(s)", len(coordinators))
+    return len(coordinators)
@@ -1,15 +1,21 @@
 """WebSocket API per il pannello sidebar di CronoStar.
 
 Espone un comando WebSocket che restituisce la lista dei controller
-configurati con i relativi dati, usata dal pannello frontend.
+configurati con i relativi dati, usata dal pannello frontend, una
+sottoscrizione che notifica le modifiche alle impostazioni globali e
+un comando di previsione dei valori programmati.
 """
 
 import logging
+from collections.abc import Mapping
 
+import voluptuous as vol
 from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 
-from ..const import DOMAIN
+from ..const import DEFAULT_HORIZON_HOURS, DOMAIN
+from .services import get_forecast_service
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,6 +24,8 @@ _LOGGER = logging.getLogger(__name__)
 def async_setup(hass: HomeAssistant) -> None:
     """Registra i comandi WebSocket del pannello."""
     websocket_api.async_register_command(hass, websocket_get_controllers)
+    websocket_api.async_register_command(hass, websocket_subscribe_settings)
+    websocket_api.async_register_command(hass, websocket_forecast)
 
 
 @websocket_api.websocket_command({"type": "cronostar/get_controllers"})
@@ -30,7 +38,9 @@ async def websocket_get_controllers(
     """Restituisce la lista dei controller CronoStar configurati.
 
     Esclude la entry globale (component_installed) e restituisce solo
-    le entry controller con i dati necessari alla card.
+    le entry controller con i dati necessari alla card, più lo stato
+    corrente del coordinator (profili, profilo attivo, abilitazione) che
+    il sensore non registra nel recorder.
     """
     entries = hass.config_entries.async_entries(DOMAIN)
 
@@ -43,6 +53,7 @@ async def websocket_get_controllers(
         controllers.append(
             {
                 "entry_id": entry.entry_id,
+                "state": _controller_state(hass, entry),
                 "title": entry.title,
                 "data": {
                     "preset_type": entry.data.get("preset_type"),
@@ -63,3 +74,80 @@ async def websocket_get_controllers(
 
     _LOGGER.debug("[CronoStar Panel] Returning %d controllers", len(controllers))
     connection.send_result(msg["id"], {"controllers": controllers})
+
+
+def _controller_state(hass: HomeAssistant, entry) -> dict | None:
+    """Ultimo snapshot pubblicato dal coordinator del controller (None se non caricato)."""
+    coordinator = getattr(entry, "runtime_data", None) or hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    data = getattr(coordinator, "data", None)
+    if not isinstance(data, Mapping):
+        return None
+    return {
+        "active_profile": data.get("selected_profile"),
+        "is_enabled": data.get("is_enabled", True),
+        "current_value": data.get("current_value"),
+        "available_profiles": list(data.get("available_profiles", [])),
+    }
+
+
+@websocket_api.websocket_command({"type": "cronostar/subscribe_settings"})
+@websocket_api.async_response
+async def websocket_subscribe_settings(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Sottoscrive le impostazioni globali di CronoStar.
+
+    Invia subito le impostazioni correnti e poi un evento a ogni modifica
+    (salvataggio o modifica esterna del file), senza che il client debba
+    rileggerle.
+    """
+    settings_manager = hass.data.get(DOMAIN, {}).get("settings_manager")
+    if settings_manager is None:
+        connection.send_error(msg["id"], "not_ready", "CronoStar settings are not available")
+        return
+
+    @callback
+    def forward_settings(settings: dict) -> None:
+        connection.send_message(websocket_api.event_message(msg["id"], {"settings": settings}))
+
+    connection.subscriptions[msg["id"]] = settings_manager.async_add_listener(forward_settings)
+    connection.send_result(msg["id"])
+    forward_settings(await settings_manager.load_settings())
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "cronostar/forecast",
+        vol.Optional("prefixes"): [str],
+        vol.Optional("horizon", default=DEFAULT_HORIZON_HOURS): vol.Coerce(float),
+        vol.Optional("resolution"): vol.Coerce(int),
+    }
+)
+@websocket_api.async_response
+async def websocket_forecast(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Restituisce le prossime transizioni (e opzionalmente i campioni) dei controller.
+
+    Stesso risultato del servizio cronostar.forecast, calcolato lato server
+    in un solo passaggio sui container in cache.
+    """
+    forecast_service = get_forecast_service(hass)
+    if forecast_service is None:
+        connection.send_error(msg["id"], "not_ready", "CronoStar services are not available")
+        return
+
+    try:
+        result = await forecast_service.async_forecast(
+            prefixes=msg.get("prefixes"),
+            horizon_hours=msg.get("horizon", DEFAULT_HORIZON_HOURS),
+            resolution=msg.get("resolution"),
+        )
+    except HomeAssistantError as e:
+        connection.send_error(msg["id"], "invalid_format", str(e))
+        return
+    connection.send_result(msg["id"], result)
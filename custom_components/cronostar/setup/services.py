@@ -10,6 +10,10 @@ from custom_components.cronostar.services.profile_service import ProfileService
 from custom_components.cronostar.storage.settings_manager import SettingsManager
 from custom_components.cronostar.storage.storage_manager import StorageManager
 from custom_components.cronostar.utils.error_handler import log_operation, handle_service_errors
+from custom_components.cronostar.utils.metrics import get_metrics
+from custom_components.cronostar.utils.dispatch_queue import get_dispatch_queue
+from custom_components.cronostar.utils.schedule_table import compile_week_table, week_minute
+from custom_components.cronostar.utils.target_adapters import resolve_target
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,6 +40,12 @@ async def setup_services(hass: HomeAssistant, storage_manager: StorageManager) -
     # Store reference for potential internal use
     hass.data[DOMAIN]["profile_service"] = profile_service
 
+    metrics = get_metrics(hass)
+
+    def register_service(service: str, handler, **kwargs) -> None:
+        """Register a service, timing each dispatch as 'service.<name>'"""
+        hass.services.async_register(DOMAIN, service, metrics.wrap_async(f"service.{service}", handler), **kwargs)
+
     # === Profile Management Services ===
 
     @handle_service_errors
@@ -44,14 +54,14 @@ async def setup_services(hass: HomeAssistant, storage_manager: StorageManager) -
         await profile_service.save_profile(call)
         _LOGGER.info("Profile saved: %s", call.data.get("profile_name"))
 
-    hass.services.async_register(DOMAIN, "save_profile", save_profile_handler)
+    register_service("save_profile", save_profile_handler)
 
     @handle_service_errors
     async def load_profile_handler(call: ServiceCall) -> ServiceResponse:
         """Handle load_profile service call."""
         return await profile_service.load_profile(call)
 
-    hass.services.async_register(DOMAIN, "load_profile", load_profile_handler, supports_response=True)
+    register_service("load_profile", load_profile_handler, supports_response=True)
 
     @handle_service_errors
     async def add_profile_handler(call: ServiceCall):
@@ -59,7 +69,7 @@ async def setup_services(hass: HomeAssistant, storage_manager: StorageManager) -
         await profile_service.add_profile(call)
         _LOGGER.info("Profile added: %s", call.data.get("profile_name"))
 
-    hass.services.async_register(DOMAIN, "add_profile", add_profile_handler)
+    register_service("add_profile", add_profile_handler)
 
     @handle_service_errors
     async def delete_profile_handler(call: ServiceCall):
@@ -67,7 +77,7 @@ async def setup_services(hass: HomeAssistant, storage_manager: StorageManager) -
         await profile_service.delete_profile(call)
         _LOGGER.info("Profile deleted: %s", call.data.get("profile_name"))
 
-    hass.services.async_register(DOMAIN, "delete_profile", delete_profile_handler)
+    register_service("delete_profile", delete_profile_handler)
 
     @handle_service_errors
     async def delete_controller_handler(call: ServiceCall):
@@ -75,14 +85,14 @@ async def setup_services(hass: HomeAssistant, storage_manager: StorageManager) -
         await profile_service.delete_controller(call)
         _LOGGER.info("Controller deleted: %s", call.data.get("global_prefix"))
 
-    hass.services.async_register(DOMAIN, "delete_controller", delete_controller_handler)
+    register_service("delete_controller", delete_controller_handler)
 
     @handle_service_errors
     async def register_card_handler(call: ServiceCall) -> ServiceResponse:
         """Handle register_card service call."""
         return await profile_service.register_card(call)
 
-    hass.services.async_register(DOMAIN, "register_card", register_card_handler, supports_response=True)
+    register_service("register_card", register_card_handler, supports_response=True)
 
     # === Settings Services ===
 
@@ -94,14 +104,14 @@ async def setup_services(hass: HomeAssistant, storage_manager: StorageManager) -
             await settings_manager.save_settings(settings)
             _LOGGER.info("Global settings saved")
 
-    hass.services.async_register(DOMAIN, "save_settings", save_settings_handler)
+    register_service("save_settings", save_settings_handler)
 
     @handle_service_errors
     async def load_settings_handler(call: ServiceCall) -> ServiceResponse:
         """Handle load_settings service call."""
         return await settings_manager.load_settings()
 
-    hass.services.async_register(DOMAIN, "load_settings", load_settings_handler, supports_response=True)
+    register_service("load_settings", load_settings_handler, supports_response=True)
 
     # === Utility Services ===
 
@@ -233,7 +243,45 @@ async def setup_services(hass: HomeAssistant, storage_manager: StorageManager) -
         except Exception as e:
             _LOGGER.error("[LIST_ALL] Uncaught error: %s", e, exc_info=True)
             return {"error": str(e)}
-    hass.services.async_register(DOMAIN, "list_all_profiles", list_all_profiles_handler, supports_response=True)
+    register_service("list_all_profiles", list_all_profiles_handler, supports_response=True)
+
+    @handle_service_errors
+    async def forecast_handler(call: ServiceCall) -> ServiceResponse:
+        """Handle forecast service call."""
+        return await get_forecast_service(hass, storage_manager).forecast(call)
+
+    register_service("forecast", forecast_handler, supports_response=True)
+
+    @handle_service_errors
+    async def evaluate_schedules_handler(call: ServiceCall) -> ServiceResponse:
+        """Handle evaluate_schedules service call."""
+        return await get_forecast_service(hass, storage_manager).evaluate(call)
+
+    register_service("evaluate_schedules", evaluate_schedules_handler, supports_response=True)
+
+    # === Diagnostics Services ===
+
+    @handle_service_errors
+    async def start_profiling_handler(call: ServiceCall) -> ServiceResponse:
+        """Start a bounded profiling session."""
+        from custom_components.cronostar.utils.profiler import DEFAULT_DURATION, DEFAULT_TOP_N, ENGINE_AUTO, get_profiler
+
+        return get_profiler(hass).start(
+            duration=call.data.get("duration", DEFAULT_DURATION),
+            engine=call.data.get("engine", ENGINE_AUTO),
+            top_n=call.data.get("top", DEFAULT_TOP_N),
+        )
+
+    register_service("start_profiling", start_profiling_handler, supports_response=True)
+
+    @handle_service_errors
+    async def stop_profiling_handler(call: ServiceCall) -> ServiceResponse:
+        """Stop profiling and return the top-N summary."""
+        from custom_components.cronostar.utils.profiler import get_profiler
+
+        return await get_profiler(hass).async_stop(top_n=call.data.get("top"))
+
+    register_service("stop_profiling", stop_profiling_handler, supports_response=True)
 
     # === Schedule Application Service ===
 
@@ -262,7 +310,7 @@ async def setup_services(hass: HomeAssistant, storage_manager: StorageManager) -
 
             schedule = profile_data.get("schedule", [])
 
-            if not schedule:
+            if not schedule and not profile_data.get("weekdays"):
                 _LOGGER.warning("apply_now: Empty schedule for %s", profile_name)
                 return
 
@@ -277,84 +325,86 @@ async def setup_services(hass: HomeAssistant, storage_manager: StorageManager) -
                 m = total % 60
                 return f"{h:02d}:{m:02d}"
 
-            # Parse schedule into (minutes, value)
-            points = []
-            for item in schedule:
-                try:
-                    t = item.get("time")
-                    v = item.get("value")
-                    if not t or v is None:
+            week_table = compile_week_table(profile_data)
+            if week_table is not None:
+                # Weekly profile: stepped lookup in the compiled breakpoint table
+                now_minute = week_minute(now)
+                value = week_table.value_at(now_minute, stepped=True)
+                if value is None:
+                    _LOGGER.warning("apply_now: Could not interpolate value")
+                    return
+                current_time_str = _minutes_to_time(current_minutes)
+                next_time_str, next_in_minutes = week_table.next_change(now_minute, value) or (None, None)
+            else:
+                # Parse schedule into (minutes, value)
+                points = []
+                for item in schedule:
+                    try:
+                        t = item.get("time")
+                        v = item.get("value")
+                        if not t or v is None:
+                            continue
+                        h, m = map(int, str(t).split(":"))
+                        points.append((h * 60 + m, float(v)))
+                    except Exception:
                         continue
-                    h, m = map(int, str(t).split(":"))
-                    points.append((h * 60 + m, float(v)))
-                except Exception:
-                    continue
 
-            points.sort(key=lambda x: x[0])
+                points.sort(key=lambda x: x[0])
 
-            # Simple stepped interpolation: pick last point at or before now
-            value = None
-            for minute, v in points:
-                if minute <= current_minutes:
-                    value = v
-                else:
-                    break
+                # Simple stepped interpolation: pick last point at or before now
+                value = None
+                for minute, v in points:
+                    if minute <= current_minutes:
+                        value = v
+                    else:
+                        break
 
-            if value is None and points:
-                # Use last value if no match found
-                value = points[-1][1]
+                if value is None and points:
+                    # Use last value if no match found
+                    value = points[-1][1]
 
-            if value is None:
-                _LOGGER.warning("apply_now: Could not interpolate value")
-                return
+                if value is None:
+                    _LOGGER.warning("apply_now: Could not interpolate value")
+                    return
 
-            current_time_str = _minutes_to_time(current_minutes)
+                current_time_str = _minutes_to_time(current_minutes)
 
-            # Compute next change time (next point with different value)
-            next_time_str = None
-            next_in_minutes = None
-            if points:
-                # Find next differing point ahead
-                next_candidate = None
-                for minute, v in points:
-                    if minute > current_minutes and v != value:
-                        next_candidate = (minute, v)
-                        break
-                # Wrap-around
-                if next_candidate is None:
+                # Compute next change time (next point with different value)
+                next_time_str = None
+                next_in_minutes = None
+                if points:
+                    # Find next differing point ahead
+                    next_candidate = None
                     for minute, v in points:
-                        if v != value:
+                        if minute > current_minutes and v != value:
                             next_candidate = (minute, v)
                             break
-                if next_candidate:
-                    nm, nv = next_candidate
-                    next_time_str = _minutes_to_time(nm)
-                    next_in_minutes = (nm - current_minutes) if nm > current_minutes else (1440 - current_minutes + nm)
-
-            # Apply to target entity
+                    # Wrap-around
+                    if next_candidate is None:
+                        for minute, v in points:
+                            if v != value:
+                                next_candidate = (minute, v)
+                                break
+                    if next_candidate:
+                        nm, nv = next_candidate
+                        next_time_str = _minutes_to_time(nm)
+                        next_in_minutes = (nm - current_minutes) if nm > current_minutes else (1440 - current_minutes + nm)
+
+            # Apply to target entity (same adapters and rate limits as the coordinator)
             domain = target_entity.split(".")[0]
-            service_called = "none"
-
-            if domain == "climate":
-                service_called = "climate.set_temperature"
-                await hass.services.async_call("climate", "set_temperature", {"entity_id": target_entity, "temperature": value}, blocking=False)
-            elif domain in ["switch", "light", "fan"]:
-                service = "turn_on" if value > 0 else "turn_off"
-                service_called = f"{domain}.{service}"
-                await hass.services.async_call(domain, service, {"entity_id": target_entity}, blocking=False)
-            elif domain == "input_number":
-                service_called = "input_number.set_value"
-                await hass.services.async_call("input_number", "set_value", {"entity_id": target_entity, "value": value}, blocking=False)
-            elif domain == "input_select":
+            target = resolve_target(target_entity)
+
+            if domain == "input_select":
                  _LOGGER.warning("apply_now: input_select target not directly supported yet via interpolation")
                  return
-            elif domain == "cover":
-                service_called = "cover.set_cover_position"
-                await hass.services.async_call("cover", "set_cover_position", {"entity_id": target_entity, "position": int(value)}, blocking=False)
-            else:
+            if target is None:
                 _LOGGER.warning("apply_now: Unsupported domain '%s'", domain)
                 return
 
+            target_domain, service, data = target(value)
+            service_called = f"{target_domain}.{service}"
+            await get_dispatch_queue(hass).async_call(target_entity, target_domain, service, data)
+
             # Highlighted info line for quick discovery
             if next_time_str is not None and next_in_minutes is not None:
                 _LOGGER.info(
@@ -385,7 +435,7 @@ async def setup_services(hass: HomeAssistant, storage_manager: StorageManager) -
             log_operation("Manual apply value", False, entity=target_entity, error=str(e), profile=profile_name)
             raise ScheduleApplicationError() from e
 
-    hass.services.async_register(DOMAIN, "apply_now", apply_now_handler)
+    register_service("apply_now", apply_now_handler)
 
     _LOGGER.info("✅ CronoStar services registered:")
     _LOGGER.info("   - save_profile")
@@ -394,7 +444,36 @@ async def setup_services(hass: HomeAssistant, storage_manager: StorageManager) -
     _LOGGER.info("   - delete_profile")
     _LOGGER.info("   - register_card")
     _LOGGER.info("   - list_all_profiles")
+    _LOGGER.info("   - forecast / evaluate_schedules")
     _LOGGER.info("   - apply_now")
+    _LOGGER.info("   - start_profiling / stop_profiling")
+
+
+def get_forecast_service(hass: HomeAssistant, storage_manager: StorageManager | None = None):
+    """
+    Return the shared forecast service, creating it on first use.
+
+    The forecast module (and the bulk evaluator behind it) is only imported
+    once a forecast is requested, keeping it off the startup path.
+
+    Args:
+        hass: Home Assistant instance
+        storage_manager: Storage manager (defaults to the global one)
+
+    Returns:
+        ForecastService, or None before the global setup ran
+    """
+    domain_data = hass.data.get(DOMAIN, {})
+    forecast_service = domain_data.get("forecast_service")
+    if forecast_service is None:
+        storage_manager = storage_manager or domain_data.get("storage_manager")
+        if storage_manager is None:
+            return None
+        from custom_components.cronostar.services.forecast_service import ForecastService
+
+        forecast_service = ForecastService(hass, storage_manager)
+        hass.data.setdefault(DOMAIN, {})["forecast_service"] = forecast_service
+    return forecast_service
 
 
 async def async_unload_services(hass: HomeAssistant) -> None:
@@ -420,6 +499,18 @@ async def async_unload_services(hass: HomeAssistant) -> None:
 
     await hass.services.async_remove(DOMAIN, "list_all_profiles")
 
+    await hass.services.async_remove(DOMAIN, "forecast")
+
+    await hass.services.async_remove(DOMAIN, "evaluate_schedules")
+
     await hass.services.async_remove(DOMAIN, "apply_now")
 
+    await hass.services.async_remove(DOMAIN, "start_profiling")
+
+    await hass.services.async_remove(DOMAIN, "stop_profiling")
+
+    profiler = hass.data.get(DOMAIN, {}).get("profiler")
+    if profiler is not None and profiler.running:
+        profiler.async_cancel()
+
     _LOGGER.info("✅ CronoStar services unregistered.")
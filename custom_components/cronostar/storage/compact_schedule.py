@@ -0,0 +1,164 @@
+# custom_components/cronostar/storage/compact_schedule.py
+"""
+Compact Schedule - array-backed schedule points for the profile cache
+Stores minutes in array('H') and values in array('d'/'q'), producing dict views on access
+"""
+
+from array import array
+from collections.abc import Sequence
+
+
+def _parse_time(time_str) -> int | None:
+    """Return minutes for a canonical 'HH:MM' string (round-trips exactly) or None"""
+    if not isinstance(time_str, str) or len(time_str) != 5 or time_str[2] != ":":
+        return None
+    hh, mm = time_str[:2], time_str[3:]
+    if not (hh.isdigit() and mm.isdigit()):
+        return None
+    hours, minutes = int(hh), int(mm)
+    if hours > 24 or minutes > 59:
+        return None
+    return hours * 60 + minutes
+
+
+def _format_time(total_minutes: int) -> str:
+    return f"{total_minutes // 60:02d}:{total_minutes % 60:02d}"
+
+
+class CompactSchedule(Sequence):
+    """Read-only schedule backed by two parallel arrays
+
+    Behaves like the list of {"time": "HH:MM", "value": x} dicts it replaces
+    (indexing, iteration, len, equality with lists); each access builds a
+    fresh dict. Point order is preserved as stored.
+    """
+
+    __slots__ = ("_minutes", "_values")
+
+    def __init__(self, minutes: array, values: array):
+        """
+        Initialize CompactSchedule
+
+        Args:
+            minutes: Minutes since midnight, array('H')
+            values: Point values, array('q') when all ints else array('d')
+        """
+        self._minutes = minutes
+        self._values = values
+
+    @classmethod
+    def from_points(cls, points) -> "CompactSchedule | None":
+        """
+        Pack a list of schedule points
+
+        Args:
+            points: List of {"time": "HH:MM", "value": number} dicts
+
+        Returns:
+            CompactSchedule, or None if any point carries extra keys, a
+            non-canonical time or a non-numeric value (kept as a plain list)
+        """
+        if isinstance(points, CompactSchedule):
+            return points
+        if not isinstance(points, list):
+            return None
+
+        minutes = array("H")
+        raw_values = []
+        all_ints = True
+        for point in points:
+            if not isinstance(point, dict) or len(point) != 2:
+                return None
+            minute = _parse_time(point.get("time"))
+            value = point.get("value")
+            if minute is None or isinstance(value, bool) or not isinstance(value, (int, float)):
+                return None
+            if isinstance(value, float):
+                all_ints = False
+            elif not -(2**63) <= value < 2**63:
+                return None
+            minutes.append(minute)
+            raw_values.append(value)
+
+        values = array("q", raw_values) if all_ints else array("d", raw_values)
+        return cls(minutes, values)
+
+    @property
+    def minutes(self) -> array:
+        """Minutes since midnight of each point (stored order)"""
+        return self._minutes
+
+    @property
+    def values(self) -> array:
+        """Value of each point (stored order)"""
+        return self._values
+
+    def as_tuples(self) -> list[tuple[int, float]]:
+        """Return (minutes, float value) pairs without building dicts"""
+        return list(zip(self._minutes, map(float, self._values), strict=True))
+
+    def to_list(self) -> list[dict]:
+        """Return the plain list of point dicts (JSON/service boundary)"""
+        return [{"time": _format_time(m), "value": v} for m, v in zip(self._minutes, self._values, strict=True)]
+
+    def __len__(self) -> int:
+        return len(self._minutes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.to_list()[index]
+        return {"time": _format_time(self._minutes[index]), "value": self._values[index]}
+
+    def __iter__(self):
+        for m, v in zip(self._minutes, self._values, strict=True):
+            yield {"time": _format_time(m), "value": v}
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CompactSchedule):
+            return self._minutes == other._minutes and list(self._values) == list(other._values)
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"CompactSchedule({self.to_list()!r})"
+
+
+def compact_container(container: dict) -> dict:
+    """
+    Replace packable profile schedules (including weekday schedules) of a container in place
+
+    Args:
+        container: Profile container ({"meta": ..., "profiles": ...})
+
+    Returns:
+        The same container
+    """
+    profiles = container.get("profiles") if isinstance(container, dict) else None
+    if not isinstance(profiles, dict):
+        return container
+    for entry in profiles.values():
+        if not isinstance(entry, dict):
+            continue
+        _compact_key(entry, "schedule")
+        weekdays = entry.get("weekdays")
+        if isinstance(weekdays, dict):
+            for day in weekdays:
+                _compact_key(weekdays, day)
+    return container
+
+
+def _compact_key(mapping: dict, key: str) -> None:
+    if isinstance(mapping.get(key), list):
+        packed = CompactSchedule.from_points(mapping[key])
+        if packed is not None:
+            mapping[key] = packed
+
+
+def json_default(obj):
+    """json.dumps default hook turning CompactSchedule back into plain lists"""
+    if isinstance(obj, CompactSchedule):
+        return obj.to_list()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
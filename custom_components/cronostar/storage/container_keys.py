@@ -0,0 +1,41 @@
+# custom_components/cronostar/storage/container_keys.py
+"""
+Container Keys - what profile containers are listed by
+Shared by the JSON and SQLite backends so both filter legacy files the same way
+"""
+
+from ..utils.prefix_normalizer import normalize_preset_type
+
+
+def prefix_base(prefix: str) -> str:
+    """Return the filename base of a normalized prefix (without 'cronostar_' and trailing '_')"""
+    if prefix.startswith("cronostar_"):
+        prefix = prefix[len("cronostar_") :]
+    return prefix.rstrip("_")
+
+
+def filename_base(filename: str) -> str | None:
+    """Return the prefix base a container filename was built from (None for non-standard names)"""
+    base_noext = filename[:-5] if filename.endswith(".json") else filename
+    if not base_noext.startswith("cronostar_"):
+        return None
+    return base_noext[len("cronostar_") :].rpartition("_")[0]
+
+
+def container_filter_keys(filename: str, container: dict) -> tuple[str, str | None, str | None]:
+    """
+    Precompute the keys containers are filtered on
+
+    Args:
+        filename: Container filename
+        container: Profile container
+
+    Returns:
+        (canonical preset type, meta global_prefix, filename base or None for non-standard names)
+    """
+    meta = container.get("meta", {}) if isinstance(container, dict) else {}
+    if not isinstance(meta, dict):
+        meta = {}
+    file_preset = meta.get("preset_type") or (container.get("preset_type") if isinstance(container, dict) else None)
+
+    return normalize_preset_type(str(file_preset or "")), meta.get("global_prefix"), filename_base(filename)
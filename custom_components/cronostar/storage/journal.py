@@ -0,0 +1,140 @@
+# custom_components/cronostar/storage/journal.py
+"""
+Profile Journal - append-only change log for profile containers
+Records small mutations next to each container and replays them on load
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+
+from .compact_schedule import json_default
+
+_LOGGER = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = ".journal"
+
+# Compaction thresholds (whichever is hit first folds the log into the container)
+JOURNAL_MAX_RECORDS = 200
+JOURNAL_MAX_BYTES = 256 * 1024
+JOURNAL_MAX_AGE_SECONDS = 3600
+# How often idle journals are checked against the thresholds
+JOURNAL_COMPACT_INTERVAL_SECONDS = 300
+
+# Journal record operations
+OP_SAVE_PROFILE = "save_profile"
+OP_DELETE_PROFILE = "delete_profile"
+OP_UPDATE_META = "update_meta"
+
+
+class ProfileJournal:
+    """Append-only log of container mutations (one JSON record per line)
+
+    All methods are blocking and must run in the executor.
+    """
+
+    def __init__(self, profiles_dir: str | Path):
+        """
+        Initialize ProfileJournal
+
+        Args:
+            profiles_dir: Directory holding the profile containers
+        """
+        self.profiles_dir = Path(profiles_dir)
+
+    def path_for(self, filename: str) -> Path:
+        """Return the journal path for a container filename"""
+        return self.profiles_dir / f"{Path(filename).stem}{JOURNAL_SUFFIX}"
+
+    def append(self, filename: str, record: dict) -> int:
+        """
+        Append a record to the container journal
+
+        Args:
+            filename: Container filename
+            record: Mutation record (must contain 'op')
+
+        Returns:
+            Journal size in bytes after the append
+        """
+        path = self.path_for(filename)
+        line = json.dumps({"ts": datetime.now().isoformat(), **record}, ensure_ascii=False, default=json_default)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+            return f.tell()
+
+    def read(self, filename: str) -> list[dict]:
+        """
+        Read all records of a container journal
+
+        A torn trailing line (e.g. power loss during append) is skipped.
+
+        Args:
+            filename: Container filename
+
+        Returns:
+            List of records in append order (empty if no journal)
+        """
+        path = self.path_for(filename)
+        if not path.exists():
+            return []
+
+        records = []
+        with open(path, encoding="utf-8") as f:
+            for lineno, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    _LOGGER.warning("Skipping corrupt journal record %s:%d", path.name, lineno)
+                    continue
+                if isinstance(record, dict) and "op" in record:
+                    records.append(record)
+        return records
+
+    def stat(self, filename: str) -> tuple[int, float] | None:
+        """Return (size, mtime) of the container journal or None if missing"""
+        try:
+            st = os.stat(self.path_for(filename))
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime
+
+    def remove(self, filename: str) -> None:
+        """Remove the container journal if present"""
+        self.path_for(filename).unlink(missing_ok=True)
+
+    def list_journaled(self) -> list[str]:
+        """Return container filenames that have a pending journal"""
+        return [f"{p.stem}.json" for p in self.profiles_dir.glob(f"cronostar_*{JOURNAL_SUFFIX}")]
+
+    @staticmethod
+    def replay(container: dict, records: list[dict]) -> dict:
+        """
+        Apply journal records onto a container snapshot (in place)
+
+        Args:
+            container: Container loaded from the main file (may be empty)
+            records: Records returned by read()
+
+        Returns:
+            The updated container
+        """
+        for record in records:
+            op = record.get("op")
+            if op == OP_SAVE_PROFILE:
+                container.setdefault("profiles", {})[record["profile"]] = record.get("data", {})
+                if record.get("meta"):
+                    container["meta"] = {**container.get("meta", {}), **record["meta"]}
+            elif op == OP_DELETE_PROFILE:
+                container.get("profiles", {}).pop(record.get("profile"), None)
+            elif op == OP_UPDATE_META:
+                container["meta"] = {**container.get("meta", {}), **record.get("meta", {})}
+            else:
+                _LOGGER.debug("Ignoring unknown journal op: %s", op)
+        return container
@@ -5,21 +5,36 @@ Manages /config/cronostar/settings.json
 """
 
 import asyncio
+import copy
 import json
 import logging
+import time
+from collections.abc import Callable
+from datetime import timedelta
 from pathlib import Path
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
 
 _LOGGER = logging.getLogger(__name__)
 
+# Interval between checks of the settings file for external edits
+SETTINGS_RECHECK_SECONDS = 30
+
 DEFAULT_SETTINGS = {
     "keyboard": {"ctrl": {"horizontal": 1, "vertical": 0.1}, "shift": {"horizontal": 30, "vertical": 1.0}, "alt": {"horizontal": 60, "vertical": 5.0}}
 }
 
 
 class SettingsManager:
-    """Manages global settings for CronoStar"""
+    """Manages global settings for CronoStar
+
+    Settings are served from memory after the first load, as copies so callers
+    cannot alter the cached dict. The file is re-checked at most every
+    SETTINGS_RECHECK_SECONDS so that external edits are picked up, and on a
+    timer while listeners are registered; listeners are notified whenever the
+    settings change.
+    """
 
     def __init__(self, hass: HomeAssistant, settings_dir: str | Path):
         """Initialize SettingsManager"""
@@ -29,35 +44,98 @@ class SettingsManager:
         self._settings = {}
         self._lock = asyncio.Lock()
 
-    async def load_settings(self) -> dict:
-        """Load settings from disk"""
+        # In-memory cache state
+        self._loaded = False
+        self._mtime: float | None = None
+        self._checked_at = 0.0
+
+        self._listeners: list[Callable[[dict], None]] = []
+        self._unsub_recheck: CALLBACK_TYPE | None = None
+
+    async def load_settings(self, force_reload: bool = False) -> dict:
+        """
+        Return settings, loading them from disk only when needed
+
+        Args:
+            force_reload: Bypass the in-memory copy
+
+        Returns:
+            Copy of the settings merged with defaults
+        """
+        return copy.deepcopy(await self._async_load(force_reload))
+
+    async def _async_load(self, force_reload: bool = False, recheck: bool = False) -> dict:
+        """Return the cached settings, reloading them (and notifying listeners) when the file changed"""
         async with self._lock:
-            # Ensure directory exists (offload to executor)
-            if not await self.hass.async_add_executor_job(self.settings_dir.exists):
-                await self.hass.async_add_executor_job(self.settings_dir.mkdir, True, True)
+            if self._loaded and not force_reload:
+                if not recheck and time.monotonic() - self._checked_at < SETTINGS_RECHECK_SECONDS:
+                    return self._settings
+                self._checked_at = time.monotonic()
+                if await self.hass.async_add_executor_job(self._get_mtime) == self._mtime:
+                    return self._settings
+                _LOGGER.debug("Settings file changed on disk, reloading")
 
-            if not await self.hass.async_add_executor_job(self.settings_file.exists):
-                self._settings = DEFAULT_SETTINGS.copy()
-                await self._save_settings_locked()
-                return self._settings
+            previous = self._settings if self._loaded else None
+            settings = await self._load_settings_locked()
 
-            try:
-                content = await self.hass.async_add_executor_job(self.settings_file.read_text, "utf-8")
-                self._settings = json.loads(content)
+        if previous is not None and settings != previous:
+            self._notify_listeners()
+        return settings
 
-                # Merge with defaults to ensure all keys exist
-                self._settings = self._deep_merge(DEFAULT_SETTINGS, self._settings)
+    @callback
+    def async_start(self) -> None:
+        """Re-check the settings file periodically, pushing external edits to listeners"""
+        if self._unsub_recheck is None:
+            self._unsub_recheck = async_track_time_interval(self.hass, self._async_recheck, timedelta(seconds=SETTINGS_RECHECK_SECONDS))
 
-                return self._settings
-            except Exception as e:
-                _LOGGER.error("Error loading settings: %s", e)
-                return DEFAULT_SETTINGS.copy()
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the periodic re-check"""
+        if self._unsub_recheck is not None:
+            self._unsub_recheck()
+            self._unsub_recheck = None
+
+    async def _async_recheck(self, _now) -> None:
+        # Only listeners need the push; load_settings re-checks on its own
+        if self._listeners and self._loaded:
+            await self._async_load(recheck=True)
+
+    async def _load_settings_locked(self) -> dict:
+        """Load settings from disk while holding the lock"""
+        # Ensure directory exists (offload to executor)
+        if not await self.hass.async_add_executor_job(self.settings_dir.exists):
+            await self.hass.async_add_executor_job(self.settings_dir.mkdir, True, True)
+
+        if not await self.hass.async_add_executor_job(self.settings_file.exists):
+            self._settings = copy.deepcopy(DEFAULT_SETTINGS)
+            await self._save_settings_locked()
+            await self._mark_loaded()
+            return self._settings
+
+        try:
+            content = await self.hass.async_add_executor_job(self.settings_file.read_text, "utf-8")
+            self._settings = json.loads(content)
+
+            # Merge with defaults to ensure all keys exist
+            self._settings = self._deep_merge(DEFAULT_SETTINGS, self._settings)
+
+            await self._mark_loaded()
+            return self._settings
+        except Exception as e:
+            _LOGGER.error("Error loading settings: %s", e)
+            return copy.deepcopy(DEFAULT_SETTINGS)
 
     async def save_settings(self, settings: dict) -> bool:
-        """Save settings to disk"""
+        """Save settings to disk and notify listeners"""
         async with self._lock:
-            self._settings = settings
-            return await self._save_settings_locked()
+            self._settings = copy.deepcopy(settings)
+            success = await self._save_settings_locked()
+            if success:
+                await self._mark_loaded()
+
+        if success:
+            self._notify_listeners()
+        return success
 
     async def _save_settings_locked(self) -> bool:
         """Save settings while holding the lock"""
@@ -69,6 +147,47 @@ class SettingsManager:
             _LOGGER.error("Error saving settings: %s", e)
             return False
 
+    async def _mark_loaded(self) -> None:
+        """Record that the in-memory copy matches the file on disk"""
+        self._mtime = await self.hass.async_add_executor_job(self._get_mtime)
+        self._checked_at = time.monotonic()
+        self._loaded = True
+
+    def _get_mtime(self) -> float | None:
+        """Return the settings file mtime or None if unavailable (blocking)"""
+        try:
+            return self.settings_file.stat().st_mtime
+        except OSError:
+            return None
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[dict], None]) -> Callable[[], None]:
+        """
+        Register a callback invoked with the new settings on every change
+
+        Args:
+            update_callback: Callback receiving the settings dict
+
+        Returns:
+            Function removing the listener
+        """
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    def _notify_listeners(self) -> None:
+        """Push a copy of the current settings to each listener"""
+        for update_callback in list(self._listeners):
+            try:
+                update_callback(copy.deepcopy(self._settings))
+            except Exception as e:
+                _LOGGER.error("Error in settings listener: %s", e)
+
     def _deep_merge(self, base: dict, overlay: dict) -> dict:
         """Deep merge two dictionaries"""
         result = base.copy()
@@ -0,0 +1,347 @@
+# custom_components/cronostar/storage/sqlite_store.py
+"""
+SQLite Profile Store - indexed alternative to per-controller JSON files
+Keeps containers, profiles and schedule points in a single WAL database
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from ..utils.prefix_normalizer import normalize_prefix, normalize_preset_type
+from .container_keys import container_filter_keys, filename_base, prefix_base
+
+_LOGGER = logging.getLogger(__name__)
+
+SQLITE_DB_FILENAME = "cronostar_profiles.db"
+
+# PRAGMA user_version of the current layout (2: listing keys computed as by the JSON backend)
+_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS containers (
+    filename TEXT PRIMARY KEY,
+    preset_type TEXT NOT NULL,
+    global_prefix TEXT NOT NULL,
+    meta TEXT NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS profiles (
+    filename TEXT NOT NULL REFERENCES containers(filename) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (filename, name)
+);
+CREATE TABLE IF NOT EXISTS schedule_points (
+    filename TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    time TEXT,
+    value,
+    extra TEXT,
+    PRIMARY KEY (filename, profile, idx),
+    FOREIGN KEY (filename, profile) REFERENCES profiles(filename, name) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_containers_preset ON containers(preset_type);
+CREATE INDEX IF NOT EXISTS idx_containers_prefix ON containers(global_prefix);
+"""
+
+
+class SqliteProfileStore:
+    """Profile containers stored in SQLite
+
+    Exposes the container layout used by the JSON files, so StorageManager
+    can switch between the two transparently. All methods are blocking and
+    must run in the executor.
+    """
+
+    def __init__(self, db_path: str | Path):
+        """
+        Initialize SqliteProfileStore
+
+        Args:
+            db_path: Database file path
+        """
+        self.db_path = Path(db_path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._last_updated = 0.0
+
+    def open(self) -> None:
+        """Open the database and create the schema if needed"""
+        if self._conn is not None:
+            return
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.executescript(_SCHEMA)
+        self._conn = conn
+        if conn.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+            with self._lock, self._transaction():
+                self._reindex()
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        _LOGGER.debug("SQLite profile store opened: %s", self.db_path.name)
+
+    def close(self) -> None:
+        """Checkpoint the WAL and close the database"""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            finally:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def list_containers(self, preset_type: str | None = None, prefix: str | None = None) -> list[str]:
+        """
+        List container filenames using the preset/prefix indexes
+
+        Matches the JSON backend: containers without meta.global_prefix match
+        by filename base, and a missing preset type counts as thermostat.
+
+        Args:
+            preset_type: Filter by preset type (normalized)
+            prefix: Filter by global prefix
+
+        Returns:
+            Sorted list of filenames
+        """
+        query = "SELECT filename, global_prefix FROM containers"
+        clauses, params = [], []
+        wanted_prefix = normalize_prefix(prefix) if prefix else None
+        if preset_type:
+            clauses.append("preset_type = ?")
+            params.append(normalize_preset_type(str(preset_type)))
+        if wanted_prefix:
+            clauses.append("global_prefix IN (?, '')")
+            params.append(wanted_prefix)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY filename"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        if not wanted_prefix:
+            return [filename for filename, _ in rows]
+
+        wanted_base = prefix_base(wanted_prefix)
+        return [
+            filename
+            for filename, file_prefix in rows
+            if file_prefix == wanted_prefix or (not file_prefix and filename_base(filename) == wanted_base)
+        ]
+
+    def exists(self, filename: str) -> bool:
+        """Return True if the container exists"""
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM containers WHERE filename = ?", (filename,)).fetchone() is not None
+
+    def get_mtime(self, filename: str) -> float:
+        """Return the container change stamp (raises OSError if missing, like os.path.getmtime)"""
+        with self._lock:
+            row = self._conn.execute("SELECT updated FROM containers WHERE filename = ?", (filename,)).fetchone()
+        if row is None:
+            raise FileNotFoundError(filename)
+        return row[0]
+
+    def read_container(self, filename: str) -> dict:
+        """
+        Rebuild a container in the JSON layout
+
+        Args:
+            filename: Container filename
+
+        Returns:
+            Container dict or empty dict if missing
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT meta FROM containers WHERE filename = ?", (filename,)).fetchone()
+            if row is None:
+                return {}
+            profile_rows = self._conn.execute("SELECT name, data FROM profiles WHERE filename = ? ORDER BY rowid", (filename,)).fetchall()
+            point_rows = self._conn.execute(
+                "SELECT profile, time, value, extra FROM schedule_points WHERE filename = ? ORDER BY profile, idx",
+                (filename,),
+            ).fetchall()
+
+        schedules: dict[str, list] = {}
+        for profile, time_str, value, extra in point_rows:
+            point = {"time": time_str, "value": value}
+            if extra:
+                point.update(json.loads(extra))
+            schedules.setdefault(profile, []).append(point)
+
+        profiles = {}
+        for name, data in profile_rows:
+            entry = json.loads(data)
+            if name in schedules or "schedule" in entry:
+                entry["schedule"] = schedules.get(name, [])
+            profiles[name] = entry
+
+        return {"meta": json.loads(row[0]), "profiles": profiles}
+
+    # ------------------------------------------------------------------
+    # Mutations
+    # ------------------------------------------------------------------
+
+    def write_container(self, filename: str, container: dict) -> None:
+        """Replace a whole container"""
+        with self._lock, self._transaction():
+            self._conn.execute("DELETE FROM containers WHERE filename = ?", (filename,))
+            self._upsert_meta(filename, container.get("meta", {}), container.get("preset_type"))
+            for name, entry in container.get("profiles", {}).items():
+                self._insert_profile(filename, name, entry)
+
+    def upsert_profile(self, filename: str, profile_name: str, entry: dict, meta: dict) -> None:
+        """Insert or replace a single profile (and the container meta)"""
+        with self._lock, self._transaction():
+            self._upsert_meta(filename, meta)
+            self._conn.execute("DELETE FROM profiles WHERE filename = ? AND name = ?", (filename, profile_name))
+            self._insert_profile(filename, profile_name, entry)
+
+    def delete_profile(self, filename: str, profile_name: str) -> int:
+        """
+        Delete a single profile
+
+        Returns:
+            Number of profiles left in the container
+        """
+        with self._lock, self._transaction():
+            self._conn.execute("DELETE FROM profiles WHERE filename = ? AND name = ?", (filename, profile_name))
+            self._touch(filename)
+            return self._conn.execute("SELECT COUNT(*) FROM profiles WHERE filename = ?", (filename,)).fetchone()[0]
+
+    def update_meta(self, filename: str, meta_update: dict) -> bool:
+        """Merge keys into the container meta"""
+        with self._lock, self._transaction():
+            row = self._conn.execute("SELECT meta FROM containers WHERE filename = ?", (filename,)).fetchone()
+            if row is None:
+                return False
+            self._upsert_meta(filename, {**json.loads(row[0]), **meta_update})
+            return True
+
+    def delete_container(self, filename: str) -> bool:
+        """Delete a container with all its profiles and points"""
+        with self._lock, self._transaction():
+            return self._conn.execute("DELETE FROM containers WHERE filename = ?", (filename,)).rowcount > 0
+
+    # ------------------------------------------------------------------
+    # JSON layout import/export
+    # ------------------------------------------------------------------
+
+    def import_json_dir(self, profiles_dir: str | Path) -> int:
+        """
+        Import every cronostar_*.json container from a directory
+
+        Args:
+            profiles_dir: Directory with the JSON layout
+
+        Returns:
+            Number of containers imported
+        """
+        imported = 0
+        for filepath in sorted(Path(profiles_dir).glob("cronostar_*.json")):
+            try:
+                container = json.loads(filepath.read_text("utf-8"))
+            except (OSError, ValueError) as e:
+                _LOGGER.warning("Skipping %s during import: %s", filepath.name, e)
+                continue
+            if not isinstance(container, dict):
+                continue
+            self.write_container(filepath.name, container)
+            imported += 1
+        return imported
+
+    def export_json_dir(self, profiles_dir: str | Path) -> int:
+        """
+        Write every container back to the JSON layout
+
+        Args:
+            profiles_dir: Destination directory
+
+        Returns:
+            Number of containers exported
+        """
+        profiles_dir = Path(profiles_dir)
+        profiles_dir.mkdir(parents=True, exist_ok=True)
+        filenames = self.list_containers()
+        for filename in filenames:
+            container = self.read_container(filename)
+            (profiles_dir / filename).write_text(json.dumps(container, indent=2, ensure_ascii=False), "utf-8")
+        return len(filenames)
+
+    # ------------------------------------------------------------------
+    # Internals (caller holds self._lock)
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _transaction(self):
+        """Wrap statements in a single write transaction"""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _next_stamp(self) -> float:
+        """Return a strictly increasing change stamp"""
+        self._last_updated = max(time.time(), self._last_updated + 1e-6)
+        return self._last_updated
+
+    def _touch(self, filename: str) -> None:
+        self._conn.execute("UPDATE containers SET updated = ? WHERE filename = ?", (self._next_stamp(), filename))
+
+    def _upsert_meta(self, filename: str, meta: dict, legacy_preset: str | None = None) -> None:
+        preset, prefix = self._listing_keys(filename, meta, legacy_preset)
+        self._conn.execute(
+            "INSERT INTO containers (filename, preset_type, global_prefix, meta, updated) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(filename) DO UPDATE SET preset_type = excluded.preset_type, "
+            "global_prefix = excluded.global_prefix, meta = excluded.meta, updated = excluded.updated",
+            (filename, preset, prefix, json.dumps(meta, ensure_ascii=False), self._next_stamp()),
+        )
+
+    @staticmethod
+    def _listing_keys(filename: str, meta: dict, legacy_preset: str | None = None) -> tuple[str, str]:
+        """Return the indexed (preset_type, global_prefix) of a container, as the JSON backend filters them"""
+        container = {"meta": meta, "preset_type": legacy_preset}
+        preset, prefix, _base = container_filter_keys(filename, container)
+        # Empty prefix: listed by filename base, like JSON containers without meta.global_prefix
+        return preset, prefix or ""
+
+    def _reindex(self) -> None:
+        """Recompute the listing keys of every container (databases written by older versions)"""
+        rows = self._conn.execute("SELECT filename, meta FROM containers").fetchall()
+        for filename, meta in rows:
+            preset, prefix = self._listing_keys(filename, json.loads(meta))
+            self._conn.execute("UPDATE containers SET preset_type = ?, global_prefix = ? WHERE filename = ?", (preset, prefix, filename))
+
+    def _insert_profile(self, filename: str, name: str, entry: dict) -> None:
+        data = {k: v for k, v in entry.items() if k != "schedule"}
+        if "schedule" in entry:
+            data["schedule"] = None  # marker: profile carries a schedule (possibly empty)
+        self._conn.execute("INSERT INTO profiles (filename, name, data) VALUES (?, ?, ?)", (filename, name, json.dumps(data, ensure_ascii=False)))
+
+        points = []
+        for idx, point in enumerate(entry.get("schedule") or []):
+            if not isinstance(point, dict):
+                continue
+            extra = {k: v for k, v in point.items() if k not in ("time", "value")}
+            points.append((filename, name, idx, point.get("time"), point.get("value"), json.dumps(extra) if extra else None))
+        if points:
+            self._conn.executemany(
+                "INSERT INTO schedule_points (filename, profile, idx, time, value, extra) VALUES (?, ?, ?, ?, ?, ?)",
+                points,
+            )
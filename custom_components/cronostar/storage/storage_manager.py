@@ -1,20 +1,38 @@
 # custom_components/cronostar/storage/storage_manager.py
 """
 Storage Manager - handles profile persistence
-Manages JSON files with caching and backup support
+Manages JSON files (or an optional SQLite store) with caching and backup support
 """
 
 import asyncio
 import json
 import logging
 import os
-from datetime import datetime
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
 from pathlib import Path
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.util import dt as dt_util
 
+from ..const import STORAGE_BACKEND_JSON, STORAGE_BACKEND_SQLITE
 from ..utils.filename_builder import build_profile_filename
+from ..utils.metrics import MetricsRegistry
+from ..utils.prefix_normalizer import normalize_prefix, normalize_preset_type
+from .compact_schedule import compact_container, json_default
+from .container_keys import container_filter_keys, prefix_base
+from .journal import (
+    JOURNAL_COMPACT_INTERVAL_SECONDS,
+    JOURNAL_MAX_AGE_SECONDS,
+    JOURNAL_MAX_BYTES,
+    JOURNAL_MAX_RECORDS,
+    OP_DELETE_PROFILE,
+    OP_SAVE_PROFILE,
+    OP_UPDATE_META,
+    ProfileJournal,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,7 +40,14 @@ _LOGGER = logging.getLogger(__name__)
 class StorageManager:
     """Manages profile storage with caching and backups"""
 
-    def __init__(self, hass: HomeAssistant, profiles_dir: str | Path, enable_backups: bool = False):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        profiles_dir: str | Path,
+        enable_backups: bool = False,
+        journal_enabled: bool = False,
+        metrics: MetricsRegistry | None = None,
+    ):
         """
         Initialize StorageManager
 
@@ -30,16 +55,35 @@ class StorageManager:
             hass: Home Assistant instance
             profiles_dir: Directory for profile files
             enable_backups: Enable automatic backups
+            journal_enabled: Append profile mutations to a per-container journal
+                instead of rewriting the whole container on every edit
+            metrics: Registry receiving cache/write metrics (private one if omitted)
         """
         self.hass = hass
         self.profiles_dir = Path(profiles_dir)
         self.enable_backups = enable_backups
+        self.journal_enabled = journal_enabled
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
 
         # Cache for loaded profiles
         self._cache = {}
         self._cache_mtimes = {}
+        # Precomputed filter keys per cached container: (canonical preset, meta prefix, filename base)
+        self._cache_keys: dict[str, tuple[str, str | None, str | None]] = {}
         self._cache_lock = asyncio.Lock()
 
+        # Change bus: (filename, container or None when deleted) pushed after every profile mutation
+        self._listeners: list[Callable[[str, dict | None], None]] = []
+
+        # Journal (append-only change log) state, keyed by container filename
+        self._journal = ProfileJournal(self.profiles_dir)
+        self._journal_lock = asyncio.Lock()
+        self._journal_state: dict[str, dict] = {}
+        self._unsub_compact: CALLBACK_TYPE | None = None
+
+        # Optional SQLite store replacing the per-controller JSON files (see async_set_backend)
+        self.backend = None  # SqliteProfileStore when the SQLite backend is active
+
         # Ensure directory exists
         self.profiles_dir.mkdir(parents=True, exist_ok=True)
 
@@ -96,20 +140,24 @@ class StorageManager:
             container["profiles"] = container.get("profiles", {})
             container["profiles"][profile_name] = profile_entry
 
-            # Backup if enabled
-            if self.enable_backups and await self.hass.async_add_executor_job(filepath.exists):
-                await self._create_backup(filepath)
+            if self.backend is not None:
+                # Indexed single-profile upsert
+                await self.hass.async_add_executor_job(self.backend.upsert_profile, filename, profile_name, profile_entry, container["meta"])
+            elif self.journal_enabled and await self.hass.async_add_executor_job(filepath.exists):
+                # Journaled: append only the changed profile, the container is folded on compaction
+                await self._append_journal(filename, {"op": OP_SAVE_PROFILE, "profile": profile_name, "data": profile_entry, "meta": container["meta"]})
+            else:
+                # Backup if enabled
+                if self.enable_backups and await self.hass.async_add_executor_job(filepath.exists):
+                    await self._create_backup(filepath)
 
-            # Write to disk
-            await self._write_json(filepath, container)
+                # Write to disk
+                await self._write_json(filepath, container)
 
             # Update cache
-            async with self._cache_lock:
-                self._cache[filename] = container
-                try:
-                    self._cache_mtimes[filename] = await self.hass.async_add_executor_job(os.path.getmtime, filepath)
-                except OSError:
-                    self._cache_mtimes[filename] = 0
+            await self._update_cache(filename, filepath, container)
+            await self._maybe_compact(filename)
+            self._notify_listeners(filename)
 
             _LOGGER.info("Profile saved: %s/%s (%d points)", filename, profile_name, len(profile_data.get("schedule", [])))
 
@@ -136,20 +184,24 @@ class StorageManager:
             # Check cache if not forcing reload
             if not force_reload and filename in self._cache:
                 try:
-                    current_mtime = await self.hass.async_add_executor_job(os.path.getmtime, filepath)
+                    self.metrics.increment("storage.cache_stat_calls")
+                    current_mtime = await self.hass.async_add_executor_job(self._get_mtime, filepath)
                     if current_mtime <= self._cache_mtimes.get(filename, 0):
+                        self.metrics.increment("storage.cache_hits")
                         return self._cache[filename]
                 except OSError:
                     # File might have been deleted, proceed to load attempt which handles it
                     pass
 
             # Load from disk
+            self.metrics.increment("storage.cache_misses")
             container = await self._load_container(filepath)
 
             if container:
-                self._cache[filename] = container
+                self._cache[filename] = compact_container(container)
+                self._cache_keys[filename] = container_filter_keys(filename, container)
                 try:
-                    self._cache_mtimes[filename] = await self.hass.async_add_executor_job(os.path.getmtime, filepath)
+                    self._cache_mtimes[filename] = await self.hass.async_add_executor_job(self._get_mtime, filepath)
                 except OSError:
                     self._cache_mtimes[filename] = 0
 
@@ -187,24 +239,32 @@ class StorageManager:
 
             # If empty, delete file
             if not container["profiles"]:
-                await self.hass.async_add_executor_job(filepath.unlink, True)
+                if self.backend is not None:
+                    await self.hass.async_add_executor_job(self.backend.delete_container, filename)
+                else:
+                    await self.hass.async_add_executor_job(filepath.unlink, True)
+                    await self._remove_journal(filename)
                 _LOGGER.info("Deleted empty container: %s", filename)
 
                 # Clear cache
                 async with self._cache_lock:
                     self._cache.pop(filename, None)
                     self._cache_mtimes.pop(filename, None)
+                    self._cache_keys.pop(filename, None)
+                self._notify_listeners(filename)
             else:
-                # Update file
-                await self._write_json(filepath, container)
+                if self.backend is not None:
+                    await self.hass.async_add_executor_job(self.backend.delete_profile, filename, profile_name)
+                elif self.journal_enabled:
+                    await self._append_journal(filename, {"op": OP_DELETE_PROFILE, "profile": profile_name})
+                else:
+                    # Update file
+                    await self._write_json(filepath, container)
 
                 # Update cache
-                async with self._cache_lock:
-                    self._cache[filename] = container
-                    try:
-                        self._cache_mtimes[filename] = await self.hass.async_add_executor_job(os.path.getmtime, filepath)
-                    except OSError:
-                        self._cache_mtimes[filename] = 0
+                await self._update_cache(filename, filepath, container)
+                await self._maybe_compact(filename)
+                self._notify_listeners(filename)
 
             _LOGGER.info("Profile deleted: %s from %s", profile_name, filename)
             return True
@@ -228,13 +288,20 @@ class StorageManager:
         if force_reload:
             await self.clear_cache()
 
+        if self.backend is not None:
+            try:
+                return await self.hass.async_add_executor_job(self.backend.list_containers, preset_type, prefix)
+            except Exception as e:
+                _LOGGER.error("Error listing profiles: %s", e, exc_info=True)
+                return []
+
         try:
             matches: list[str] = []
 
-            # Normalize optional prefix once (ensure trailing underscore when comparing to meta)
-            norm_prefix_meta = None
-            if prefix:
-                norm_prefix_meta = prefix if prefix.endswith("_") else f"{prefix}_"
+            # Normalize the filters once; each container's keys are precomputed when cached
+            norm_prefix_meta = normalize_prefix(prefix) if prefix else None
+            wanted_preset = normalize_preset_type(preset_type) if preset_type else None
+            wanted_base = prefix_base(norm_prefix_meta) if norm_prefix_meta else None
 
             def _get_files():
                 return list(self.profiles_dir.glob("cronostar_*.json"))
@@ -255,46 +322,15 @@ class StorageManager:
                 if not data:
                     continue
 
-                meta = data.get("meta", {}) if isinstance(data, dict) else {}
-
-                # Check preset filter (prefer meta.preset_type; fall back to root key if needed)
-                if preset_type:
-                    # Normalize preset types via utility so only 'generic_switch' remains canonical for switch family
-                    file_preset = meta.get("preset_type") or data.get("preset_type")
-                    try:
-                        from ..utils.prefix_normalizer import normalize_preset_type
-
-                        normalized_file_preset = normalize_preset_type(str(file_preset or ""))
-                        normalized_requested = normalize_preset_type(str(preset_type))
-                    except Exception:
-                        normalized_file_preset = str(file_preset or "")
-                        normalized_requested = str(preset_type)
-                    if normalized_file_preset != normalized_requested:
-                        continue
+                file_preset, file_prefix, file_base = self._cache_keys.get(filename) or container_filter_keys(filename, data)
 
-                # Check prefix filter (prefer meta.global_prefix)
-                if norm_prefix_meta:
-                    file_prefix = meta.get("global_prefix")
-                    if file_prefix != norm_prefix_meta:
-                        # Fallback to filename-based match only if meta missing
-                        if not file_prefix:
-                            base_noext = filename[:-5] if filename.endswith(".json") else filename
-                            if base_noext.startswith("cronostar_"):
-                                rest = base_noext[len("cronostar_") :]
-                                base_part, sep, _suffix = rest.rpartition("_")
-                                
-                                # Compare base parts without 'cronostar_' prefix
-                                wanted_base = norm_prefix_meta
-                                if wanted_base.startswith("cronostar_"):
-                                    wanted_base = wanted_base[len("cronostar_") :]
-                                wanted_base = wanted_base.rstrip("_")
-                                
-                                if base_part != wanted_base:
-                                    continue
-                            else:
-                                continue
-                        else:
-                            continue
+                # Check preset filter (canonical preset, so only 'generic_switch' remains for the switch family)
+                if wanted_preset and file_preset != wanted_preset:
+                    continue
+
+                # Check prefix filter (prefer meta.global_prefix; filename-based match only if meta missing)
+                if norm_prefix_meta and file_prefix != norm_prefix_meta and (file_prefix or file_base != wanted_base):
+                    continue
 
                 matches.append(filename)
 
@@ -334,6 +370,7 @@ class StorageManager:
         async with self._cache_lock:
             self._cache.clear()
             self._cache_mtimes.clear()
+            self._cache_keys.clear()
             _LOGGER.info("Profile cache cleared")
 
     async def get_cached_containers(
@@ -350,49 +387,25 @@ class StorageManager:
         Returns:
             List of (filename, container) tuples from cache matching the filters.
         """
-        norm_prefix = None
-        wanted_base = None
-        if global_prefix:
-            norm_prefix = global_prefix if global_prefix.endswith("_") else f"{global_prefix}_"
-            wanted_base = norm_prefix
-            if wanted_base.startswith("cronostar_"):
-                wanted_base = wanted_base[len("cronostar_") :]
-            wanted_base = wanted_base.rstrip("_")
+        norm_prefix = normalize_prefix(global_prefix) if global_prefix else None
+        wanted_base = prefix_base(norm_prefix) if norm_prefix else None
+        wanted_preset = normalize_preset_type(preset_type) if preset_type else None
 
         async with self._cache_lock:
             results: list[tuple[str, dict]] = []
             for fname, container in self._cache.items():
                 if not isinstance(container, dict):
                     continue
-                meta = container.get("meta", {}) if isinstance(container, dict) else {}
-                
-                # Filter by preset_type if provided
-                if preset_type:
-                    # Normalize preset types for comparison
-                    file_preset = meta.get("preset_type") or container.get("preset_type")
-                    if file_preset != preset_type:
-                        # Fallback normalization check
-                        try:
-                            from ..utils.prefix_normalizer import normalize_preset_type
-                            if normalize_preset_type(str(file_preset or "")) != normalize_preset_type(str(preset_type)):
-                                continue
-                        except Exception:
-                            continue
-
-                # Filter by global_prefix if provided
-                if norm_prefix:
-                    file_prefix = meta.get("global_prefix")
-                    if file_prefix != norm_prefix:
-                        # Fallback to filename-based match if meta prefix is missing or different
-                        # (Handles legacy files or prefix changes)
-                        base_noext = fname[:-5] if fname.endswith(".json") else fname
-                        if base_noext.startswith("cronostar_"):
-                            rest = base_noext[len("cronostar_") :]
-                            base_part, _sep, _suffix = rest.rpartition("_")
-                            if base_part != wanted_base:
-                                continue
-                        else:
-                            continue
+                file_preset, file_prefix, file_base = self._cache_keys.get(fname) or container_filter_keys(fname, container)
+
+                # Filter by canonical preset type if provided
+                if wanted_preset and file_preset != wanted_preset:
+                    continue
+
+                # Filter by global_prefix if provided, falling back to the filename when meta
+                # prefix is missing or different (handles legacy files or prefix changes)
+                if norm_prefix and file_prefix != norm_prefix and file_base != wanted_base:
+                    continue
 
                 results.append((fname, container))
 
@@ -401,8 +414,6 @@ class StorageManager:
     async def update_active_profile(self, preset_type: str, global_prefix: str, active_profile: str) -> bool:
         """Update the active profile in the container metadata."""
         try:
-            from ..utils.filename_builder import build_profile_filename
-
             filename = build_profile_filename(preset_type, global_prefix)
             filepath = self.profiles_dir / filename
 
@@ -410,19 +421,19 @@ class StorageManager:
             if not container:
                 return False
 
-            container.setdefault("meta", {})
-            container["meta"]["last_active_profile"] = active_profile
-            container["meta"]["updated_at"] = datetime.now().isoformat()
+            meta_update = {"last_active_profile": active_profile, "updated_at": datetime.now().isoformat()}
+            container.setdefault("meta", {}).update(meta_update)
 
-            await self._write_json(filepath, container)
+            if self.backend is not None:
+                await self.hass.async_add_executor_job(self.backend.update_meta, filename, meta_update)
+            elif self.journal_enabled:
+                await self._append_journal(filename, {"op": OP_UPDATE_META, "meta": meta_update})
+            else:
+                await self._write_json(filepath, container)
 
             # Update cache
-            async with self._cache_lock:
-                self._cache[filename] = container
-                try:
-                    self._cache_mtimes[filename] = await self.hass.async_add_executor_job(os.path.getmtime, filepath)
-                except OSError:
-                    self._cache_mtimes[filename] = 0
+            await self._update_cache(filename, filepath, container)
+            await self._maybe_compact(filename)
 
             _LOGGER.debug("Updated active profile to '%s' in %s", active_profile, filename)
             return True
@@ -433,8 +444,6 @@ class StorageManager:
     async def update_enabled_state(self, preset_type: str, global_prefix: str, is_enabled: bool) -> bool:
         """Update the enabled state in the container metadata."""
         try:
-            from ..utils.filename_builder import build_profile_filename
-
             filename = build_profile_filename(preset_type, global_prefix)
             filepath = self.profiles_dir / filename
 
@@ -442,19 +451,19 @@ class StorageManager:
             if not container:
                 return False
 
-            container.setdefault("meta", {})
-            container["meta"]["is_enabled"] = is_enabled
-            container["meta"]["updated_at"] = datetime.now().isoformat()
+            meta_update = {"is_enabled": is_enabled, "updated_at": datetime.now().isoformat()}
+            container.setdefault("meta", {}).update(meta_update)
 
-            await self._write_json(filepath, container)
+            if self.backend is not None:
+                await self.hass.async_add_executor_job(self.backend.update_meta, filename, meta_update)
+            elif self.journal_enabled:
+                await self._append_journal(filename, {"op": OP_UPDATE_META, "meta": meta_update})
+            else:
+                await self._write_json(filepath, container)
 
             # Update cache
-            async with self._cache_lock:
-                self._cache[filename] = container
-                try:
-                    self._cache_mtimes[filename] = await self.hass.async_add_executor_job(os.path.getmtime, filepath)
-                except OSError:
-                    self._cache_mtimes[filename] = 0
+            await self._update_cache(filename, filepath, container)
+            await self._maybe_compact(filename)
 
             _LOGGER.debug("Updated enabled state to '%s' in %s", is_enabled, filename)
             return True
@@ -484,11 +493,23 @@ class StorageManager:
             deleted_any = False
             for filename in files_to_delete:
                 filepath = self.profiles_dir / filename
+                if self.backend is not None:
+                    if await self.hass.async_add_executor_job(self.backend.delete_container, filename):
+                        async with self._cache_lock:
+                            self._cache.pop(filename, None)
+                            self._cache_mtimes.pop(filename, None)
+                            self._cache_keys.pop(filename, None)
+                        deleted_any = True
+                        _LOGGER.info("Deleted controller container: %s", filename)
+                    continue
+
                 if await self.hass.async_add_executor_job(filepath.exists):
                     await self.hass.async_add_executor_job(filepath.unlink)
+                    await self._remove_journal(filename)
                     async with self._cache_lock:
                         self._cache.pop(filename, None)
                         self._cache_mtimes.pop(filename, None)
+                        self._cache_keys.pop(filename, None)
                     deleted_any = True
                     _LOGGER.info("Deleted controller file: %s", filename)
 
@@ -497,16 +518,24 @@ class StorageManager:
             _LOGGER.error("Error deleting controller files for %s: %s", global_prefix, e)
             return False
 
-    async def _load_container(self, filepath: Path) -> dict:
+    async def _load_container(self, filepath: Path, with_journal: bool | None = None) -> dict:
         """
         Load profile container from disk
 
         Args:
             filepath: File path
+            with_journal: Replay pending journal records (defaults to journal_enabled)
 
         Returns:
             Profile container or empty dict
         """
+        if self.backend is not None:
+            try:
+                return await self.hass.async_add_executor_job(self.backend.read_container, filepath.name)
+            except Exception as e:
+                _LOGGER.error("Error loading %s: %s", filepath.name, e, exc_info=True)
+                return {}
+
         if not await self.hass.async_add_executor_job(filepath.exists):
             return {}
 
@@ -519,6 +548,9 @@ class StorageManager:
                 _LOGGER.warning("Invalid container format in %s", filepath.name)
                 return {}
 
+            if self.journal_enabled if with_journal is None else with_journal:
+                data = await self._replay_journal(filepath.name, data)
+
             return data
 
         except json.JSONDecodeError as e:
@@ -528,6 +560,304 @@ class StorageManager:
             _LOGGER.error("Error loading %s: %s", filepath.name, e, exc_info=True)
             return {}
 
+    @callback
+    def async_add_listener(self, update_callback: Callable[[str, dict | None], None]) -> Callable[[], None]:
+        """
+        Register a callback invoked with the new container after every profile save or delete
+
+        Args:
+            update_callback: Callback receiving the container filename and its cached
+                container (None when the container was deleted)
+
+        Returns:
+            Function removing the listener
+        """
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    def _notify_listeners(self, filename: str) -> None:
+        """Push the cached container of a mutated file to all listeners"""
+        container = self._cache.get(filename)
+        for update_callback in list(self._listeners):
+            try:
+                update_callback(filename, container)
+            except Exception as e:
+                _LOGGER.error("Error in storage listener: %s", e)
+
+    async def _update_cache(self, filename: str, filepath: Path, container: dict) -> None:
+        """Store a freshly written container in the cache"""
+        async with self._cache_lock:
+            self._cache[filename] = compact_container(container)
+            self._cache_keys[filename] = container_filter_keys(filename, container)
+            try:
+                self._cache_mtimes[filename] = await self.hass.async_add_executor_job(self._get_mtime, filepath)
+            except OSError:
+                self._cache_mtimes[filename] = 0
+
+    def _get_mtime(self, filepath: Path) -> float:
+        """Return the container mtime, including its journal when journaling (blocking)"""
+        if self.backend is not None:
+            return self.backend.get_mtime(filepath.name)
+        mtime = os.path.getmtime(filepath)
+        if self.journal_enabled:
+            journal_stat = self._journal.stat(filepath.name)
+            if journal_stat:
+                mtime = max(mtime, journal_stat[1])
+        return mtime
+
+    # ------------------------------------------------------------------
+    # Journal
+    # ------------------------------------------------------------------
+
+    async def _replay_journal(self, filename: str, data: dict) -> dict:
+        """Apply pending journal records onto a freshly read container"""
+        try:
+            records = await self.hass.async_add_executor_job(self._journal.read, filename)
+        except Exception as e:
+            _LOGGER.warning("Could not read journal for %s: %s", filename, e)
+            return data
+
+        if records:
+            data = ProfileJournal.replay(data, records)
+            journal_stat = await self.hass.async_add_executor_job(self._journal.stat, filename)
+            self._journal_state[filename] = {
+                "records": len(records),
+                "bytes": journal_stat[0] if journal_stat else 0,
+                "since": self._record_timestamp(records[0]),
+            }
+            _LOGGER.debug("Replayed %d journal records onto %s", len(records), filename)
+        return data
+
+    async def _append_journal(self, filename: str, record: dict) -> None:
+        """Append a mutation record to the container journal"""
+        async with self._journal_lock:
+            size = await self.hass.async_add_executor_job(self._journal.append, filename, record)
+
+        state = self._journal_state.setdefault(filename, {"records": 0, "bytes": 0, "since": time.time()})
+        state["records"] += 1
+        state["bytes"] = size
+
+    async def _remove_journal(self, filename: str) -> None:
+        """Drop the container journal (container deleted)"""
+        self._journal_state.pop(filename, None)
+        try:
+            await self.hass.async_add_executor_job(self._journal.remove, filename)
+        except OSError as e:
+            _LOGGER.warning("Could not remove journal for %s: %s", filename, e)
+
+    async def _maybe_compact(self, filename: str) -> None:
+        """Compact the container journal if it crossed a size or age threshold"""
+        state = self._journal_state.get(filename)
+        if state and self._journal_due(state):
+            await self.async_compact(filename)
+
+    @staticmethod
+    def _journal_due(state: dict) -> bool:
+        """Return True if a journal must be folded into its container"""
+        return (
+            state["records"] >= JOURNAL_MAX_RECORDS
+            or state["bytes"] >= JOURNAL_MAX_BYTES
+            or time.time() - state["since"] >= JOURNAL_MAX_AGE_SECONDS
+        )
+
+    @staticmethod
+    def _record_timestamp(record: dict) -> float:
+        """Return the epoch timestamp of a journal record (now if unparsable)"""
+        try:
+            return datetime.fromisoformat(record["ts"]).timestamp()
+        except (KeyError, TypeError, ValueError):
+            return time.time()
+
+    async def async_compact(self, filename: str | None = None) -> int:
+        """
+        Fold pending journal records into the main container file(s)
+
+        Runs regardless of journal_enabled so that logs left behind by a
+        previous journaled session are never lost.
+
+        Args:
+            filename: Container to compact (all journaled containers if None)
+
+        Returns:
+            Number of containers compacted
+        """
+        if self.backend is not None:
+            # Journals only exist for the JSON layout
+            return 0
+
+        if filename:
+            filenames = [filename]
+        else:
+            try:
+                filenames = await self.hass.async_add_executor_job(self._journal.list_journaled)
+            except OSError as e:
+                _LOGGER.warning("Could not list journals: %s", e)
+                return 0
+
+        compacted = 0
+        for fname in filenames:
+            filepath = self.profiles_dir / fname
+            try:
+                async with self._journal_lock:
+                    if not await self.hass.async_add_executor_job(self._journal.stat, fname):
+                        continue
+
+                    container = await self._load_container(filepath, with_journal=True)
+                    if container:
+                        if self.enable_backups:
+                            await self._create_backup(filepath)
+                        await self._write_json(filepath, container)
+                    await self.hass.async_add_executor_job(self._journal.remove, fname)
+                    self._journal_state.pop(fname, None)
+
+                if container:
+                    await self._update_cache(fname, filepath, container)
+                compacted += 1
+                _LOGGER.debug("Compacted journal into %s", fname)
+            except Exception as e:
+                _LOGGER.error("Error compacting journal for %s: %s", fname, e, exc_info=True)
+
+        return compacted
+
+    async def async_compact_due(self) -> int:
+        """Compact every journal that crossed a size or age threshold"""
+        due = [fname for fname, state in list(self._journal_state.items()) if self._journal_due(state)]
+        compacted = 0
+        for fname in due:
+            compacted += await self.async_compact(fname)
+        return compacted
+
+    @callback
+    def async_start(self) -> None:
+        """Check journals periodically, so an idle container is folded once it ages out"""
+        if self._unsub_compact is None:
+            self._unsub_compact = async_track_time_interval(
+                self.hass, self._async_compact_interval, timedelta(seconds=JOURNAL_COMPACT_INTERVAL_SECONDS)
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the periodic journal check"""
+        if self._unsub_compact is not None:
+            self._unsub_compact()
+            self._unsub_compact = None
+
+    async def _async_compact_interval(self, _now) -> None:
+        if self._journal_state:
+            await self.async_compact_due()
+
+    async def get_history(self, filename: str) -> list[dict]:
+        """
+        Return the pending (not yet compacted) edit history of a container
+
+        Args:
+            filename: Container filename
+
+        Returns:
+            Journal records in append order
+        """
+        try:
+            return await self.hass.async_add_executor_job(self._journal.read, filename)
+        except Exception as e:
+            _LOGGER.warning("Could not read journal for %s: %s", filename, e)
+            return []
+
+    # ------------------------------------------------------------------
+    # Backend
+    # ------------------------------------------------------------------
+
+    @property
+    def backend_name(self) -> str:
+        """Return the active storage backend name"""
+        return STORAGE_BACKEND_SQLITE if self.backend is not None else STORAGE_BACKEND_JSON
+
+    async def async_set_backend(self, backend: str) -> bool:
+        """
+        Switch between the JSON file layout and the SQLite store
+
+        Switching to SQLite imports the JSON containers into an empty database;
+        switching back exports the database to the JSON layout and drops it, so
+        the active backend is always the single source of truth.
+
+        Args:
+            backend: STORAGE_BACKEND_JSON or STORAGE_BACKEND_SQLITE
+
+        Returns:
+            True if the requested backend is active
+        """
+        if backend == self.backend_name:
+            return True
+
+        try:
+            if backend == STORAGE_BACKEND_SQLITE:
+                # Optional backend: sqlite3 is only loaded when it is selected
+                from .sqlite_store import SQLITE_DB_FILENAME, SqliteProfileStore
+
+                store = SqliteProfileStore(self.profiles_dir / SQLITE_DB_FILENAME)
+                await self.hass.async_add_executor_job(store.open)
+                if not await self.hass.async_add_executor_job(store.list_containers):
+                    # Fold pending journals so the import sees the latest containers
+                    await self.async_compact()
+                    imported = await self.hass.async_add_executor_job(store.import_json_dir, self.profiles_dir)
+                    _LOGGER.info("Imported %d profile container(s) into %s", imported, SQLITE_DB_FILENAME)
+                self.backend = store
+            else:
+                store, self.backend = self.backend, None
+                exported = await self.hass.async_add_executor_job(store.export_json_dir, self.profiles_dir)
+                await self.hass.async_add_executor_job(store.close)
+                await self.hass.async_add_executor_job(self._remove_database, store.db_path)
+                _LOGGER.info("Exported %d profile container(s) to JSON files", exported)
+        except Exception as e:
+            _LOGGER.error("Error switching storage backend to %s: %s", backend, e, exc_info=True)
+            return False
+
+        # Re-populate the cache from the new backend
+        for filename in await self.list_profiles(force_reload=True):
+            await self.load_profile_cached(filename)
+
+        _LOGGER.info("Storage backend: %s", self.backend_name)
+        return True
+
+    async def async_export_json(self, filenames: list[str] | None = None, target_dir: str | Path | None = None) -> int:
+        """
+        Export containers to the JSON layout
+
+        Args:
+            filenames: Containers to export (all if None)
+            target_dir: Destination directory (defaults to the profiles directory)
+
+        Returns:
+            Number of containers exported
+        """
+        target = Path(target_dir) if target_dir else self.profiles_dir
+        if filenames is None:
+            filenames = await self.list_profiles()
+
+        exported = 0
+        for filename in filenames:
+            container = await self.load_profile_cached(filename, force_reload=True)
+            if container:
+                await self._write_json(target / filename, container)
+                exported += 1
+        return exported
+
+    async def async_close(self) -> None:
+        """Release the storage backend (shutdown)"""
+        if self.backend is not None:
+            await self.hass.async_add_executor_job(self.backend.close)
+
+    @staticmethod
+    def _remove_database(db_path: Path) -> None:
+        """Remove a SQLite database with its WAL side files (blocking)"""
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
     async def _write_json(self, filepath: Path, data: dict) -> None:
         """
         Write JSON data to disk
@@ -537,8 +867,11 @@ class StorageManager:
             data: Data to write
         """
         try:
-            json_str = json.dumps(data, indent=2, ensure_ascii=False)
-            await self.hass.async_add_executor_job(filepath.write_text, json_str, "utf-8")
+            with self.metrics.timer("storage.write_json"):
+                json_str = json.dumps(data, indent=2, ensure_ascii=False, default=json_default)
+                await self.hass.async_add_executor_job(filepath.write_text, json_str, "utf-8")
+            self.metrics.increment("storage.writes")
+            self.metrics.increment("storage.write_bytes", len(json_str.encode("utf-8")))
         except Exception as e:
             _LOGGER.error("Error writing %s: %s", filepath.name, e, exc_info=True)
             raise
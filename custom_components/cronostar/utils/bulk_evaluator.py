@@ -0,0 +1,143 @@
+# custom_components/cronostar/utils/bulk_evaluator.py
+"""
+Bulk Evaluator - scheduled values of many controllers at many timestamps
+Stacks compiled schedule tables and evaluates (controller, timestamp) pairs with bisect, or NumPy when installed
+"""
+
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+
+from .schedule_table import DAY_MINUTES, WEEK_MINUTES, ScheduleTable, week_minute
+
+# NumPy is imported on first use (None once found missing) to keep it off the startup path
+_UNLOADED = object()
+np = _UNLOADED
+
+# Key spacing between stacked tables (larger than any table minute)
+_KEY_STRIDE = 2 * WEEK_MINUTES
+
+
+def _numpy():
+    """Return the NumPy module, importing it on first call (None when not installed)"""
+    global np
+    if np is _UNLOADED:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        np = numpy
+    return np
+
+
+def to_local_naive(timestamp: datetime) -> datetime:
+    """Return a timestamp in the local wall-clock time used by the coordinator"""
+    if timestamp.tzinfo is not None:
+        return timestamp.astimezone().replace(tzinfo=None)
+    return timestamp
+
+
+class BulkEvaluator:
+    """Evaluate a fixed set of compiled schedules at arbitrary timestamps
+
+    The pure-Python path returns exactly ScheduleTable.value_at(). The NumPy
+    path replaces the per-pair bisect with one searchsorted over all stacked
+    breakpoints; np.round may differ from round() by 0.01 on half-way values.
+    """
+
+    def __init__(self, tables: Sequence[ScheduleTable], stepped: Sequence[bool], use_numpy: bool = True):
+        """
+        Initialize BulkEvaluator
+
+        Args:
+            tables: Compiled tables, one per controller
+            stepped: Per table, hold values instead of interpolating
+            use_numpy: Use NumPy when it is installed
+        """
+        self.tables = list(tables)
+        self.stepped = list(stepped)
+        self.use_numpy = use_numpy and _numpy() is not None
+        self._stacked = None
+
+    def evaluate(self, pairs: Iterable[tuple[int, datetime]]) -> list[float | None]:
+        """
+        Evaluate (table index, timestamp) pairs
+
+        Args:
+            pairs: Table index and timestamp (naive local or timezone-aware)
+
+        Returns:
+            Value per pair, None where the table is empty
+        """
+        indices = []
+        minutes = []
+        for index, timestamp in pairs:
+            local = to_local_naive(timestamp)
+            indices.append(index)
+            minutes.append(week_minute(local) if self.tables[index].period == WEEK_MINUTES else local.hour * 60 + local.minute)
+
+        if self.use_numpy and indices:
+            return self._evaluate_numpy(indices, minutes)
+        return [self.tables[i].value_at(m, stepped=self.stepped[i]) for i, m in zip(indices, minutes, strict=True)]
+
+    def evaluate_grid(self, timestamps: Sequence[datetime]) -> list[list[float | None]]:
+        """
+        Evaluate every table at every timestamp
+
+        Args:
+            timestamps: Timestamps (naive local or timezone-aware)
+
+        Returns:
+            One row per table, one value per timestamp
+        """
+        count = len(timestamps)
+        flat = self.evaluate((index, timestamp) for index in range(len(self.tables)) for timestamp in timestamps)
+        return [flat[row * count : (row + 1) * count] for row in range(len(self.tables))]
+
+    def _stack(self):
+        keys, values, starts, ends, periods = [], [], [], [], []
+        for index, table in enumerate(self.tables):
+            starts.append(len(keys))
+            keys.extend(index * _KEY_STRIDE + minute for minute in table.minutes)
+            values.extend(table.values)
+            ends.append(len(keys))
+            periods.append(table.period or DAY_MINUTES)
+        return (
+            np.asarray(keys, dtype=np.int64),
+            np.asarray(values, dtype=np.float64),
+            np.asarray(starts, dtype=np.int64),
+            np.asarray(ends, dtype=np.int64),
+            np.asarray(periods, dtype=np.int64),
+            np.asarray(self.stepped, dtype=bool),
+        )
+
+    def _evaluate_numpy(self, indices: list[int], minutes: list[int]) -> list[float | None]:
+        if self._stacked is None:
+            self._stacked = self._stack()
+        keys, values, starts, ends, periods, stepped = self._stacked
+        if not len(keys):
+            return [None] * len(indices)
+
+        idx = np.asarray(indices, dtype=np.int64)
+        minute = np.asarray(minutes, dtype=np.int64)
+        start, end, period = starts[idx], ends[idx], periods[idx]
+        base = idx * _KEY_STRIDE
+
+        # Previous point (last at or before the minute), wrapping to the table's final point
+        pos = np.searchsorted(keys, base + minute, side="right") - 1
+        pos = np.where(pos < start, end - 1, pos)
+        nxt = np.where(pos + 1 >= end, start, pos + 1)
+        empty = end == start
+        pos = np.clip(pos, 0, len(keys) - 1)
+        nxt = np.clip(nxt, 0, len(keys) - 1)
+
+        t1 = keys[pos] - base
+        t2 = keys[nxt] - base
+        v1 = values[pos]
+        v2 = values[nxt]
+        span = np.mod(t2 - t1, period)
+        elapsed = np.mod(minute - t1, period)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            interpolated = np.round(v1 + (v2 - v1) * (elapsed / span), 2)
+        result = np.where(stepped[idx] | (t1 == minute) | (span == 0), v1, interpolated)
+
+        return [None if is_empty else value for is_empty, value in zip(empty.tolist(), result.tolist(), strict=True)]
@@ -0,0 +1,231 @@
+# custom_components/cronostar/utils/dispatch_queue.py
+"""
+Dispatch Queue - rate-limited target service calls
+Smooths the burst of calls fired when many controllers change at the same minute
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import Callable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from ..const import (
+    CONF_DISPATCH_BURST,
+    CONF_DISPATCH_JITTER,
+    CONF_DISPATCH_RATE,
+    DEFAULT_DISPATCH_BURST,
+    DEFAULT_DISPATCH_JITTER,
+    DEFAULT_DISPATCH_RATE,
+    DOMAIN,
+)
+from .metrics import MetricsRegistry, get_metrics
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds a target integration may take to carry out a call before it counts as failed
+DISPATCH_TIMEOUT = 30.0
+
+# (entity_id, domain, service, data, done callback)
+_Job = tuple[str, str, str, dict, Callable[[Exception | None], None] | None]
+
+
+class _TokenBucket:
+    """Token bucket of one integration with its FIFO of calls, drained by a single task"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.jobs: deque[tuple[float, _Job]] = deque()
+        self.drain: asyncio.Task | None = None
+        self.pending = 0
+
+    def reserve(self) -> float:
+        """Take a token and return the seconds until it is available"""
+        now = time.monotonic()
+        self.tokens = min(float(self.burst), self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class DispatchQueue:
+    """Per-integration rate limiter for the service calls applying schedules"""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        rate: float = DEFAULT_DISPATCH_RATE,
+        burst: int = DEFAULT_DISPATCH_BURST,
+        jitter: float = DEFAULT_DISPATCH_JITTER,
+        metrics: MetricsRegistry | None = None,
+        timeout: float = DISPATCH_TIMEOUT,
+    ):
+        """
+        Initialize DispatchQueue
+
+        Args:
+            hass: Home Assistant instance
+            rate: Calls per second per integration (0 disables limiting)
+            burst: Calls allowed back to back before limiting starts
+            jitter: Max random delay (s) added to throttled calls
+            metrics: Registry receiving queue depth and wait time
+            timeout: Seconds to wait for the target integration to complete a call
+        """
+        self.hass = hass
+        self.metrics = metrics if metrics is not None else get_metrics(hass)
+        self.timeout = timeout
+        self._buckets: dict[str, _TokenBucket] = {}
+        self.configure(rate, burst, jitter)
+
+    def configure(self, rate: float, burst: int, jitter: float) -> None:
+        """Apply new limits (buckets restart full; calls already waiting keep their old bucket)"""
+        self.rate = max(0.0, float(rate or 0))
+        self.burst = max(1, int(burst or 1))
+        self.jitter = max(0.0, float(jitter or 0))
+        self._buckets = {}
+
+    def key_for(self, entity_id: str) -> str:
+        """Return the integration providing an entity (its domain when not registered)"""
+        entry = er.async_get(self.hass).async_get(entity_id)
+        platform = getattr(entry, "platform", None)
+        return platform if isinstance(platform, str) else entity_id.split(".")[0]
+
+    def queue_depth(self, key: str | None = None) -> int:
+        """Return the calls waiting for one integration, or for all of them"""
+        if key is not None:
+            bucket = self._buckets.get(key)
+            return bucket.pending if bucket else 0
+        return sum(bucket.pending for bucket in self._buckets.values())
+
+    def async_enqueue(
+        self,
+        entity_id: str,
+        domain: str,
+        service: str,
+        data: dict,
+        done: Callable[[Exception | None], None] | None = None,
+    ) -> None:
+        """
+        Queue a service call for a target entity and return without waiting for it
+
+        Args:
+            entity_id: Target entity (selects the rate limit bucket)
+            domain: Service domain
+            service: Service name
+            data: Service data
+            done: Callback receiving None once the call went through, or the exception it raised
+        """
+        job = (entity_id, domain, service, data, done)
+        if not self.rate:
+            self.hass.async_create_background_task(self._async_run(job), f"cronostar dispatch {entity_id}")
+            return
+
+        key = self.key_for(entity_id)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _TokenBucket(self.rate, self.burst)
+
+        bucket.jobs.append((time.monotonic(), job))
+        bucket.pending += 1
+        self._publish_depth(key, bucket)
+        if bucket.drain is None:
+            bucket.drain = self.hass.async_create_background_task(self._async_drain(key, bucket), f"cronostar dispatch {key}")
+
+    async def async_call(self, entity_id: str, domain: str, service: str, data: dict) -> None:
+        """
+        Call a service for a target entity, waiting for its integration's turn
+
+        Args:
+            entity_id: Target entity (selects the rate limit bucket)
+            domain: Service domain
+            service: Service name
+            data: Service data
+
+        Raises:
+            Exception: Whatever the service call raised
+        """
+        if not self.rate:
+            await self._async_service_call(domain, service, data)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+
+        def _done(error: Exception | None) -> None:
+            if future.done():
+                return
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+
+        self.async_enqueue(entity_id, domain, service, data, _done)
+        await future
+
+    async def _async_drain(self, key: str, bucket: _TokenBucket) -> None:
+        """Send the queued calls of one integration in order, at its rate"""
+        try:
+            while bucket.jobs:
+                queued, job = bucket.jobs.popleft()
+                delay = bucket.reserve()
+                if delay > 0:
+                    delay += random.uniform(0, self.jitter)
+                    _LOGGER.debug("Throttling %s.%s for %s (%s): %.2fs", job[1], job[2], job[0], key, delay)
+                    await asyncio.sleep(delay)
+                self.metrics.observe("dispatch.wait", (time.monotonic() - queued) * 1000)
+                try:
+                    await self._async_run(job)
+                finally:
+                    bucket.pending -= 1
+                    self._publish_depth(key, bucket)
+        finally:
+            bucket.drain = None
+
+    async def _async_run(self, job: _Job) -> None:
+        """Make one queued call and report its outcome"""
+        entity_id, domain, service, data, done = job
+        error = None
+        try:
+            await self._async_service_call(domain, service, data)
+        except Exception as e:  # noqa: BLE001
+            error = e
+
+        if done is None:
+            if error is not None:
+                _LOGGER.error("Service call %s.%s for '%s' failed: %s", domain, service, entity_id, error)
+            return
+        try:
+            done(error)
+        except Exception as e:  # noqa: BLE001
+            _LOGGER.error("Error in dispatch callback for '%s': %s", entity_id, e)
+
+    async def _async_service_call(self, domain: str, service: str, data: dict) -> None:
+        # Blocking, so errors raised by the target integration (device offline, rejected
+        # value, timeout) reach the caller; callers run it in a background worker
+        async with asyncio.timeout(self.timeout):
+            await self.hass.services.async_call(domain, service, data, blocking=True)
+
+    def _publish_depth(self, key: str, bucket: _TokenBucket) -> None:
+        self.metrics.set_gauge(f"dispatch.queue_depth.{key}", bucket.pending)
+        self.metrics.set_gauge("dispatch.queue_depth", self.queue_depth())
+
+
+def get_dispatch_queue(hass: HomeAssistant) -> DispatchQueue:
+    """Return the integration-wide DispatchQueue, creating it from the global options on first use"""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    queue = domain_data.get("dispatch_queue")
+    if queue is None:
+        config = domain_data.get("global_config", {})
+        queue = domain_data["dispatch_queue"] = DispatchQueue(
+            hass,
+            config.get(CONF_DISPATCH_RATE, DEFAULT_DISPATCH_RATE),
+            config.get(CONF_DISPATCH_BURST, DEFAULT_DISPATCH_BURST),
+            config.get(CONF_DISPATCH_JITTER, DEFAULT_DISPATCH_JITTER),
+        )
+    return queue
@@ -175,12 +175,15 @@ def log_operation(operation: str, success: bool, **kwargs):
         **kwargs: Additional context to log
     """
     level = logging.INFO if success else logging.WARNING
-    status = "✓" if success else "✗"
 
-    context = " ".join(f"{k}={v}" for k, v in kwargs.items())
-    message = f"{status} {operation}"
+    # Skip building the message entirely when the record would be dropped
+    if not _LOGGER.isEnabledFor(level):
+        return
 
-    if context:
-        message += f" ({context})"
+    status = "✓" if success else "✗"
 
-    _LOGGER.log(level, message)
+    if kwargs:
+        context = " ".join(f"{k}={v}" for k, v in kwargs.items())
+        _LOGGER.log(level, "%s %s (%s)", status, operation, context)
+    else:
+        _LOGGER.log(level, "%s %s", status, operation)
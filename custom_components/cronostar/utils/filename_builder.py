@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 
 from .prefix_normalizer import normalize_prefix
 
@@ -10,7 +11,12 @@ def build_profile_filename(preset_type: str, global_prefix: str) -> str:
     Build profile filename using the correct prefix and preset.
     Standard: cronostar_<base>_<preset_type>.json
     """
-    prefix_with_underscore = normalize_prefix(global_prefix)
+    return _filename_for_prefix(normalize_prefix(global_prefix))
+
+
+@lru_cache(maxsize=1024)
+def _filename_for_prefix(prefix_with_underscore: str) -> str:
+    """Build the filename for a normalized prefix (memoized)"""
     base = prefix_with_underscore.rstrip("_") or "default"
 
     # Ensure base doesn't start with cronostar_ if we are going to add it
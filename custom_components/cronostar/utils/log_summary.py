@@ -0,0 +1,96 @@
+# custom_components/cronostar/utils/log_summary.py
+"""
+Apply Log Summary - aggregated logging for schedule applications
+Replaces the per-controller, per-minute INFO lines with one periodic summary
+"""
+
+import logging
+import time
+from datetime import timedelta
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from ..const import CONF_LOGGING_ENABLED, DOMAIN
+
+# One summary line per interval across all controllers
+SUMMARY_INTERVAL_SECONDS = 60
+
+
+class ApplyLogSummary:
+    """Collects schedule applications and logs them as a single summary line"""
+
+    def __init__(self, logger: logging.Logger, interval: float = SUMMARY_INTERVAL_SECONDS):
+        """
+        Initialize ApplyLogSummary
+
+        Args:
+            logger: Logger receiving the summary lines
+            interval: Seconds covered by each summary
+        """
+        self._logger = logger
+        self.interval = interval
+        self._applied: dict[str, tuple] = {}
+        self._window_start = time.monotonic()
+        self._unsub_flush: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self, hass: HomeAssistant) -> None:
+        """Flush on a timer, so a window is logged even when no application follows it"""
+        if self._unsub_flush is None:
+            self._unsub_flush = async_track_time_interval(hass, self._async_flush_interval, timedelta(seconds=self.interval))
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the flush timer and log the pending window"""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        self.flush()
+
+    @callback
+    def _async_flush_interval(self, _now) -> None:
+        self.flush()
+
+    def record(self, entity_id: str, value, profile: str, service: str) -> None:
+        """
+        Record a successful application (latest value per entity wins)
+
+        Args:
+            entity_id: Target entity
+            value: Applied value
+            profile: Active profile
+            service: Service called
+        """
+        self._applied[entity_id] = (value, profile, service)
+
+    def flush(self) -> None:
+        """Emit the summary for the current window and start a new one"""
+        applied = self._applied
+        elapsed = time.monotonic() - self._window_start
+        self._applied = {}
+        self._window_start = time.monotonic()
+
+        if not applied or not self._logger.isEnabledFor(logging.INFO):
+            return
+
+        self._logger.info("🔷 [COORDINATOR] Applied schedules to %d entities in the last %ds", len(applied), int(elapsed))
+
+        if self._logger.isEnabledFor(logging.DEBUG):
+            details = ", ".join(f"{entity_id}={value} ({profile})" for entity_id, (value, profile, _service) in sorted(applied.items()))
+            self._logger.debug("🔷 [COORDINATOR] Applied values: %s", details)
+
+
+def get_apply_summary(hass: HomeAssistant, logger: logging.Logger) -> ApplyLogSummary:
+    """Return the integration-wide ApplyLogSummary, creating and starting it on first use"""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    summary = domain_data.get("apply_log_summary")
+    if summary is None:
+        summary = domain_data["apply_log_summary"] = ApplyLogSummary(logger)
+        summary.async_start(hass)
+    return summary
+
+
+def is_global_logging_enabled(hass: HomeAssistant) -> bool:
+    """Return True if detailed logging is enabled in the global options"""
+    return bool(hass.data.get(DOMAIN, {}).get("global_config", {}).get(CONF_LOGGING_ENABLED, False))
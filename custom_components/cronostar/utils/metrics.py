@@ -0,0 +1,162 @@
+# custom_components/cronostar/utils/metrics.py
+"""
+Runtime metrics for CronoStar
+Lightweight counters and latency timers exposed via diagnostics and sensors
+"""
+
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextlib import contextmanager
+from functools import wraps
+
+from homeassistant.core import HomeAssistant
+
+from ..const import DOMAIN
+
+# Samples kept per timer (sliding window used for percentiles)
+TIMER_WINDOW = 512
+
+
+class MetricsRegistry:
+    """Counters, gauges and sliding-window timers (milliseconds)"""
+
+    def __init__(self, window: int = TIMER_WINDOW, parent: "MetricsRegistry | None" = None):
+        """
+        Initialize MetricsRegistry
+
+        Args:
+            window: Number of samples kept per timer
+            parent: Registry also receiving every sample (e.g. the integration-wide one)
+        """
+        self._window = window
+        self._parent = parent
+        self._counters: dict[str, float] = {}
+        self._gauges: dict[str, float] = {}
+        self._timers: dict[str, deque] = {}
+        self._timer_totals: dict[str, int] = {}
+
+    def increment(self, name: str, amount: float = 1) -> None:
+        """Increment a counter"""
+        self._counters[name] = self._counters.get(name, 0) + amount
+        if self._parent is not None:
+            self._parent.increment(name, amount)
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set a gauge to its current value (e.g. a queue depth)"""
+        self._gauges[name] = value
+        if self._parent is not None:
+            self._parent.set_gauge(name, value)
+
+    def observe(self, name: str, duration_ms: float) -> None:
+        """Record a duration sample"""
+        samples = self._timers.get(name)
+        if samples is None:
+            samples = self._timers[name] = deque(maxlen=self._window)
+        samples.append(duration_ms)
+        self._timer_totals[name] = self._timer_totals.get(name, 0) + 1
+        if self._parent is not None:
+            self._parent.observe(name, duration_ms)
+
+    @contextmanager
+    def timer(self, name: str):
+        """Time the enclosed block (also valid around awaits)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, (time.perf_counter() - start) * 1000)
+
+    def wrap_async(self, name: str, func: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+        """Return a coroutine function recording each call under a timer"""
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            with self.timer(name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    def phases(self, name: str) -> "PhaseTimer":
+        """Return a PhaseTimer recording '<name>.<phase>' and '<name>' timers"""
+        return PhaseTimer(self, name)
+
+    def counter(self, name: str) -> float:
+        """Return a counter value (0 if never incremented)"""
+        return self._counters.get(name, 0)
+
+    def gauge(self, name: str) -> float:
+        """Return a gauge value (0 if never set)"""
+        return self._gauges.get(name, 0)
+
+    def percentile(self, name: str, pct: float) -> float | None:
+        """Return a percentile (nearest-rank) of a timer or None without samples"""
+        samples = self._timers.get(name)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        rank = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+        return ordered[rank]
+
+    def ratio(self, numerator: str, denominator_extra: str) -> float | None:
+        """Return numerator / (numerator + denominator_extra) for two counters, e.g. a hit ratio"""
+        hits = self.counter(numerator)
+        total = hits + self.counter(denominator_extra)
+        if not total:
+            return None
+        return hits / total
+
+    def timer_stats(self, name: str) -> dict | None:
+        """Return count and p50/p95/max/mean (ms) of a timer or None without samples"""
+        samples = self._timers.get(name)
+        if not samples:
+            return None
+        return {
+            "count": self._timer_totals.get(name, 0),
+            "p50_ms": round(self.percentile(name, 50), 3),
+            "p95_ms": round(self.percentile(name, 95), 3),
+            "max_ms": round(max(samples), 3),
+            "mean_ms": round(sum(samples) / len(samples), 3),
+        }
+
+    def snapshot(self) -> dict:
+        """Return all metrics as a JSON-serializable dict"""
+        timers = {name: self.timer_stats(name) for name, samples in self._timers.items() if samples}
+        return {"counters": dict(self._counters), "gauges": dict(self._gauges), "timers": timers}
+
+    def reset(self) -> None:
+        """Drop all samples and counters"""
+        self._counters.clear()
+        self._gauges.clear()
+        self._timers.clear()
+        self._timer_totals.clear()
+
+
+class PhaseTimer:
+    """Records consecutive phases of an operation without nesting blocks"""
+
+    def __init__(self, registry: MetricsRegistry, name: str):
+        """Start timing"""
+        self._registry = registry
+        self._name = name
+        self._start = self._last = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        """Record the time elapsed since the previous mark as '<name>.<phase>'"""
+        now = time.perf_counter()
+        self._registry.observe(f"{self._name}.{phase}", (now - self._last) * 1000)
+        self._last = now
+
+    def done(self) -> None:
+        """Record the total duration as '<name>'"""
+        self._registry.observe(self._name, (time.perf_counter() - self._start) * 1000)
+
+
+def get_metrics(hass: HomeAssistant) -> MetricsRegistry:
+    """Return the integration-wide MetricsRegistry, creating it on first use"""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    metrics = domain_data.get("metrics")
+    if metrics is None:
+        metrics = domain_data["metrics"] = MetricsRegistry()
+    return metrics
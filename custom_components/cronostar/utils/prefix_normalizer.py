@@ -5,9 +5,13 @@ Ensures consistent prefix handling across the integration
 """
 
 import logging
+import re
+from functools import lru_cache
 
 _LOGGER = logging.getLogger(__name__)
 
+_PREFIX_RE = re.compile(r"^[a-z0-9_]+$")
+
 # Preset type mappings
 PRESET_ALIASES = {
     "thermostat": ["thermostat", "climate", "heating", "hvac"],
@@ -105,7 +109,12 @@ def normalize_preset_type(preset_type: str) -> str:
     if not preset_type:
         return "thermostat"
 
-    normalized_input = str(preset_type).lower().strip()
+    return _canonical_preset_type(str(preset_type).lower().strip())
+
+
+@lru_cache(maxsize=256)
+def _canonical_preset_type(normalized_input: str) -> str:
+    """Resolve a lower-cased preset type (memoized: aliases are logged once per input)"""
     canonical = _PRESET_REVERSE_MAP.get(normalized_input)
 
     if canonical:
@@ -113,7 +122,7 @@ def normalize_preset_type(preset_type: str) -> str:
         if canonical == "switch":
             # Log discrepancy once per process if requested variant isn't 'generic_switch'
             if normalized_input not in ("generic_switch", "generic-switch", "switch_generic"):
-                _LOGGER.warning("Preset discrepancy detected: '%s' normalized to 'generic_switch'", preset_type)
+                _LOGGER.warning("Preset discrepancy detected: '%s' normalized to 'generic_switch'", normalized_input)
             return "generic_switch"
         return canonical
 
@@ -121,7 +130,7 @@ def normalize_preset_type(preset_type: str) -> str:
     if normalized_input in PRESETS_CONFIG:
         return normalized_input
 
-    _LOGGER.debug("Unknown preset type '%s', defaulting to 'thermostat'", preset_type)
+    _LOGGER.debug("Unknown preset type '%s', defaulting to 'thermostat'", normalized_input)
     return "thermostat"
 
 
@@ -277,9 +286,7 @@ def validate_prefix_format(prefix: str) -> tuple[bool, str]:
     check_str = prefix.rstrip("_")
 
     # Check for invalid characters
-    import re
-
-    if not re.match(r"^[a-z0-9_]+$", check_str):
+    if not _PREFIX_RE.match(check_str):
         return (False, "Prefix must contain only lowercase letters, numbers, and underscores")
 
     # Check length
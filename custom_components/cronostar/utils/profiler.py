@@ -0,0 +1,239 @@
+# custom_components/cronostar/utils/profiler.py
+"""
+Integration Profiler - opt-in cProfile/yappi capture for live installations
+Profiles coordinator ticks, service handlers and storage I/O for a bounded window
+"""
+
+import cProfile
+import importlib.util
+import logging
+import pstats
+from datetime import datetime
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+
+from ..const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+PROFILES_PERF_DIR = "cronostar/profiles_perf"
+DEFAULT_DURATION = 60
+MAX_DURATION = 1800
+DEFAULT_TOP_N = 20
+
+ENGINE_AUTO = "auto"
+ENGINE_CPROFILE = "cprofile"
+ENGINE_YAPPI = "yappi"
+
+# Frames from this integration (used to focus the summary)
+_INTEGRATION_PATH = str(Path(__file__).resolve().parent.parent)
+
+
+def _yappi_available() -> bool:
+    return importlib.util.find_spec("yappi") is not None
+
+
+class IntegrationProfiler:
+    """Bounded profiling session
+
+    cProfile only sees the event loop thread (coroutines, callbacks). yappi,
+    when installed, also follows executor threads (storage I/O) and reports
+    coroutine wall time.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        """
+        Initialize IntegrationProfiler
+
+        Args:
+            hass: Home Assistant instance
+        """
+        self.hass = hass
+        self.output_dir = Path(hass.config.path(PROFILES_PERF_DIR))
+        self.engine: str | None = None
+        self.started_at: datetime | None = None
+        self.last_result: dict | None = None
+        self._profiler: cProfile.Profile | None = None
+        self._cancel_timer = None
+        self._top_n = DEFAULT_TOP_N
+
+    @property
+    def running(self) -> bool:
+        """Return True while a session is active"""
+        return self.engine is not None
+
+    def start(self, duration: int = DEFAULT_DURATION, engine: str = ENGINE_AUTO, top_n: int = DEFAULT_TOP_N) -> dict:
+        """
+        Start profiling (auto-stops after duration seconds)
+
+        Args:
+            duration: Window length in seconds (capped at MAX_DURATION)
+            engine: auto, cprofile or yappi
+            top_n: Number of functions in the summary
+
+        Returns:
+            Session info
+        """
+        if self.running:
+            raise HomeAssistantError("Profiling already running")
+
+        if engine == ENGINE_AUTO:
+            engine = ENGINE_YAPPI if _yappi_available() else ENGINE_CPROFILE
+        if engine == ENGINE_YAPPI and not _yappi_available():
+            raise HomeAssistantError("yappi is not installed")
+        if engine not in (ENGINE_CPROFILE, ENGINE_YAPPI):
+            raise HomeAssistantError(f"Unknown profiling engine: {engine}")
+
+        duration = max(1, min(int(duration), MAX_DURATION))
+
+        if engine == ENGINE_YAPPI:
+            import yappi
+
+            yappi.clear_stats()
+            yappi.set_clock_type("wall")
+            yappi.start(builtins=False, profile_threads=True)
+        else:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError as e:
+                # Another profiler already owns the interpreter hook
+                raise HomeAssistantError(f"Unable to start cProfile: {e}") from e
+            self._profiler = profiler
+
+        self.engine = engine
+        self.started_at = datetime.now()
+        self._top_n = top_n
+        self._cancel_timer = async_call_later(self.hass, duration, self._async_timeout)
+
+        _LOGGER.warning("🔬 [PROFILER] Started (%s) for %ss", engine, duration)
+        return {"engine": engine, "duration": duration, "started_at": self.started_at.isoformat()}
+
+    async def _async_timeout(self, _now) -> None:
+        """Stop the session when its window elapses"""
+        self._cancel_timer = None
+        if self.running:
+            await self.async_stop()
+
+    async def async_stop(self, top_n: int | None = None) -> dict:
+        """
+        Stop profiling, write the output file and build the summary
+
+        Args:
+            top_n: Number of functions in the summary (defaults to the start value)
+
+        Returns:
+            Result with output file path and top-N summary
+        """
+        if not self.running:
+            if self.last_result is not None:
+                return self.last_result
+            raise HomeAssistantError("Profiling is not running")
+
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+
+        engine = self.engine
+        stamp = self.started_at.strftime("%Y%m%d_%H%M%S")
+        elapsed = (datetime.now() - self.started_at).total_seconds()
+        limit = top_n or self._top_n
+
+        if engine == ENGINE_YAPPI:
+            import yappi
+
+            yappi.stop()
+            stats = yappi.get_func_stats()
+            output = self.output_dir / f"cronostar_{stamp}.callgrind"
+            await self.hass.async_add_executor_job(self._save_yappi, stats, output)
+            summary = self._summarize_yappi(stats, limit)
+            yappi.clear_stats()
+        else:
+            profiler = self._profiler
+            profiler.disable()
+            self._profiler = None
+            output = self.output_dir / f"cronostar_{stamp}.prof"
+            await self.hass.async_add_executor_job(self._save_cprofile, profiler, output)
+            summary = self._summarize_cprofile(profiler, limit)
+
+        self.engine = None
+        self.last_result = {
+            "engine": engine,
+            "file": str(output),
+            "duration_seconds": round(elapsed, 1),
+            "top": summary,
+        }
+        _LOGGER.warning("🔬 [PROFILER] Stopped after %.1fs, written to %s", elapsed, output)
+        return self.last_result
+
+    @callback
+    def async_cancel(self) -> None:
+        """Abort a running session without writing output (shutdown/unload)"""
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+        if self.engine == ENGINE_YAPPI:
+            import yappi
+
+            yappi.stop()
+            yappi.clear_stats()
+        elif self._profiler is not None:
+            self._profiler.disable()
+            self._profiler = None
+        self.engine = None
+
+    def _save_cprofile(self, profiler: cProfile.Profile, output: Path) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(output))
+
+    def _save_yappi(self, stats, output: Path) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stats.save(str(output), type="callgrind")
+
+    @staticmethod
+    def _label(filename: str, line: int, name: str) -> str:
+        if filename.startswith(_INTEGRATION_PATH):
+            filename = "cronostar" + filename[len(_INTEGRATION_PATH):]
+        return f"{filename}:{line}({name})"
+
+    def _summarize_cprofile(self, profiler: cProfile.Profile, limit: int) -> list[dict]:
+        """Top functions of this integration by cumulative time"""
+        rows = []
+        for (filename, line, name), (_cc, calls, own, cumulative, _callers) in pstats.Stats(profiler).stats.items():
+            if not filename.startswith(_INTEGRATION_PATH):
+                continue
+            rows.append({
+                "function": self._label(filename, line, name),
+                "calls": calls,
+                "own_ms": round(own * 1000, 3),
+                "cumulative_ms": round(cumulative * 1000, 3),
+            })
+        rows.sort(key=lambda row: row["cumulative_ms"], reverse=True)
+        return rows[:limit]
+
+    def _summarize_yappi(self, stats, limit: int) -> list[dict]:
+        """Top functions of this integration by total (wall) time"""
+        rows = []
+        for stat in stats:
+            if not stat.module.startswith(_INTEGRATION_PATH):
+                continue
+            rows.append({
+                "function": self._label(stat.module, stat.lineno, stat.name),
+                "calls": stat.ncall,
+                "own_ms": round(stat.tsub * 1000, 3),
+                "cumulative_ms": round(stat.ttot * 1000, 3),
+            })
+        rows.sort(key=lambda row: row["cumulative_ms"], reverse=True)
+        return rows[:limit]
+
+
+def get_profiler(hass: HomeAssistant) -> IntegrationProfiler:
+    """Return the integration-wide IntegrationProfiler, creating it on first use"""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    profiler = domain_data.get("profiler")
+    if profiler is None:
+        profiler = domain_data["profiler"] = IntegrationProfiler(hass)
+    return profiler
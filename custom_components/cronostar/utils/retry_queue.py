@@ -0,0 +1,167 @@
+# custom_components/cronostar/utils/retry_queue.py
+"""
+Retry Queue - re-attempts failed target applications in the background
+Exponential backoff with a max age; a newer value for the same entity replaces the pending one
+"""
+
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from functools import partial
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_call_later
+
+from ..const import DOMAIN
+from .metrics import MetricsRegistry, get_metrics
+
+_LOGGER = logging.getLogger(__name__)
+
+RETRY_BASE_DELAY = 5.0
+RETRY_MAX_DELAY = 300.0
+RETRY_MAX_AGE = 900.0
+
+
+class _PendingRetry:
+    """Latest failed application of one entity"""
+
+    __slots__ = ("value", "action", "attempts", "created", "cancel")
+
+    def __init__(self, value, action: Callable[[], Awaitable], created: float):
+        self.value = value
+        self.action = action
+        self.attempts = 0
+        self.created = created
+        self.cancel: Callable[[], None] | None = None
+
+
+class RetryQueue:
+    """Schedules re-attempts of failed target applications without blocking the caller"""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        base_delay: float = RETRY_BASE_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+        max_age: float = RETRY_MAX_AGE,
+        metrics: MetricsRegistry | None = None,
+    ):
+        """
+        Initialize RetryQueue
+
+        Args:
+            hass: Home Assistant instance
+            base_delay: Seconds before the first retry (doubled on each failure)
+            max_delay: Upper bound of the backoff delay
+            max_age: Seconds after which a value still failing is dropped
+            metrics: Registry receiving the pending count and outcomes
+        """
+        self.hass = hass
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_age = max_age
+        self.metrics = metrics if metrics is not None else get_metrics(hass)
+        self._pending: dict[str, _PendingRetry] = {}
+
+    @property
+    def pending(self) -> int:
+        """Number of entities waiting for a retry"""
+        return len(self._pending)
+
+    def pending_entities(self) -> list[str]:
+        """Return the entities waiting for a retry"""
+        return sorted(self._pending)
+
+    def pending_value(self, entity_id: str):
+        """Return the value waiting for a retry on an entity, or None"""
+        retry = self._pending.get(entity_id)
+        return retry.value if retry is not None else None
+
+    def add(self, entity_id: str, value, action: Callable[[], Awaitable]) -> None:
+        """
+        Queue a failed application (coalesced with any pending one for the entity)
+
+        Args:
+            entity_id: Target entity
+            value: Value that failed to apply
+            action: Coroutine function re-applying the value, raising on failure
+        """
+        now = time.monotonic()
+        retry = self._pending.get(entity_id)
+        if retry is None:
+            retry = self._pending[entity_id] = _PendingRetry(value, action, now)
+            self._schedule(entity_id, retry)
+        else:
+            # Superseded: retry the newest value on the existing backoff timer (its age restarts)
+            if retry.value != value:
+                self.metrics.increment("retry.superseded")
+                retry.value, retry.created = value, now
+            retry.action = action
+        self.metrics.increment("retry.queued")
+        self._publish_pending()
+
+    def discard(self, entity_id: str) -> None:
+        """Drop the pending retry of an entity (e.g. a newer value was applied)"""
+        retry = self._pending.pop(entity_id, None)
+        if retry is None:
+            return
+        if retry.cancel is not None:
+            retry.cancel()
+        self._publish_pending()
+
+    def clear(self) -> None:
+        """Cancel every pending retry"""
+        for entity_id in list(self._pending):
+            self.discard(entity_id)
+
+    def _schedule(self, entity_id: str, retry: _PendingRetry) -> None:
+        delay = min(self.max_delay, self.base_delay * (2**retry.attempts))
+        retry.cancel = async_call_later(self.hass, delay, partial(self._async_retry, entity_id))
+
+    async def _async_retry(self, entity_id: str, _now) -> None:
+        """Re-attempt the pending application of an entity"""
+        retry = self._pending.get(entity_id)
+        if retry is None:
+            return
+        retry.cancel = None
+        retry.attempts += 1
+        action = retry.action
+
+        try:
+            await action()
+        except Exception as e:  # noqa: BLE001
+            if self._pending.get(entity_id) is not retry:
+                return
+            if time.monotonic() - retry.created >= self.max_age:
+                _LOGGER.warning("Giving up applying %s to '%s' after %d attempts: %s", retry.value, entity_id, retry.attempts, e)
+                self._pending.pop(entity_id, None)
+                self.metrics.increment("retry.expired")
+                self._publish_pending()
+                return
+            _LOGGER.debug("Retry %d for '%s' failed: %s", retry.attempts, entity_id, e)
+            self.metrics.increment("retry.failed")
+            self._schedule(entity_id, retry)
+            return
+
+        if self._pending.get(entity_id) is not retry:
+            return
+        if retry.action is not action:
+            # A newer value was queued while this attempt ran
+            self._schedule(entity_id, retry)
+            return
+        self._pending.pop(entity_id)
+        _LOGGER.info("Applied %s to '%s' on retry %d", retry.value, entity_id, retry.attempts)
+        self.metrics.increment("retry.succeeded")
+        self._publish_pending()
+
+    def _publish_pending(self) -> None:
+        self.metrics.set_gauge("retry.pending", len(self._pending))
+
+
+def get_retry_queue(hass: HomeAssistant) -> RetryQueue:
+    """Return the integration-wide RetryQueue, creating it on first use"""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    queue = domain_data.get("retry_queue")
+    if queue is None:
+        queue = domain_data["retry_queue"] = RetryQueue(hass)
+    return queue
@@ -0,0 +1,259 @@
+# custom_components/cronostar/utils/schedule_table.py
+"""
+Schedule Table - profiles compiled into one sorted breakpoint table
+Profiles may carry per-weekday schedules; days without one use the base schedule
+"""
+
+from array import array
+from bisect import bisect_right
+from datetime import datetime
+
+from ..storage.compact_schedule import CompactSchedule
+
+DAY_MINUTES = 1440
+WEEK_MINUTES = 7 * DAY_MINUTES
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+# Presets that hold each point's value instead of ramping to the next one
+STEPPED_PRESETS = ("generic_switch",)
+
+
+def week_minute(now: datetime) -> int:
+    """Return minutes since Monday 00:00 for a datetime"""
+    return now.weekday() * DAY_MINUTES + now.hour * 60 + now.minute
+
+
+def is_stepped_preset(preset_type) -> bool:
+    """Return True for presets evaluated without interpolation"""
+    return str(preset_type).lower() in STEPPED_PRESETS
+
+
+def _format_time(total_minutes: int) -> str:
+    total_minutes %= DAY_MINUTES
+    return f"{total_minutes // 60:02d}:{total_minutes % 60:02d}"
+
+
+def _day_points(schedule) -> list[tuple[int, float]]:
+    """Parse a 24h schedule into (minutes, value) pairs, skipping invalid points"""
+    if isinstance(schedule, CompactSchedule):
+        return schedule.as_tuples()
+    points = []
+    for item in schedule or []:
+        try:
+            time_str = item.get("time")
+            value = item.get("value")
+            if not time_str or value is None:
+                continue
+            hours, minutes = map(int, str(time_str).split(":"))
+            points.append((hours * 60 + minutes, float(value)))
+        except (ValueError, TypeError, AttributeError):
+            continue
+    return points
+
+
+class ScheduleTable:
+    """Sorted (minute, value) breakpoints over a circular period
+
+    A daily table spans 1440 minutes from midnight, a weekly one 10080
+    minutes from Monday 00:00. After the last point the table continues with
+    the first, so interpolation and next-change lookups cross day and week
+    boundaries without special cases. precompute() adds a per-minute value
+    array so value_at() becomes a single index.
+    """
+
+    __slots__ = ("minutes", "values", "period", "_lookup", "_lookup_stepped")
+
+    def __init__(self, points: list[tuple[int, float]], period: int = WEEK_MINUTES):
+        """
+        Initialize ScheduleTable
+
+        Args:
+            points: (minute, value) pairs, any order
+            period: DAY_MINUTES or WEEK_MINUTES
+        """
+        points = sorted(points, key=lambda p: p[0])
+        self.minutes = [m for m, _ in points]
+        self.values = [v for _, v in points]
+        self.period = period
+        self._lookup: array | None = None
+        self._lookup_stepped = False
+
+    def __len__(self) -> int:
+        return len(self.minutes)
+
+    def minute_of(self, now: datetime) -> int:
+        """Return the table position of a datetime"""
+        if self.period == WEEK_MINUTES:
+            return week_minute(now)
+        return now.hour * 60 + now.minute
+
+    def precompute(self, stepped: bool = False) -> None:
+        """
+        Build the per-minute value array (8 bytes per minute of the period)
+
+        Args:
+            stepped: Hold values instead of interpolating (must match value_at callers)
+        """
+        count = len(self.minutes)
+        if not count:
+            return
+
+        period = self.period
+        lookup = array("d", bytes(8 * period))
+        for index in range(count):
+            t1, v1 = self.minutes[index], self.values[index]
+            next_index = (index + 1) % count
+            t2, v2 = self.minutes[next_index], self.values[next_index]
+            span = (t2 - t1) % period
+            if span == 0 and next_index:
+                continue  # Duplicate minute: the later point wins
+            if stepped or span == 0:
+                # Held value (span 0: every point shares one minute, so it holds all period)
+                for offset in range(span or period):
+                    lookup[(t1 + offset) % period] = v1
+                continue
+            lookup[t1 % period] = v1
+            for offset in range(1, span):
+                lookup[(t1 + offset) % period] = round(v1 + (v2 - v1) * (offset / span), 2)
+
+        self._lookup = lookup
+        self._lookup_stepped = stepped
+
+    def value_at(self, minute: int, stepped: bool = False) -> float | None:
+        """
+        Return the scheduled value at a table minute
+
+        Args:
+            minute: Minutes since the start of the period
+            stepped: Hold the previous point's value instead of interpolating
+
+        Returns:
+            Value, or None for an empty table
+        """
+        count = len(self.minutes)
+        if not count:
+            return None
+
+        if self._lookup is not None and self._lookup_stepped == stepped:
+            return self._lookup[minute % self.period]
+
+        index = bisect_right(self.minutes, minute) - 1
+        t1, v1 = self.minutes[index], self.values[index]  # index -1 wraps to the previous period's final point
+        if t1 == minute or stepped:
+            return v1
+
+        next_index = (index + 1) % count
+        t2, v2 = self.minutes[next_index], self.values[next_index]
+        span = (t2 - t1) % self.period
+        if span == 0:
+            return v1
+
+        ratio = ((minute - t1) % self.period) / span
+        return round(v1 + (v2 - v1) * ratio, 2)
+
+    def next_change(self, minute: int, current_value: float) -> tuple[str, int] | None:
+        """
+        Return the next point whose value differs from current_value
+
+        Args:
+            minute: Minutes since the start of the period
+            current_value: Value applied now
+
+        Returns:
+            (HH:MM, minutes until) like the 24h lookup, or None if the value never changes
+        """
+        count = len(self.minutes)
+        start = bisect_right(self.minutes, minute)
+        for offset in range(count):
+            index = (start + offset) % count
+            if self.values[index] != current_value:
+                point = self.minutes[index]
+                delta = (point - minute) % self.period or self.period
+                return (_format_time(point), delta)
+        return None
+
+    def transitions(self, minute: int, horizon: int, current_value: float | None) -> list[tuple[int, float]]:
+        """
+        Return the breakpoints ahead that change the value, across periods
+
+        Args:
+            minute: Minutes since the start of the period
+            horizon: Look-ahead in minutes (may exceed the period)
+            current_value: Value applied now (points repeating it are skipped)
+
+        Returns:
+            (minutes from now, value) pairs in time order
+        """
+        count = len(self.minutes)
+        result = []
+        if not count:
+            return result
+
+        index = bisect_right(self.minutes, minute)
+        cycle = 0
+        last = current_value
+        while True:
+            if index == count:
+                index = 0
+                cycle += 1
+            delta = self.minutes[index] - minute + cycle * self.period
+            if delta > horizon:
+                return result
+            value = self.values[index]
+            if value != last:
+                result.append((delta, value))
+                last = value
+            index += 1
+
+
+def compile_day_table(schedule) -> ScheduleTable:
+    """
+    Compile a 24h schedule into a daily ScheduleTable
+
+    Args:
+        schedule: List of {"time": "HH:MM", "value": x} points or CompactSchedule
+
+    Returns:
+        ScheduleTable over DAY_MINUTES
+    """
+    return ScheduleTable(_day_points(schedule), DAY_MINUTES)
+
+
+def compile_week_table(profile_data: dict) -> ScheduleTable | None:
+    """
+    Compile a profile with per-weekday schedules into a weekly ScheduleTable
+
+    Args:
+        profile_data: Profile entry ({"schedule": [...], "weekdays": {"sat": [...], ...}})
+
+    Returns:
+        ScheduleTable, or None when the profile has no weekday schedules
+    """
+    weekdays = profile_data.get("weekdays") if isinstance(profile_data, dict) else None
+    if not isinstance(weekdays, dict) or not weekdays:
+        return None
+
+    base = _day_points(profile_data.get("schedule"))
+    points = []
+    for day_index, day in enumerate(WEEKDAYS):
+        day_schedule = weekdays.get(day)
+        day_points = _day_points(day_schedule) if day_schedule else base
+        offset = day_index * DAY_MINUTES
+        points.extend((offset + min(m, DAY_MINUTES - 1), v) for m, v in day_points)
+    return ScheduleTable(points, WEEK_MINUTES)
+
+
+def compile_profile_table(profile_data: dict) -> ScheduleTable:
+    """
+    Compile a profile into its weekly table, or a daily one without weekday schedules
+
+    Args:
+        profile_data: Profile entry
+
+    Returns:
+        ScheduleTable
+    """
+    table = compile_week_table(profile_data)
+    if table is None:
+        table = compile_day_table(profile_data.get("schedule"))
+    return table
@@ -0,0 +1,112 @@
+# custom_components/cronostar/utils/target_adapters.py
+"""
+Target Adapters - how each entity domain applies a scheduled value
+Resolved once per target into a bound call that only builds the service payload
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+
+class BoundTarget:
+    """Service call of one target entity, ready to take a value"""
+
+    __slots__ = ("entity_id", "domain", "binary", "_build")
+
+    def __init__(self, entity_id: str, domain: str, binary: bool, build: Callable[[float], tuple[str, dict]]):
+        self.entity_id = entity_id
+        self.domain = domain
+        self.binary = binary
+        self._build = build
+
+    def __call__(self, value: float) -> tuple[str, str, dict]:
+        """Return (domain, service, data) applying value"""
+        service, data = self._build(value)
+        return self.domain, service, data
+
+
+class TargetAdapter(ABC):
+    """How the entities of one domain apply a scheduled value"""
+
+    # On/off targets only look at the value's sign (no quantization)
+    binary = False
+
+    @abstractmethod
+    def bind(self, entity_id: str) -> BoundTarget:
+        """Resolve the call for one entity"""
+
+
+class ValueAdapter(TargetAdapter):
+    """Domain whose entities take the value through a single service field"""
+
+    def __init__(self, service: str, field: str, convert: Callable | None = None):
+        """
+        Initialize ValueAdapter
+
+        Args:
+            service: Service of the entity's domain setting the value
+            field: Service data field receiving the value
+            convert: Optional conversion of the value (e.g. int for positions)
+        """
+        self.service = service
+        self.field = field
+        self.convert = convert
+
+    def bind(self, entity_id: str) -> BoundTarget:
+        """Resolve the call for one entity"""
+        service, field, convert = self.service, self.field, self.convert
+        if convert is None:
+            def build(value):
+                return service, {"entity_id": entity_id, field: value}
+        else:
+            def build(value):
+                return service, {"entity_id": entity_id, field: convert(value)}
+        return BoundTarget(entity_id, entity_id.split(".")[0], self.binary, build)
+
+
+class OnOffAdapter(TargetAdapter):
+    """Domain switched on for positive values and off otherwise"""
+
+    binary = True
+
+    def bind(self, entity_id: str) -> BoundTarget:
+        """Resolve the call for one entity"""
+        def build(value):
+            return ("turn_on" if value > 0 else "turn_off"), {"entity_id": entity_id}
+        return BoundTarget(entity_id, entity_id.split(".")[0], self.binary, build)
+
+
+_ON_OFF = OnOffAdapter()
+
+# Entity domain -> adapter; extend with register_target_adapter
+TARGET_ADAPTERS: dict[str, TargetAdapter] = {
+    "climate": ValueAdapter("set_temperature", "temperature"),
+    "switch": _ON_OFF,
+    "light": _ON_OFF,
+    "fan": _ON_OFF,
+    "input_number": ValueAdapter("set_value", "value"),
+    "number": ValueAdapter("set_value", "value"),
+    "cover": ValueAdapter("set_cover_position", "position", int),
+    "water_heater": ValueAdapter("set_temperature", "temperature"),
+    "humidifier": ValueAdapter("set_humidity", "humidity", int),
+    "valve": ValueAdapter("set_valve_position", "position", int),
+}
+
+
+def register_target_adapter(domain: str, adapter: TargetAdapter) -> None:
+    """Register (or replace) the adapter of an entity domain"""
+    TARGET_ADAPTERS[domain] = adapter
+
+
+def resolve_target(entity_id: str) -> BoundTarget | None:
+    """
+    Bind the adapter of an entity's domain
+
+    Args:
+        entity_id: Target entity
+
+    Returns:
+        The bound call, or None when the domain has no adapter
+    """
+    adapter = TARGET_ADAPTERS.get(entity_id.split(".")[0])
+    return adapter.bind(entity_id) if adapter is not None else None
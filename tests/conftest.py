@@ -6,6 +6,7 @@ before any test file imports the sources under test.
 import sys
 import types
 import logging
+from collections.abc import Callable
 from datetime import timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
@@ -33,17 +34,24 @@ class UnknownEntry(HomeAssistantError):
 
 class DataUpdateCoordinator:
     """Minimal stub that matches the real HA coordinator interface."""
-    def __init__(self, hass, logger, *, name, update_interval):
+    def __init__(self, hass, logger, *, name, update_interval, always_update=True):
         self.hass = hass
         self.logger = logger
         self.name = name
         self.update_interval = update_interval
+        self.always_update = always_update
         self.data = None
         self.last_update_success = True
 
     async def async_refresh(self):
         pass
 
+    def async_set_updated_data(self, data):
+        self.data = data
+
+    async def async_shutdown(self):
+        pass
+
     async def _async_update_data(self):
         return {}
 
@@ -231,6 +239,7 @@ def _install_ha_stubs():
     const_mod.CONF_UNIT_OF_MEASUREMENT = "unit_of_measurement"
     const_mod.EVENT_HOMEASSISTANT_START = "homeassistant_start"
     const_mod.EVENT_HOMEASSISTANT_STOP = "homeassistant_stop"
+    const_mod.EVENT_HOMEASSISTANT_STARTED = "homeassistant_started"
     const_mod.Platform = Platform
     sys.modules["homeassistant.const"] = const_mod
 
@@ -240,6 +249,7 @@ def _install_ha_stubs():
     core_mod.ServiceCall = MagicMock
     core_mod.ServiceResponse = dict
     core_mod.callback = lambda x: x
+    core_mod.CALLBACK_TYPE = Callable[[], None]
     core_mod.CoreState = CoreState
     core_mod.Event = MagicMock
     sys.modules["homeassistant.core"] = core_mod
@@ -284,12 +294,21 @@ def _install_ha_stubs():
     ent_mod.EntityCategory = EntityCategory
     sys.modules["homeassistant.helpers.entity"] = ent_mod
 
+    # homeassistant.helpers.event
+    event_mod = types.ModuleType("homeassistant.helpers.event")
+    event_mod.async_call_later = MagicMock(return_value=MagicMock())
+    event_mod.async_track_point_in_time = MagicMock(return_value=MagicMock())
+    event_mod.async_track_state_change_event = MagicMock(return_value=MagicMock())
+    event_mod.async_track_time_interval = MagicMock(return_value=MagicMock())
+    sys.modules["homeassistant.helpers.event"] = event_mod
+
     # homeassistant.helpers
     helpers_mod = types.ModuleType("homeassistant.helpers")
     helpers_mod.__path__ = [] # Mark as package
     helpers_mod.entity_registry = er_mod
     helpers_mod.update_coordinator = coord_mod
     helpers_mod.frame = frame_mod
+    helpers_mod.event = event_mod
     sys.modules["homeassistant.helpers"] = helpers_mod
 
     # homeassistant.helpers.selector
@@ -327,6 +346,7 @@ def _install_ha_stubs():
     ws_api_mod.websocket_command = lambda schema: (lambda func: func)
     ws_api_mod.async_response = lambda func: func
     ws_api_mod.ActiveConnection = MagicMock
+    ws_api_mod.event_message = lambda iden, event: {"id": iden, "type": "event", "event": event}
     sys.modules["homeassistant.components.websocket_api"] = ws_api_mod
 
     # homeassistant.components.sensor
@@ -536,6 +556,11 @@ def hass(tmp_path):
 
     hass.async_create_task = MagicMock(side_effect=_create_task)
 
+    def _create_background_task(coro, name, *args, **kwargs):
+        return asyncio.get_running_loop().create_task(coro, name=name)
+
+    hass.async_create_background_task = MagicMock(side_effect=_create_background_task)
+
     # hass.data
     hass.data = {}
 
@@ -0,0 +1,111 @@
+"""Test step quantization and the deadband of scheduled applications."""
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.cronostar.const import CONF_STEP_VALUE
+from custom_components.cronostar.utils.retry_queue import get_retry_queue
+
+RAMP = [{"time": "00:00", "value": 20.0}, {"time": "06:00", "value": 20.0}, {"time": "07:00", "value": 21.0}]
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def _ramp_calls(coord, minutes=range(360, 421), schedule=RAMP, service=None):
+    coord.storage_manager.list_profiles = AsyncMock(return_value=["f.json"])
+    coord.storage_manager.load_profile_cached = AsyncMock(return_value={"profiles": {"Default": {"schedule": schedule}}})
+    coord.hass.services.async_call = service or AsyncMock()
+    applied = []
+    with patch("custom_components.cronostar.coordinator.datetime") as mock_dt:
+        for minute in minutes:
+            mock_dt.now.return_value = datetime(2024, 1, 1, minute // 60, minute % 60)
+            run(coord.apply_schedule())
+    for call in coord.hass.services.async_call.call_args_list:
+        applied.append(call[0][2]["temperature"])
+    return applied
+
+
+def test_ramp_sends_only_quantized_changes(mock_coordinator):
+    coord = mock_coordinator
+    coord.card_config[CONF_STEP_VALUE] = 0.5
+
+    assert _ramp_calls(coord) == [20.0, 20.5, 21.0]
+    assert coord.current_value == 21.0
+    assert coord.metrics.counter("coordinator.apply_skipped") == 58
+
+
+def test_deadband_without_step(mock_coordinator):
+    coord = mock_coordinator
+    coord.card_config[CONF_STEP_VALUE] = None
+    coord.deadband = 0.25
+
+    applied = _ramp_calls(coord, range(360, 421, 3))
+    assert applied == [20.0, 20.25, 20.5, 20.75, 21.0]
+
+
+def test_unchanged_value_resent_after_comeback_or_reenable(mock_coordinator):
+    coord = mock_coordinator
+    coord.card_config[CONF_STEP_VALUE] = 0.5
+    assert _ramp_calls(coord, [360, 361]) == [20.0]
+
+    coord._target_available = True
+    run(coord._async_target_changed(MagicMock(data={"new_state": None})))
+    assert _ramp_calls(coord, [362]) == [20.0]
+
+    coord.storage_manager.update_enabled_state = AsyncMock()
+    run(coord.set_enabled(True))
+    assert _ramp_calls(coord, [363]) == [20.0]
+
+
+def test_quantize_keeps_step_decimals_and_skips_on_off_targets(mock_coordinator):
+    coord = mock_coordinator
+    coord.card_config[CONF_STEP_VALUE] = 0.1
+    assert coord._quantize(20.26) == 20.3
+    coord.card_config[CONF_STEP_VALUE] = "0.5"
+    assert coord._quantize(20.26) == 20.5
+    coord.target_entity = "switch.pump"
+    assert coord._quantize(0.3) == 0.3
+
+
+def test_rejected_value_is_not_recorded_as_applied(mock_coordinator):
+    coord = mock_coordinator
+    coord.card_config[CONF_STEP_VALUE] = 0.5
+    retries = get_retry_queue(coord.hass)
+    with patch.object(retries, "add") as add:
+        rejected = AsyncMock(side_effect=HomeAssistantError("rejected"))
+        assert _ramp_calls(coord, [360], service=rejected) == [20.0]
+        add.assert_called_once()
+    assert coord._last_applied is None
+
+    # Once no retry is pending, the next tick sends the unchanged value again
+    assert _ramp_calls(coord, [361]) == [20.0]
+    assert coord._last_applied == 20.0
+
+
+def test_deadband_bypassed_at_breakpoints(mock_coordinator):
+    coord = mock_coordinator
+    coord.card_config[CONF_STEP_VALUE] = None
+    coord.deadband = 1.0
+    schedule = [{"time": "06:00", "value": 20.0}, {"time": "07:00", "value": 20.5}, {"time": "23:00", "value": 20.5}]
+    assert _ramp_calls(coord, [360, 390, 420], schedule) == [20.0, 20.5]
+
+
+def test_deadband_bypassed_once_value_settles(mock_coordinator):
+    coord = mock_coordinator
+    coord.card_config[CONF_STEP_VALUE] = None
+    coord.deadband = 1.0
+    schedule = [{"time": "06:00", "value": 20.0}, {"time": "06:30", "value": 20.4}, {"time": "23:00", "value": 20.4}]
+    assert _ramp_calls(coord, [360, 400, 401, 402], schedule) == [20.0, 20.4]
+
+
+def test_deadband_ignored_for_stepped_presets(mock_coordinator):
+    coord = mock_coordinator
+    coord.card_config[CONF_STEP_VALUE] = None
+    coord.deadband = 1.0
+    coord.preset_type = "generic_switch"
+    schedule = [{"time": "06:00", "value": 20.0}, {"time": "07:00", "value": 20.5}]
+    assert _ramp_calls(coord, [360, 421], schedule) == [20.0, 20.5]
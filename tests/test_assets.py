@@ -0,0 +1,61 @@
+"""Test content-hashed card assets and their manifest."""
+import asyncio
+import gzip
+import hashlib
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.cronostar.setup import _setup_static_resources
+from custom_components.cronostar.setup.assets import ASSET_MANIFEST_FILENAME, asset_url, build_asset_manifest
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_manifest_hashes_existing_assets_and_precompresses(tmp_path):
+    bundle = b"console.log('cronostar');" * 100
+    (tmp_path / "cronostar-card.js").write_bytes(bundle)
+
+    assets = build_asset_manifest(tmp_path)
+
+    assert list(assets) == ["cronostar-card.js"]  # card-picker-metadata.js is absent
+    entry = assets["cronostar-card.js"]
+    assert entry["hash"] == hashlib.sha256(bundle).hexdigest()[:16]
+    assert gzip.decompress((tmp_path / entry["gzip"]).read_bytes()) == bundle
+    assert json.loads((tmp_path / ASSET_MANIFEST_FILENAME).read_text())["assets"] == assets
+    assert asset_url("/cronostar_card", "cronostar-card.js", entry) == f"/cronostar_card/cronostar-card.js?v={entry['hash']}"
+
+
+def test_manifest_reused_until_bundle_changes(tmp_path):
+    card = tmp_path / "cronostar-card.js"
+    card.write_bytes(b"v1")
+    first = build_asset_manifest(tmp_path)
+
+    with patch("custom_components.cronostar.setup.assets.hashlib.sha256") as sha:
+        assert build_asset_manifest(tmp_path) == first
+    sha.assert_not_called()
+
+    card.write_bytes(b"version 2")
+    second = build_asset_manifest(tmp_path)
+    assert second["cronostar-card.js"]["hash"] != first["cronostar-card.js"]["hash"]
+    assert gzip.decompress((tmp_path / "cronostar-card.js.gz").read_bytes()) == b"version 2"
+
+
+def test_static_resources_register_hashed_urls_only(hass, tmp_path):
+    www = tmp_path / "custom_components" / "cronostar" / "www" / "cronostar_card"
+    www.mkdir(parents=True)
+    (www / "cronostar-card.js").write_bytes(b"card")
+    hass.config.path = MagicMock(side_effect=lambda p: str(tmp_path / p))
+    hass.config.components = ["http", "frontend"]
+    hass.http.async_register_static_paths = AsyncMock()
+
+    with patch("custom_components.cronostar.setup.async_get_integration", AsyncMock(return_value=MagicMock(version="1.0.0"))), \
+         patch("custom_components.cronostar.setup.HAS_STATIC_PATH_CONFIG", True), \
+         patch("custom_components.cronostar.setup.StaticPathConfig", create=True) as static_config, \
+         patch("custom_components.cronostar.setup.add_extra_js_url") as add_js:
+        assert run(_setup_static_resources(hass)) is True
+
+    assert static_config.call_args.kwargs["cache_headers"] is True
+    digest = hashlib.sha256(b"card").hexdigest()[:16]
+    assert [c.args[1] for c in add_js.call_args_list] == [f"/cronostar_card/cronostar-card.js?v={digest}"]
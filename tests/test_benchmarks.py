@@ -0,0 +1,44 @@
+"""Smoke test for the benchmark suite."""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+import run_benchmarks  # noqa: E402
+
+
+def test_benchmark_scenarios_run(tmp_path):
+    results = asyncio.run(run_benchmarks.run_size(3, tmp_path))
+
+    assert set(results) == {
+        "startup_warmup",
+        "coordinator_tick",
+        "register_card",
+        "list_all_profiles",
+        "list_all_profiles_reload",
+        "save_profile_burst",
+        "dashboard_regeneration",
+    }
+    assert results["register_card"]["count"] == 3
+    assert results["save_profile_burst"]["count"] == run_benchmarks.SAVE_BURST
+
+
+def test_regression_check():
+    baseline = {"10": {"coordinator_tick": {"total_ms": 100.0}, "register_card": {"total_ms": 1.0}}}
+    current = {"10": {"coordinator_tick": {"total_ms": 200.0}, "register_card": {"total_ms": 4.0}, "new": {"total_ms": 1.0}}}
+
+    regressions = run_benchmarks.check_regressions(current, baseline, 1.5)
+
+    # register_card stays under the noise floor; scenarios without a baseline are skipped
+    assert len(regressions) == 1
+    assert regressions[0].startswith("coordinator_tick @ 10 controllers")
+
+
+def test_entry_path_defers_optional_modules():
+    import import_time
+
+    result = import_time.run_module("custom_components.cronostar", runs=1)
+
+    assert result["integration_modules"] > 0
+    assert result["deferred_loaded"] == []
@@ -0,0 +1,88 @@
+"""Test bulk evaluation of many schedules at many timestamps."""
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.cronostar.const import DOMAIN
+from custom_components.cronostar.services.forecast_service import ForecastService
+from custom_components.cronostar.storage.storage_manager import StorageManager
+from custom_components.cronostar.utils import bulk_evaluator as bulk_mod
+from custom_components.cronostar.utils.bulk_evaluator import BulkEvaluator, to_local_naive
+from custom_components.cronostar.utils.schedule_table import DAY_MINUTES, WEEK_MINUTES, ScheduleTable, compile_day_table
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def _tables(seed=3):
+    rng = random.Random(seed)
+    tables = []
+    for period in (DAY_MINUTES, WEEK_MINUTES, DAY_MINUTES):
+        points = [(rng.randrange(period), round(rng.uniform(0, 30), 1)) for _ in range(rng.randint(1, 30))]
+        tables.append(ScheduleTable(points, period))
+    tables.append(ScheduleTable([], DAY_MINUTES))
+    return tables
+
+
+def _timestamps(count=200, seed=5):
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1)
+    return [base + timedelta(minutes=rng.randrange(2 * WEEK_MINUTES)) for _ in range(count)]
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_grid_matches_per_table_lookup(use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    tables = _tables()
+    stepped = [False, False, True, False]
+    timestamps = _timestamps()
+
+    evaluator = BulkEvaluator(tables, stepped, use_numpy=use_numpy)
+    assert evaluator.use_numpy is use_numpy
+    grid = evaluator.evaluate_grid(timestamps)
+
+    for row, (table, is_stepped) in enumerate(zip(tables, stepped, strict=True)):
+        expected = [table.value_at(table.minute_of(ts), stepped=is_stepped) for ts in timestamps]
+        if row == 3:
+            assert grid[row] == [None] * len(timestamps)
+        elif use_numpy:
+            # np.round and round() may disagree on half-way values
+            assert grid[row] == pytest.approx(expected, abs=0.01)
+        else:
+            assert grid[row] == expected
+
+
+def test_falls_back_to_bisect_without_numpy(monkeypatch):
+    monkeypatch.setattr(bulk_mod, "np", None)
+    evaluator = BulkEvaluator([compile_day_table([{"time": "00:00", "value": 10.0}, {"time": "12:00", "value": 20.0}])], [False])
+    assert evaluator.use_numpy is False
+    assert evaluator.evaluate([(0, datetime(2024, 1, 1, 6, 0)), (0, datetime(2024, 1, 1, 18, 0))]) == [15.0, 15.0]
+
+
+def test_aware_timestamps_use_local_time():
+    aware = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    assert to_local_naive(aware) == aware.astimezone().replace(tzinfo=None)
+    assert to_local_naive(datetime(2024, 1, 1, 12, 0)) == datetime(2024, 1, 1, 12, 0)
+
+
+def test_evaluate_schedules_service(hass, tmp_path):
+    storage = StorageManager(hass, tmp_path / "profiles")
+    schedule = [{"time": "00:00", "value": 0}, {"time": "07:00", "value": 1}, {"time": "08:00", "value": 0}]
+    run(storage.save_profile("Default", "generic_switch", {"schedule": schedule}, {"global_prefix": "cronostar_generic_switch_b_"}, "cronostar_generic_switch_b_"))
+    MockConfigEntry(entry_id="b", data={"global_prefix": "cronostar_generic_switch_b_", "preset_type": "generic_switch"}).add_to_hass(hass)
+    MockConfigEntry(entry_id="c", data={"global_prefix": "cronostar_thermostat_missing_", "preset_type": "thermostat"}).add_to_hass(hass)
+    service = ForecastService(hass, storage)
+
+    result = run(service.async_evaluate(["2024-01-01T06:59:00", "2024-01-01T07:30:00", datetime(2024, 1, 1, 9, 0)]))
+    by_entry = {c["entry_id"]: c for c in result["controllers"]}
+    assert by_entry["b"]["values"] == [0, 1, 0]
+    assert by_entry["c"]["error"] == "Profile not found" and "values" not in by_entry["c"]
+    assert result["engine"] in ("numpy", "bisect")
+
+    with pytest.raises(Exception, match="Invalid timestamp"):
+        run(service.async_evaluate(["yesterday"]))
@@ -0,0 +1,118 @@
+"""Test array-backed schedules in the profile cache."""
+import asyncio
+import json
+from array import array
+from unittest.mock import MagicMock
+
+from custom_components.cronostar.storage.compact_schedule import CompactSchedule, compact_container, json_default
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def _make_storage(tmp_path):
+    from custom_components.cronostar.storage.storage_manager import StorageManager
+
+    hass = MagicMock()
+    hass.config.path = MagicMock(return_value=str(tmp_path))
+
+    async def fake_executor(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = fake_executor
+    return StorageManager(hass, tmp_path / "profiles")
+
+
+# ---------------------------------------------------------------------------
+# CompactSchedule
+# ---------------------------------------------------------------------------
+
+def test_pack_behaves_like_point_list():
+    points = [{"time": "00:00", "value": 18.0}, {"time": "07:30", "value": 21.5}, {"time": "23:59", "value": 18.0}]
+    packed = CompactSchedule.from_points(points)
+
+    assert isinstance(packed.minutes, array) and packed.minutes.typecode == "H"
+    assert packed.values.typecode == "d"
+    assert packed == points
+    assert points == packed
+    assert len(packed) == 3
+    assert packed[1] == {"time": "07:30", "value": 21.5}
+    assert packed[-1]["time"] == "23:59"
+    assert packed[:2] == points[:2]
+    assert list(packed) == points
+    assert packed.as_tuples() == [(0, 18.0), (450, 21.5), (1439, 18.0)]
+    assert json.loads(json.dumps({"schedule": packed}, default=json_default)) == {"schedule": points}
+
+
+def test_int_values_keep_their_type():
+    packed = CompactSchedule.from_points([{"time": "00:00", "value": 0}, {"time": "12:00", "value": 1}])
+
+    assert packed.values.typecode == "q"
+    assert json.dumps(packed.to_list()) == '[{"time": "00:00", "value": 0}, {"time": "12:00", "value": 1}]'
+
+
+def test_unpackable_points_are_rejected():
+    assert CompactSchedule.from_points([{"time": "7:30", "value": 1.0}]) is None
+    assert CompactSchedule.from_points([{"time": "07:30:00", "value": 1.0}]) is None
+    assert CompactSchedule.from_points([{"time": "07:30", "value": "on"}]) is None
+    assert CompactSchedule.from_points([{"time": "07:30", "value": True}]) is None
+    assert CompactSchedule.from_points([{"time": "07:30", "value": 1.0, "note": "wake"}]) is None
+    assert CompactSchedule.from_points("bad") is None
+    assert len(CompactSchedule.from_points([])) == 0
+
+
+def test_compact_container_in_place():
+    container = {
+        "meta": {},
+        "profiles": {
+            "Packed": {"schedule": [{"time": "00:00", "value": 1.0}], "updated_at": "x"},
+            "Annotated": {"schedule": [{"time": "00:00", "value": 1.0, "note": "n"}]},
+            "NoSchedule": {"updated_at": "x"},
+        },
+    }
+    assert compact_container(container) is container
+    assert isinstance(container["profiles"]["Packed"]["schedule"], CompactSchedule)
+    assert isinstance(container["profiles"]["Annotated"]["schedule"], list)
+    assert compact_container({"profiles": None}) == {"profiles": None}
+
+
+# ---------------------------------------------------------------------------
+# StorageManager integration
+# ---------------------------------------------------------------------------
+
+def test_cache_holds_packed_schedules_and_disk_stays_plain(tmp_path):
+    storage = _make_storage(tmp_path)
+    schedule = [{"time": f"{m // 60:02d}:{m % 60:02d}", "value": 20.0 + (m % 7) / 2} for m in range(0, 1440, 15)]
+    run(storage.save_profile("Comfort", "thermostat", {"schedule": schedule}, {}, "cronostar_thermostat_k_"))
+    fname = "cronostar_thermostat_k_data.json"
+
+    cached = run(storage.load_profile_cached(fname))
+    assert isinstance(cached["profiles"]["Comfort"]["schedule"], CompactSchedule)
+    assert cached["profiles"]["Comfort"]["schedule"] == schedule
+
+    reloaded = run(storage.load_profile_cached(fname, force_reload=True))
+    assert isinstance(reloaded["profiles"]["Comfort"]["schedule"], CompactSchedule)
+
+    on_disk = json.loads((storage.profiles_dir / fname).read_text("utf-8"))
+    assert on_disk["profiles"]["Comfort"]["schedule"] == schedule
+
+    export_dir = tmp_path / "export"
+    export_dir.mkdir()
+    assert run(storage.async_export_json(target_dir=export_dir)) == 1
+    exported = json.loads((export_dir / fname).read_text("utf-8"))
+    assert exported["profiles"]["Comfort"]["schedule"] == schedule
+
+
+def test_profile_service_returns_plain_lists(tmp_path):
+    from custom_components.cronostar.services.profile_service import ProfileService
+
+    storage = _make_storage(tmp_path)
+    schedule = [{"time": "00:00", "value": 18.0}, {"time": "08:00", "value": 21.0}]
+    run(storage.save_profile("Comfort", "thermostat", {"schedule": schedule}, {"global_prefix": "cronostar_thermostat_k_"}, "cronostar_thermostat_k_"))
+
+    service = ProfileService(storage.hass, storage, MagicMock())
+    data = run(service.get_profile_data("Comfort", "thermostat", "cronostar_thermostat_k_"))
+
+    assert type(data["schedule"]) is list
+    assert data["schedule"] == schedule
@@ -308,14 +308,14 @@ class TestUpdateTargetEntity:
 class TestAsyncInitialize:
 
     def test_no_files_found(self, hass, mock_entry):
-        """Branch: list_profiles returns [] → stays at default, apply_schedule called."""
+        """Branch: list_profiles returns [] → stays at default, first apply left to the first refresh."""
         coord, sm = _make_coordinator(hass, mock_entry)
         sm.list_profiles = AsyncMock(return_value=[])
         coord.apply_schedule = AsyncMock()
         coord.logging_enabled = True
 
         run(coord.async_initialize())
-        coord.apply_schedule.assert_called_once()
+        coord.apply_schedule.assert_not_called()
 
     def test_with_profiles_last_active_restored(self, hass, mock_entry):
         """Branch: last_active_profile in meta → restored as selected_profile."""
@@ -362,12 +362,12 @@ class TestAsyncInitialize:
         assert coord.selected_profile == "Custom"
 
     def test_initialize_exception_caught(self, hass, mock_entry):
-        """Branch: list_profiles raises → error logged, apply_schedule still called."""
+        """Branch: list_profiles raises → error logged, no apply."""
         coord, sm = _make_coordinator(hass, mock_entry)
         sm.list_profiles = AsyncMock(side_effect=RuntimeError("boom"))
         coord.apply_schedule = AsyncMock()
         run(coord.async_initialize())
-        coord.apply_schedule.assert_called_once()
+        coord.apply_schedule.assert_not_called()
 
     def test_no_files_with_logging_disabled(self, hass, mock_entry):
         """Branch: no files + logging disabled → no info log."""
@@ -376,7 +376,7 @@ class TestAsyncInitialize:
         coord.apply_schedule = AsyncMock()
         coord.logging_enabled = False
         run(coord.async_initialize())
-        coord.apply_schedule.assert_called_once()
+        coord.apply_schedule.assert_not_called()
 
     def test_profiles_loaded_with_logging(self, hass, mock_entry):
         """Branch: files found + logging_enabled → info logged."""
@@ -855,3 +855,38 @@ class TestInterpolateScheduleWithMockedTime:
         # t2 is NOT < t1 (equal), so no midnight adjustment
         # t2 == t1 → return v1 = 21.0
         assert result == pytest.approx(21.0, rel=0.01)
+
+
+class TestCanonicalKeys:
+    """Canonical storage keys are computed once per coordinator."""
+
+    def test_keys_and_container_preference(self, mock_coordinator):
+        coord = mock_coordinator
+        assert coord.canonical_preset == "thermostat"
+        assert coord.canonical_prefix.endswith("_")
+        assert coord.profile_filename.startswith("cronostar_") and coord.profile_filename.endswith("_data.json")
+
+        assert coord._container_filename(["a.json", coord.profile_filename]) == coord.profile_filename
+        assert coord._container_filename(["a.json", "b.json"]) == "a.json"
+
+
+class TestStateSnapshot:
+    """Refreshes publish immutable snapshots so unchanged state does not notify listeners."""
+
+    def test_snapshot_is_immutable_and_comparable(self, mock_coordinator):
+        coord = mock_coordinator
+        assert coord.always_update is False
+
+        first = coord._state_data()
+        assert first == coord._state_data()
+        with pytest.raises(TypeError):
+            first["current_value"] = 1.0
+
+        coord.card_config["title"] = "Renamed"
+        coord.available_profiles.append("Comfort")
+        second = coord._state_data()
+        assert second != first
+        assert first["available_profiles"] == ("Default",) and second["available_profiles"] == ("Default", "Comfort")
+
+        coord.current_value = 22.5
+        assert coord._state_data() != second
@@ -0,0 +1,88 @@
+"""Test deferred first schedule application during Home Assistant startup."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.cronostar.const import DOMAIN
+from custom_components.cronostar.setup.events import async_apply_deferred_controllers, setup_event_handlers
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_deferred_refresh_publishes_state_without_applying(mock_coordinator):
+    coord = mock_coordinator
+    coord.apply_schedule = AsyncMock()
+    coord.apply_deferred = True
+    flat = [{"time": "00:00", "value": 19.5}, {"time": "23:59", "value": 19.5}]
+    coord.storage_manager.list_profiles = AsyncMock(return_value=["f.json"])
+    coord.storage_manager.load_profile_cached = AsyncMock(return_value={"profiles": {"Default": {"schedule": flat}}})
+    coord.hass.services.async_call = AsyncMock()
+
+    data = run(coord._async_update_data())
+    coord.apply_schedule.assert_not_called()
+    coord.hass.services.async_call.assert_not_called()
+    assert data["selected_profile"] == coord.selected_profile
+    # The scheduled value is published, not the initial 0.0
+    assert data["current_value"] == 19.5
+
+    run(coord.async_apply_deferred())
+    coord.apply_schedule.assert_called_once()
+    assert coord.apply_deferred is False
+    assert coord.data == coord._state_data()
+
+    run(coord._async_update_data())
+    assert coord.apply_schedule.call_count == 2
+
+
+def test_refresh_applies_controller_missed_by_started_pass(mock_coordinator):
+    coord = mock_coordinator
+    coord.apply_schedule = AsyncMock()
+    coord.apply_deferred = True
+    coord.hass.state = CoreState.starting
+    run(coord._async_update_data())
+    coord.apply_schedule.assert_not_called()
+
+    # STARTED fired before the entry stored its coordinator, so the batched pass found nothing
+    coord.hass.config_entries.async_entries = MagicMock(return_value=[])
+    assert run(async_apply_deferred_controllers(coord.hass)) == 0
+    coord.hass.state = CoreState.running
+
+    run(coord._async_update_data())
+    coord.apply_schedule.assert_called_once()
+    assert coord.apply_deferred is False
+
+
+def test_started_pass_applies_only_deferred_controllers(hass):
+    deferred = []
+    for entry_id, is_deferred in (("a", True), ("b", True), ("c", False)):
+        coordinator = MagicMock(apply_deferred=is_deferred, async_apply_deferred=AsyncMock())
+        entry = MockConfigEntry(entry_id=entry_id, data={"global_prefix": f"cronostar_thermostat_{entry_id}_"})
+        entry.runtime_data = coordinator
+        entry.add_to_hass(hass)
+        deferred.append(coordinator)
+    MockConfigEntry(domain=DOMAIN, entry_id="global", data={"component_installed": True}).add_to_hass(hass)
+    deferred[1].async_apply_deferred.side_effect = RuntimeError("boom")
+
+    assert run(async_apply_deferred_controllers(hass)) == 2
+    deferred[0].async_apply_deferred.assert_awaited_once()
+    deferred[1].async_apply_deferred.assert_awaited_once()
+    deferred[2].async_apply_deferred.assert_not_called()
+
+
+def test_started_listener_registered_only_while_starting(hass):
+    hass.state = CoreState.starting
+    run(setup_event_handlers(hass, MagicMock()))
+    events = [c[0][0] for c in hass.bus.async_listen_once.call_args_list]
+    assert EVENT_HOMEASSISTANT_STARTED in events
+    assert events[-1] == EVENT_HOMEASSISTANT_START
+
+    hass.bus.async_listen_once.reset_mock()
+    hass.state = CoreState.running
+    run(setup_event_handlers(hass, MagicMock()))
+    events = [c[0][0] for c in hass.bus.async_listen_once.call_args_list]
+    assert EVENT_HOMEASSISTANT_STARTED not in events
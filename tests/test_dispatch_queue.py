@@ -0,0 +1,95 @@
+"""Test the rate-limited dispatch of target service calls."""
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.cronostar.const import CONF_DISPATCH_BURST, CONF_DISPATCH_RATE, DOMAIN
+from custom_components.cronostar.utils import dispatch_queue as dispatch_mod
+from custom_components.cronostar.utils.dispatch_queue import DispatchQueue, get_dispatch_queue
+from custom_components.cronostar.utils.metrics import MetricsRegistry
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def _registry(platforms):
+    registry = MagicMock()
+    registry.async_get.side_effect = lambda entity_id: MagicMock(platform=platforms[entity_id]) if entity_id in platforms else None
+    return MagicMock(return_value=registry)
+
+
+def test_unlimited_calls_straight_through(hass):
+    hass.services.async_call = AsyncMock()
+    queue = DispatchQueue(hass, metrics=MetricsRegistry())
+    run(queue.async_call("climate.a", "climate", "set_temperature", {"entity_id": "climate.a", "temperature": 20}))
+    hass.services.async_call.assert_awaited_once_with("climate", "set_temperature", {"entity_id": "climate.a", "temperature": 20}, blocking=True)
+    assert queue.metrics.timer_stats("dispatch.wait") is None
+
+
+def test_burst_smoothed_in_order_per_integration(hass):
+    metrics = MetricsRegistry()
+    queue = DispatchQueue(hass, rate=50, burst=2, metrics=metrics)
+    calls, depths = [], []
+
+    async def record(domain, service, data, blocking):
+        calls.append((data["entity_id"], time.monotonic()))
+        if data["entity_id"].startswith("climate."):
+            depths.append(metrics.gauge("dispatch.queue_depth.nest"))
+
+    hass.services.async_call = AsyncMock(side_effect=record)
+    entities = [f"climate.room_{i}" for i in range(5)]
+
+    async def burst():
+        await asyncio.gather(*(queue.async_call(e, "climate", "set_temperature", {"entity_id": e}) for e in entities + ["switch.pump"]))
+
+    with patch.object(dispatch_mod.er, "async_get", _registry({e: "nest" for e in entities})):
+        run(burst())
+
+    nest = [c for c in calls if c[0].startswith("climate.")]
+    assert [c[0] for c in nest] == entities
+    # Two calls go out back to back, the remaining three are spaced at 50/s
+    assert nest[-1][1] - nest[0][1] >= 3 / 50 * 0.9
+    # Other integrations are not held behind the throttled one
+    assert [c[0] for c in calls].index("switch.pump") < len(calls) - 1
+    assert depths == [5, 4, 3, 2, 1]
+    assert metrics.gauge("dispatch.queue_depth") == 0
+    assert metrics.timer_stats("dispatch.wait")["count"] == 6
+
+
+def test_integration_key_falls_back_to_domain(hass):
+    queue = DispatchQueue(hass, metrics=MetricsRegistry())
+    with patch.object(dispatch_mod.er, "async_get", _registry({"climate.a": "tado"})):
+        assert queue.key_for("climate.a") == "tado"
+        assert queue.key_for("cover.b") == "cover"
+
+
+def test_queue_built_from_global_options(hass):
+    hass.data = {DOMAIN: {"global_config": {CONF_DISPATCH_RATE: 2, CONF_DISPATCH_BURST: 0}}}
+    queue = get_dispatch_queue(hass)
+    assert (queue.rate, queue.burst, queue.jitter) == (2.0, 1, 0.0)
+    assert get_dispatch_queue(hass) is queue
+
+    queue.configure(0, 5, 0.5)
+    assert not queue.rate and queue.jitter == 0.5
+
+
+def test_tick_returns_before_throttled_calls(mock_coordinator):
+    coord = mock_coordinator
+    queue = get_dispatch_queue(coord.hass)
+    queue.configure(20, 1, 0)
+    coord.hass.services.async_call = AsyncMock()
+
+    async def ticks():
+        start = time.monotonic()
+        await coord._update_target_entity(20.0)
+        await coord._update_target_entity(21.0)
+        elapsed = time.monotonic() - start
+        assert queue.queue_depth() == 2
+        coord.hass.services.async_call.assert_not_called()
+        await queue._buckets["climate"].drain
+        return elapsed
+
+    assert run(ticks()) < 0.05
+    assert [c[0][2]["temperature"] for c in coord.hass.services.async_call.call_args_list] == [20.0, 21.0]
+    assert queue.queue_depth() == 0
@@ -0,0 +1,102 @@
+"""Test the schedule forecast service and websocket command."""
+import asyncio
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.cronostar.const import DOMAIN
+from custom_components.cronostar.services.forecast_service import ForecastService
+from custom_components.cronostar.setup.panel_websocket import websocket_forecast
+from custom_components.cronostar.storage.storage_manager import StorageManager
+from custom_components.cronostar.utils.schedule_table import DAY_MINUTES, compile_day_table
+
+THERMO = [{"time": "00:00", "value": 18.0}, {"time": "06:00", "value": 21.0}, {"time": "22:00", "value": 18.0}]
+SWITCH = [{"time": "00:00", "value": 0}, {"time": "07:00", "value": 1}, {"time": "08:00", "value": 0}]
+START = datetime(2024, 1, 1, 12, 0)  # Monday
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.fixture
+def forecast_service(hass, tmp_path):
+    storage = StorageManager(hass, tmp_path / "profiles")
+    run(storage.save_profile("Default", "thermostat", {"schedule": THERMO}, {"global_prefix": "cronostar_thermostat_a_"}, "cronostar_thermostat_a_"))
+    run(storage.save_profile("Comfort", "generic_switch", {"schedule": SWITCH}, {"global_prefix": "cronostar_generic_switch_b_", "last_active_profile": "Comfort"}, "cronostar_generic_switch_b_"))
+
+    MockConfigEntry(domain=DOMAIN, data={"component_installed": True}, entry_id="global").add_to_hass(hass)
+    MockConfigEntry(entry_id="a", data={"global_prefix": "cronostar_thermostat_a_", "preset_type": "thermostat", "target_entity": "climate.a"}).add_to_hass(hass)
+    switch_entry = MockConfigEntry(entry_id="b", data={"global_prefix": "cronostar_generic_switch_b", "preset_type": "generic_switch", "target_entity": "switch.b"})
+    switch_entry.runtime_data = MagicMock(selected_profile="Comfort", is_enabled=False)
+    switch_entry.add_to_hass(hass)
+    return ForecastService(hass, storage)
+
+
+def test_transitions_across_periods():
+    table = compile_day_table(THERMO)
+    # 12:00 for 48h: 22:00, 06:00, 22:00, 06:00 (next day)
+    assert table.transitions(720, 2 * DAY_MINUTES, 21.0) == [(600, 18.0), (1080, 21.0), (2040, 18.0), (2520, 21.0)]
+    assert table.transitions(720, 60, 21.0) == []
+    assert compile_day_table([]).transitions(0, 100, None) == []
+
+
+def test_forecast_all_controllers(forecast_service):
+    result = run(forecast_service.async_forecast(horizon_hours=24, start=START))
+
+    assert result["horizon_minutes"] == 1440
+    by_entry = {c["entry_id"]: c for c in result["controllers"]}
+    assert set(by_entry) == {"a", "b"}
+
+    thermo = by_entry["a"]
+    assert thermo["profile"] == "Default" and thermo["current_value"] == 19.88  # ramping 21 -> 18 until 22:00
+    assert thermo["transitions"] == [
+        {"at": "2024-01-01T22:00:00", "in_minutes": 600, "value": 18.0},
+        {"at": "2024-01-02T06:00:00", "in_minutes": 1080, "value": 21.0},
+    ]
+    assert "samples" not in thermo
+
+    switch = by_entry["b"]
+    assert switch["enabled"] is False
+    assert switch["current_value"] == 0
+    assert [t["at"] for t in switch["transitions"]] == ["2024-01-02T07:00:00", "2024-01-02T08:00:00"]
+
+
+def test_forecast_prefix_filter_and_samples(forecast_service):
+    result = run(forecast_service.async_forecast(prefixes=["cronostar_thermostat_a"], horizon_hours=1, resolution=30, start=START))
+
+    [thermo] = result["controllers"]
+    # Ramped preset: samples between breakpoints are interpolated
+    assert thermo["samples"] == [
+        {"at": "2024-01-01T12:00:00", "value": 19.88},
+        {"at": "2024-01-01T12:30:00", "value": 19.78},
+        {"at": "2024-01-01T13:00:00", "value": 19.69},
+    ]
+    ramp = run(forecast_service.async_forecast(prefixes=["cronostar_thermostat_a_"], horizon_hours=1, resolution=60, start=datetime(2024, 1, 1, 3, 0)))
+    assert ramp["controllers"][0]["samples"][0]["value"] == 19.5
+
+
+def test_forecast_invalid_resolution(forecast_service):
+    with pytest.raises(Exception, match="Resolution"):
+        run(forecast_service.async_forecast(horizon_hours=168, resolution=1))
+
+
+def test_forecast_service_and_websocket(hass, forecast_service):
+    call = MagicMock()
+    call.data = {"prefixes": ["cronostar_generic_switch_b_"], "horizon": 2}
+    assert len(run(forecast_service.forecast(call))["controllers"]) == 1
+
+    connection = MagicMock()
+    run(websocket_forecast(hass, connection, {"id": 5, "type": "cronostar/forecast"}))
+    connection.send_error.assert_called_once()
+
+    hass.data[DOMAIN] = {"forecast_service": forecast_service}
+    connection = MagicMock()
+    run(websocket_forecast(hass, connection, {"id": 6, "type": "cronostar/forecast", "horizon": 24}))
+    assert len(connection.send_result.call_args[0][1]["controllers"]) == 2
+
+    connection = MagicMock()
+    run(websocket_forecast(hass, connection, {"id": 7, "type": "cronostar/forecast", "resolution": -5}))
+    assert connection.send_error.call_args[0][1] == "invalid_format"
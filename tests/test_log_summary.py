@@ -0,0 +1,141 @@
+"""Test aggregated apply logging and level-gated log_operation."""
+import asyncio
+import logging
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.cronostar.const import CONF_LOGGING_ENABLED, DOMAIN
+from custom_components.cronostar.coordinator import CronoStarCoordinator
+from custom_components.cronostar.utils import log_summary as summary_mod
+from custom_components.cronostar.utils.error_handler import log_operation
+from custom_components.cronostar.utils.log_summary import ApplyLogSummary, get_apply_summary
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def _make_coordinator(hass, mock_entry, global_config=None):
+    mock_entry.data = {
+        "target_entity": "climate.test_entity",
+        "name": "Test Controller",
+        "preset_type": "thermostat",
+        "global_prefix": "cronostar_",
+    }
+    mock_entry.options = {}
+    hass.data = {DOMAIN: {"storage_manager": MagicMock(), "global_config": global_config or {}}}
+    hass.services.async_call = AsyncMock()
+    return CronoStarCoordinator(hass, mock_entry)
+
+
+# ---------------------------------------------------------------------------
+# log_operation
+# ---------------------------------------------------------------------------
+
+def test_log_operation_skips_formatting_when_disabled():
+    """Context values are never stringified when the level is filtered out."""
+    value = MagicMock()
+    with patch("custom_components.cronostar.utils.error_handler._LOGGER") as mock_logger:
+        mock_logger.isEnabledFor.return_value = False
+        log_operation("op", True, value=value)
+
+    mock_logger.log.assert_not_called()
+    value.__str__.assert_not_called()
+
+
+def test_log_operation_uses_lazy_arguments():
+    with patch("custom_components.cronostar.utils.error_handler._LOGGER") as mock_logger:
+        mock_logger.isEnabledFor.return_value = True
+        log_operation("op", False, error="boom")
+
+    mock_logger.log.assert_called_once_with(logging.WARNING, "%s %s (%s)", "✗", "op", "error=boom")
+
+
+# ---------------------------------------------------------------------------
+# ApplyLogSummary
+# ---------------------------------------------------------------------------
+
+def test_summary_emits_one_line_per_interval(hass):
+    logger = MagicMock()
+    logger.isEnabledFor.return_value = True
+    summary = ApplyLogSummary(logger, interval=60)
+    with patch.object(summary_mod, "async_track_time_interval", MagicMock(return_value=MagicMock())) as track:
+        summary.async_start(hass)
+        summary.async_start(hass)
+    track.assert_called_once()
+    assert track.call_args[0][2] == timedelta(seconds=60)
+    tick = track.call_args[0][1]
+
+    summary.record("climate.a", 21.0, "Default", "climate.set_temperature")
+    summary.record("climate.b", 19.0, "Eco", "climate.set_temperature")
+    summary.record("climate.c", 18.0, "Night", "climate.set_temperature")
+    summary.record("climate.a", 21.5, "Default", "climate.set_temperature")
+    logger.info.assert_not_called()
+
+    # The timer emits the window without any follow-up record
+    tick(None)
+    logger.info.assert_called_once()
+    assert logger.info.call_args[0][1] == 3  # distinct entities in the window
+    assert "climate.a=21.5 (Default)" in logger.debug.call_args[0][1]
+
+    tick(None)
+    logger.info.assert_called_once()
+
+
+def test_summary_stop_cancels_timer_and_flushes(hass):
+    logger = MagicMock()
+    logger.isEnabledFor.return_value = True
+    summary = ApplyLogSummary(logger)
+    with patch.object(summary_mod, "async_track_time_interval", MagicMock(return_value=MagicMock())) as track:
+        summary.async_start(hass)
+
+    summary.record("climate.a", 21.0, "Default", "climate.set_temperature")
+    summary.async_stop()
+    track.return_value.assert_called_once()
+    logger.info.assert_called_once()
+
+
+def test_summary_flush_is_silent_when_filtered():
+    logger = MagicMock()
+    logger.isEnabledFor.return_value = False
+    summary = ApplyLogSummary(logger)
+
+    summary.record("climate.a", 21.0, "Default", "climate.set_temperature")
+    summary.flush()
+
+    logger.info.assert_not_called()
+    assert summary._applied == {}
+
+
+def test_get_apply_summary_is_shared(hass):
+    hass.data = {}
+    first = get_apply_summary(hass, MagicMock())
+    assert get_apply_summary(hass, MagicMock()) is first
+
+
+# ---------------------------------------------------------------------------
+# Coordinator integration
+# ---------------------------------------------------------------------------
+
+def test_coordinator_quiet_mode_routes_to_summary(hass, mock_entry):
+    coord = _make_coordinator(hass, mock_entry)
+
+    with patch("custom_components.cronostar.coordinator._LOGGER") as mock_logger, \
+         patch("custom_components.cronostar.coordinator.log_operation") as mock_log_op:
+        run(coord._update_target_entity(21.0, next_change=("22:00", 45)))
+
+    mock_logger.info.assert_not_called()
+    mock_log_op.assert_not_called()
+    assert hass.data[DOMAIN]["apply_log_summary"]._applied["climate.test_entity"][0] == 21.0
+
+
+def test_coordinator_global_logging_restores_detail(hass, mock_entry):
+    coord = _make_coordinator(hass, mock_entry, global_config={CONF_LOGGING_ENABLED: True})
+
+    with patch("custom_components.cronostar.coordinator._LOGGER") as mock_logger, \
+         patch("custom_components.cronostar.coordinator.log_operation") as mock_log_op:
+        run(coord._update_target_entity(21.0, next_change=("22:00", 45)))
+
+    assert mock_logger.info.call_count == 2
+    mock_log_op.assert_called_once()
+    assert "apply_log_summary" not in hass.data[DOMAIN]
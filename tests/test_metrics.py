@@ -0,0 +1,177 @@
+"""Test runtime performance metrics."""
+import asyncio
+from unittest.mock import MagicMock
+
+from custom_components.cronostar.const import DOMAIN
+from custom_components.cronostar.utils.metrics import MetricsRegistry, get_metrics
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def _make_hass(tmp_path):
+    hass = MagicMock()
+    hass.data = {}
+    hass.config.path = MagicMock(return_value=str(tmp_path))
+
+    async def fake_executor(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = fake_executor
+    return hass
+
+
+# ---------------------------------------------------------------------------
+# MetricsRegistry
+# ---------------------------------------------------------------------------
+
+def test_counters_and_percentiles():
+    metrics = MetricsRegistry()
+    for value in range(1, 101):
+        metrics.observe("tick", float(value))
+    metrics.increment("hits")
+    metrics.increment("hits", 2)
+
+    assert metrics.counter("hits") == 3
+    assert metrics.counter("missing") == 0
+    assert metrics.percentile("tick", 50) == 50.0
+    assert metrics.percentile("tick", 95) == 95.0
+    assert metrics.percentile("missing", 95) is None
+
+    snap = metrics.snapshot()
+    assert snap["counters"] == {"hits": 3}
+    assert snap["timers"]["tick"] == {"count": 100, "p50_ms": 50.0, "p95_ms": 95.0, "max_ms": 100.0, "mean_ms": 50.5}
+
+
+def test_window_bounds_samples_but_not_count():
+    metrics = MetricsRegistry(window=4)
+    for value in (100.0, 1.0, 2.0, 3.0, 4.0):
+        metrics.observe("tick", value)
+
+    stats = metrics.timer_stats("tick")
+    assert stats["count"] == 5
+    assert stats["max_ms"] == 4.0
+
+
+def test_ratio():
+    metrics = MetricsRegistry()
+    assert metrics.ratio("hits", "misses") is None
+    metrics.increment("hits", 3)
+    metrics.increment("misses")
+    assert metrics.ratio("hits", "misses") == 0.75
+
+
+def test_parent_receives_samples():
+    parent = MetricsRegistry()
+    child = MetricsRegistry(parent=parent)
+    child.observe("tick", 2.0)
+    child.increment("calls")
+
+    assert parent.timer_stats("tick")["count"] == 1
+    assert parent.counter("calls") == 1
+
+
+def test_timer_phases_and_wrap_async():
+    metrics = MetricsRegistry()
+    with metrics.timer("block"):
+        pass
+
+    phases = metrics.phases("op")
+    phases.mark("first")
+    phases.mark("second")
+    phases.done()
+
+    async def handler(value):
+        return value * 2
+
+    wrapped = metrics.wrap_async("service.x", handler)
+    assert run(wrapped(21)) == 42
+    assert wrapped.__name__ == "handler"
+
+    assert set(metrics.snapshot()["timers"]) == {"block", "op.first", "op.second", "op", "service.x"}
+
+
+def test_get_metrics_is_shared(tmp_path):
+    hass = _make_hass(tmp_path)
+    metrics = get_metrics(hass)
+    assert get_metrics(hass) is metrics
+    assert hass.data[DOMAIN]["metrics"] is metrics
+
+
+# ---------------------------------------------------------------------------
+# Instrumentation
+# ---------------------------------------------------------------------------
+
+def test_storage_cache_and_write_metrics(tmp_path):
+    from custom_components.cronostar.storage.storage_manager import StorageManager
+
+    hass = _make_hass(tmp_path)
+    storage = StorageManager(hass, tmp_path / "profiles", metrics=get_metrics(hass))
+    run(storage.save_profile(
+        profile_name="Comfort",
+        preset_type="thermostat",
+        profile_data={"schedule": [{"time": "08:00", "value": 21.0}]},
+        metadata={},
+        global_prefix="cronostar_thermostat_k_",
+    ))
+    storage.metrics.reset()
+
+    fname = "cronostar_thermostat_k_data.json"
+    run(storage.load_profile_cached(fname, force_reload=True))
+    run(storage.load_profile_cached(fname))
+    run(storage.load_profile_cached(fname))
+
+    metrics = get_metrics(hass)
+    assert metrics.counter("storage.cache_misses") == 1
+    assert metrics.counter("storage.cache_hits") == 2
+    assert metrics.counter("storage.cache_stat_calls") == 2
+
+    run(storage._write_json(storage.profiles_dir / "x.json", {"a": 1}))
+    assert metrics.counter("storage.writes") == 1
+    assert metrics.counter("storage.write_bytes") == len('{\n  "a": 1\n}')
+    assert metrics.timer_stats("storage.write_json")["count"] == 1
+
+
+def test_diagnostics_include_metrics(hass):
+    from custom_components.cronostar.diagnostics import async_get_config_entry_diagnostics
+
+    entry = MagicMock()
+    entry.data = {}
+    entry.options = {}
+    coordinator = MagicMock()
+    coordinator.preset_type = "thermostat"
+    coordinator.metrics = MetricsRegistry()
+    coordinator.metrics.observe("coordinator.apply_schedule", 5.0)
+    entry.runtime_data = coordinator
+    hass.data[DOMAIN] = {}
+    get_metrics(hass).increment("storage.cache_hits")
+
+    result = run(async_get_config_entry_diagnostics(hass, entry))
+
+    assert result["controller_state"]["preset"] == "thermostat"
+    assert result["controller_metrics"]["timers"]["coordinator.apply_schedule"]["count"] == 1
+    assert result["metrics"]["counters"] == {"storage.cache_hits": 1}
+
+
+def test_metric_sensors(hass):
+    from custom_components.cronostar.sensor import CronoStarApplyTimeSensor, CronoStarCacheHitRatioSensor
+
+    coordinator = MagicMock()
+    coordinator.prefix = "cronostar_thermostat_k_"
+    coordinator.metrics = MetricsRegistry()
+    coordinator.storage_manager.metrics = MetricsRegistry()
+
+    apply_sensor = CronoStarApplyTimeSensor(coordinator)
+    ratio_sensor = CronoStarCacheHitRatioSensor(coordinator)
+    assert apply_sensor.unique_id == "cronostar_thermostat_k_apply_time_p95"
+    assert apply_sensor.native_value is None
+    assert ratio_sensor.native_value is None
+
+    coordinator.metrics.observe("coordinator.apply_schedule", 12.0)
+    coordinator.storage_manager.metrics.increment("storage.cache_hits", 9)
+    coordinator.storage_manager.metrics.increment("storage.cache_misses")
+
+    assert apply_sensor.native_value == 12.0
+    assert apply_sensor.extra_state_attributes["count"] == 1
+    assert ratio_sensor.native_value == 90.0
@@ -74,3 +74,58 @@ def test_websocket_get_controllers(hass):
     assert len(result["controllers"]) == 1
     assert result["controllers"][0]["entry_id"] == "c1"
     assert result["controllers"][0]["data"]["preset_type"] == "thermostat"
+
+def test_websocket_subscribe_settings(hass):
+    """Subscription sends current settings and pushes updates."""
+    from custom_components.cronostar.setup.panel_websocket import websocket_subscribe_settings
+
+    listeners = []
+    settings_manager = MagicMock()
+    settings_manager.load_settings = AsyncMock(return_value={"keyboard": {}})
+    settings_manager.async_add_listener = MagicMock(side_effect=lambda cb: listeners.append(cb) or "unsub")
+    hass.data[DOMAIN] = {"settings_manager": settings_manager}
+
+    connection = MagicMock()
+    connection.subscriptions = {}
+    msg = {"id": 7, "type": "cronostar/subscribe_settings"}
+
+    run(websocket_subscribe_settings(hass, connection, msg))
+
+    connection.send_result.assert_called_once_with(7)
+    assert connection.subscriptions[7] == "unsub"
+    assert connection.send_message.call_args[0][0]["event"] == {"settings": {"keyboard": {}}}
+
+    listeners[0]({"keyboard": {"ctrl": {}}})
+    assert connection.send_message.call_args[0][0]["event"] == {"settings": {"keyboard": {"ctrl": {}}}}
+
+def test_websocket_subscribe_settings_not_ready(hass):
+    """Subscription fails cleanly before global setup."""
+    from custom_components.cronostar.setup.panel_websocket import websocket_subscribe_settings
+
+    hass.data[DOMAIN] = {}
+    connection = MagicMock()
+    run(websocket_subscribe_settings(hass, connection, {"id": 8}))
+    assert connection.send_error.call_args[0][1] == "not_ready"
+
+
+def test_websocket_get_controllers_includes_coordinator_state(hass):
+    """Profile state unrecorded on the sensor is served with the controller."""
+    from types import MappingProxyType
+    from custom_components.cronostar.sensor import CronoStarCurrentSensor
+
+    entry = MagicMock()
+    entry.entry_id = "c3"
+    entry.data = {"preset_type": "thermostat"}
+    entry.runtime_data.data = MappingProxyType({"selected_profile": "Comfort", "is_enabled": False, "current_value": 20.5, "available_profiles": ("Default", "Comfort")})
+    idle = MagicMock(runtime_data=None, entry_id="c4", data={"preset_type": "thermostat"})
+    hass.data[DOMAIN] = {}
+    hass.config_entries.async_entries = MagicMock(return_value=[entry, idle])
+    connection = MagicMock()
+
+    run(websocket_get_controllers(hass, connection, {"id": 3, "type": "cronostar/get_controllers"}))
+
+    first, second = connection.send_result.call_args[0][1]["controllers"]
+    assert first["state"] == {"active_profile": "Comfort", "is_enabled": False, "current_value": 20.5, "available_profiles": ["Default", "Comfort"]}
+    assert second["state"] is None
+    assert "active_profile" not in CronoStarCurrentSensor._unrecorded_attributes
+    assert {"all_profiles", "min_value", "y_axis_label"} <= CronoStarCurrentSensor._unrecorded_attributes
@@ -114,3 +114,18 @@ def test_platform_setup_entries(hass, mock_coordinator):
     async_add_entities.reset_mock()
     run(setup_switch(hass, entry, async_add_entities))
     assert async_add_entities.called
+
+
+def test_entities_accept_snapshot_data(hass, mock_coordinator):
+    """Snapshot tuples are exposed as lists; metric sensors poll without refreshing the coordinator."""
+    from types import MappingProxyType
+    from custom_components.cronostar.sensor import CronoStarApplyTimeSensor
+
+    mock_coordinator.data = MappingProxyType({**mock_coordinator.data, "available_profiles": ("Default", "Comfort")})
+    assert CronoStarProfileSelect(mock_coordinator).options == ["Default", "Comfort"]
+    assert CronoStarCurrentSensor(mock_coordinator).extra_state_attributes["all_profiles"] == ["Default", "Comfort"]
+
+    metric = CronoStarApplyTimeSensor(mock_coordinator)
+    assert metric._attr_should_poll is True
+    run(metric.async_update())
+    mock_coordinator.async_request_refresh.assert_not_called()
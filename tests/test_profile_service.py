@@ -381,8 +381,8 @@ class TestSaveProfileDashboardError:
 
         hass.config_entries.async_update_entry.assert_called_once()
 
-    def test_save_profile_coordinator_refresh_called(self, hass):
-        """Branch: config entry has runtime_data → async_refresh_profiles called."""
+    def test_save_profile_coordinator_not_reloaded(self, hass):
+        """Branch: config entry has runtime_data → no forced re-read (storage change bus)."""
         storage = MagicMock()
         storage.save_profile = AsyncMock()
         storage.get_cached_containers = AsyncMock(return_value=[])
@@ -414,7 +414,7 @@ class TestSaveProfileDashboardError:
         ):
             run(svc.save_profile(call_data))
 
-        coord.async_refresh_profiles.assert_called_once()
+        coord.async_refresh_profiles.assert_not_called()
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -486,8 +486,8 @@ class TestAddProfile:
         with pytest.raises(ps_mod.HomeAssistantError):
             run(svc.add_profile(call_data))
 
-    def test_add_profile_notifies_coordinator(self, hass):
-        """Branch: entry with matching prefix + runtime_data → refresh called."""
+    def test_add_profile_does_not_reload_coordinator(self, hass):
+        """Branch: entry with matching prefix + runtime_data → no forced refresh."""
         storage = MagicMock()
         storage.save_profile = AsyncMock()
 
@@ -506,7 +506,8 @@ class TestAddProfile:
             global_prefix="cronostar_thermostat_kitchen_",
         )
         run(svc.add_profile(call_data))
-        coord.async_refresh_profiles.assert_called_once()
+        storage.save_profile.assert_awaited_once()
+        coord.async_refresh_profiles.assert_not_called()
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -522,7 +523,7 @@ class TestDeleteProfile:
         with pytest.raises(ps_mod.HomeAssistantError):
             run(svc.delete_profile(_call()))
 
-    def test_delete_profile_success_notifies_coordinator(self, hass):
+    def test_delete_profile_success_does_not_reload_coordinator(self, hass):
         storage = MagicMock()
         storage.delete_profile = AsyncMock(return_value=True)
 
@@ -537,7 +538,8 @@ class TestDeleteProfile:
         svc = _make_service(hass, storage)
         run(svc.delete_profile(_call(profile_name="Summer", preset_type="thermostat",
                                       global_prefix="cronostar_thermostat_kitchen_")))
-        coord.async_refresh_profiles.assert_called_once()
+        storage.delete_profile.assert_awaited_once()
+        coord.async_refresh_profiles.assert_not_called()
 
     def test_delete_profile_storage_returns_false(self, hass):
         """Branch: delete returns False → log_operation called with failure."""
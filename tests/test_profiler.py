@@ -0,0 +1,91 @@
+"""Test the opt-in profiling service."""
+import asyncio
+import pstats
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.cronostar.const import DOMAIN
+from custom_components.cronostar.utils import profiler as profiler_mod
+from custom_components.cronostar.utils.profiler import ENGINE_CPROFILE, IntegrationProfiler, get_profiler
+from custom_components.cronostar.utils.prefix_normalizer import normalize_preset_type
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_cprofile_session_writes_file_and_summary(hass):
+    cancel = MagicMock()
+    with patch.object(profiler_mod, "async_call_later", return_value=cancel) as call_later:
+        profiler = IntegrationProfiler(hass)
+        info = profiler.start(duration=5000, engine=ENGINE_CPROFILE, top_n=5)
+        for _ in range(50):
+            normalize_preset_type("generic_switch")
+        result = run(profiler.async_stop())
+
+    assert info["engine"] == ENGINE_CPROFILE
+    assert info["duration"] == profiler_mod.MAX_DURATION
+    assert call_later.call_args[0][1] == profiler_mod.MAX_DURATION
+    cancel.assert_called_once()
+    assert profiler.running is False
+
+    assert result["file"].endswith(".prof")
+    assert pstats.Stats(result["file"]).total_calls > 0
+    assert 0 < len(result["top"]) <= 5
+    # Summary only lists this integration's functions
+    assert all(row["function"].startswith("cronostar/") for row in result["top"])
+    assert any("normalize_preset_type" in row["function"] for row in result["top"])
+
+
+def test_start_twice_and_stop_without_session(hass):
+    profiler = IntegrationProfiler(hass)
+    with pytest.raises(Exception, match="not running"):
+        run(profiler.async_stop())
+
+    profiler.start(engine=ENGINE_CPROFILE)
+    try:
+        with pytest.raises(Exception, match="already running"):
+            profiler.start(engine=ENGINE_CPROFILE)
+    finally:
+        profiler.async_cancel()
+    assert profiler.running is False
+
+
+def test_unknown_or_missing_engine(hass):
+    profiler = IntegrationProfiler(hass)
+    with pytest.raises(Exception, match="Unknown profiling engine"):
+        profiler.start(engine="perf")
+    with patch.object(profiler_mod, "_yappi_available", return_value=False):
+        with pytest.raises(Exception, match="yappi is not installed"):
+            profiler.start(engine="yappi")
+        assert profiler.start(engine="auto")["engine"] == ENGINE_CPROFILE
+    profiler.async_cancel()
+
+
+def test_timeout_stops_and_result_is_kept(hass):
+    profiler = IntegrationProfiler(hass)
+    profiler.start(engine=ENGINE_CPROFILE)
+    run(profiler._async_timeout(None))
+
+    assert profiler.running is False
+    # A late stop_profiling call returns the auto-stopped result
+    assert run(profiler.async_stop()) is profiler.last_result
+
+
+def test_profiling_services(hass):
+    from custom_components.cronostar.setup.services import setup_services
+
+    hass.data[DOMAIN] = {"settings_manager": MagicMock()}
+    run(setup_services(hass, MagicMock()))
+    handlers = {c[0][1]: c[0][2] for c in hass.services.async_register.call_args_list}
+    assert get_profiler(hass) is hass.data[DOMAIN]["profiler"]
+
+    call = MagicMock()
+    call.data = {"engine": "cprofile", "duration": 30}
+    started = run(handlers["start_profiling"](call))
+    assert started["duration"] == 30
+
+    call.data = {"top": 3}
+    result = run(handlers["stop_profiling"](call))
+    assert len(result["top"]) <= 3
@@ -0,0 +1,125 @@
+"""Test background retries of failed target applications."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.cronostar.utils import retry_queue as retry_mod
+from custom_components.cronostar.utils.dispatch_queue import get_dispatch_queue
+from custom_components.cronostar.utils.metrics import MetricsRegistry
+from custom_components.cronostar.utils.retry_queue import RetryQueue, get_retry_queue
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.fixture
+def call_later():
+    with patch.object(retry_mod, "async_call_later", MagicMock(return_value=MagicMock())) as mock:
+        yield mock
+
+
+def test_backoff_until_success(hass, call_later):
+    queue = RetryQueue(hass, base_delay=5, max_delay=8, metrics=MetricsRegistry())
+    action = AsyncMock(side_effect=[RuntimeError("down"), RuntimeError("down"), None])
+
+    queue.add("climate.a", 21.0, action)
+    assert queue.pending == 1 and queue.metrics.gauge("retry.pending") == 1
+
+    for _ in range(3):
+        run(call_later.call_args[0][2](None))
+
+    assert [c[0][1] for c in call_later.call_args_list] == [5, 8, 8]
+    assert action.await_count == 3
+    assert queue.pending == 0 and queue.metrics.gauge("retry.pending") == 0
+    assert queue.metrics.counter("retry.failed") == 2
+    assert queue.metrics.counter("retry.succeeded") == 1
+
+
+def test_superseded_values_coalesce(hass, call_later):
+    queue = RetryQueue(hass, metrics=MetricsRegistry())
+    old, new = AsyncMock(), AsyncMock()
+
+    queue.add("climate.a", 20.0, old)
+    queue.add("climate.a", 22.0, new)
+    assert queue.pending == 1 and call_later.call_count == 1
+    assert queue.metrics.counter("retry.superseded") == 1
+
+    run(call_later.call_args[0][2](None))
+    old.assert_not_called()
+    new.assert_awaited_once()
+
+    queue.add("climate.a", 23.0, old)
+    queue.discard("climate.a")
+    call_later.return_value.assert_called_once()
+    assert queue.pending == 0
+
+
+def test_values_dropped_after_max_age(hass, call_later):
+    queue = RetryQueue(hass, max_age=0, metrics=MetricsRegistry())
+    queue.add("cover.b", 50, AsyncMock(side_effect=RuntimeError("down")))
+    run(call_later.call_args[0][2](None))
+    assert queue.pending == 0
+    assert queue.metrics.counter("retry.expired") == 1
+    assert call_later.call_count == 1
+
+
+def test_failed_application_queued_without_blocking(mock_coordinator, call_later):
+    coord = mock_coordinator
+    coord.hass.services.async_call = AsyncMock(side_effect=RuntimeError("cloud down"))
+    run(coord._update_target_entity(21.5))
+
+    retries = get_retry_queue(coord.hass)
+    assert retries.pending_entities() == ["climate.test_entity"]
+
+    # The retry re-applies the same value; a later successful tick would discard it instead
+    coord.hass.services.async_call = AsyncMock()
+    run(call_later.call_args[0][2](None))
+    coord.hass.services.async_call.assert_awaited_once_with(
+        "climate", "set_temperature", {"entity_id": "climate.test_entity", "temperature": 21.5}, blocking=True
+    )
+    assert retries.pending == 0
+
+    coord.hass.services.async_call = AsyncMock(side_effect=RuntimeError("cloud down"))
+    run(coord._update_target_entity(19.0))
+    coord.hass.services.async_call = AsyncMock()
+    run(coord._update_target_entity(19.5))
+    assert retries.pending == 0
+
+
+def test_error_raised_by_target_integration_is_retried(mock_coordinator, call_later):
+    coord = mock_coordinator
+    attempts = []
+
+    def set_temperature(call):
+        attempts.append(call.data["temperature"])
+        if len(attempts) == 1:
+            raise HomeAssistantError("device offline")
+
+    coord.hass.services.async_register("climate", "set_temperature", set_temperature)
+    run(coord._update_target_entity(21.5))
+    retries = get_retry_queue(coord.hass)
+    assert retries.pending_entities() == ["climate.test_entity"]
+
+    run(call_later.call_args[0][2](None))
+    assert attempts == [21.5, 21.5]
+    assert retries.pending == 0
+
+
+def test_slow_target_integration_times_out_into_retry(mock_coordinator, call_later):
+    coord = mock_coordinator
+    get_dispatch_queue(coord.hass).timeout = 0.01
+
+    async def set_temperature(call):
+        await asyncio.sleep(1)
+
+    coord.hass.services.async_register("climate", "set_temperature", set_temperature)
+
+    async def tick():
+        await coord._update_target_entity(20.0)
+        await asyncio.sleep(0.1)
+
+    run(tick())
+    assert get_retry_queue(coord.hass).pending_entities() == ["climate.test_entity"]
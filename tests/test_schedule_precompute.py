@@ -0,0 +1,79 @@
+"""Test precomputed per-minute schedule tables."""
+import asyncio
+import random
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+from custom_components.cronostar.const import CONF_PRECOMPUTE_SCHEDULES, DOMAIN
+from custom_components.cronostar.utils.schedule_table import DAY_MINUTES, WEEK_MINUTES, ScheduleTable, compile_day_table, compile_profile_table
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def _random_points(rng, period, count):
+    return [(rng.randrange(period), round(rng.uniform(5, 30), 1)) for _ in range(count)]
+
+
+def test_precomputed_values_match_breakpoint_lookup():
+    rng = random.Random(7)
+    for period in (DAY_MINUTES, WEEK_MINUTES):
+        for count in (1, 2, 5, 40):
+            points = _random_points(rng, period, count)
+            points.append(points[0])  # duplicate minute
+            for stepped in (False, True):
+                reference = ScheduleTable(points, period)
+                table = ScheduleTable(points, period)
+                table.precompute(stepped=stepped)
+                assert table._lookup.typecode == "d" and len(table._lookup) == period
+                for minute in range(0, period, 7):
+                    assert table.value_at(minute, stepped=stepped) == reference.value_at(minute, stepped=stepped)
+
+
+def test_lookup_only_used_for_matching_mode():
+    table = compile_day_table([{"time": "00:00", "value": 10.0}, {"time": "12:00", "value": 20.0}])
+    table.precompute(stepped=True)
+    assert table.value_at(360, stepped=True) == 10.0
+    assert table.value_at(360) == 15.0
+
+    empty = ScheduleTable([], DAY_MINUTES)
+    empty.precompute()
+    assert empty.value_at(0) is None
+
+
+def test_daily_table_matches_coordinator_interpolation(mock_coordinator):
+    schedule = [{"time": "06:30", "value": 17.5}, {"time": "08:00", "value": 21.0}, {"time": "22:15", "value": 16.0}, {"time": "24:00", "value": 18.0}]
+    table = compile_profile_table({"schedule": schedule})
+    assert table.period == DAY_MINUTES
+    table.precompute()
+
+    with patch("custom_components.cronostar.coordinator.datetime") as mock_dt:
+        for minute in (0, 200, 390, 391, 480, 900, 1335, 1400, 1439):
+            mock_dt.now.return_value = datetime(2024, 1, 1, minute // 60, minute % 60)
+            assert table.value_at(minute) == mock_coordinator._interpolate_schedule(schedule)
+            assert table.next_change(minute, table.value_at(minute)) == mock_coordinator._get_next_change(schedule, table.value_at(minute))
+
+
+def test_coordinator_uses_precomputed_table_when_enabled(mock_coordinator):
+    coord = mock_coordinator
+    coord._update_target_entity = AsyncMock()
+    schedule = [{"time": "00:00", "value": 18.0}, {"time": "12:00", "value": 22.0}]
+    coord.storage_manager.list_profiles = AsyncMock(return_value=["f.json"])
+    coord.storage_manager.load_profile_cached = AsyncMock(return_value={"profiles": {"Default": {"schedule": schedule}}})
+
+    with patch("custom_components.cronostar.coordinator.datetime") as mock_dt:
+        mock_dt.now.return_value = datetime(2024, 1, 1, 6, 0)
+        run(coord.apply_schedule())
+        assert coord._table_cache is None  # option off: plain interpolation, nothing compiled
+        legacy_value = coord._update_target_entity.call_args[0][0]
+
+        coord.hass.data[DOMAIN]["global_config"][CONF_PRECOMPUTE_SCHEDULES] = True
+        run(coord.apply_schedule())
+        table = coord._table_cache[3]
+        run(coord.apply_schedule())
+
+    assert coord._table_cache[3] is table
+    assert table._lookup is not None and len(table._lookup) == DAY_MINUTES
+    assert coord._update_target_entity.call_args[0] == (legacy_value, ("12:00", 360))
+    assert legacy_value == 20.0
@@ -537,6 +537,8 @@ def test_async_unload_services(hass):
     expected = [
         "save_profile", "load_profile", "add_profile", "delete_profile",
         "register_card", "list_all_profiles", "apply_now",
+        "start_profiling", "stop_profiling", "forecast",
+        "evaluate_schedules",
     ]
     for svc in expected:
         assert svc in removed, f"Servizio '{svc}' non deregistrato"
@@ -164,4 +164,4 @@ def test_list_all_profiles_not_running(hass):
 def test_async_unload_services_full(hass):
     """Test async_unload_services calls async_remove for all services."""
     run(async_unload_services(hass))
-    assert hass.services.async_remove.call_count == 7
+    assert hass.services.async_remove.call_count == 11
@@ -59,3 +59,122 @@ def test_deep_merge_edge_cases():
     result = manager._deep_merge(base, overlay)
     assert result["a"] == "not_a_dict"
     assert result["c"] == [3]
+
+def _make_real_hass(tmp_path):
+    hass = MagicMock()
+    hass.config.path = MagicMock(return_value=str(tmp_path))
+
+    async def fake_executor(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = fake_executor
+    return hass
+
+def test_load_settings_served_from_memory(tmp_path):
+    """Second load does not touch the disk."""
+    manager = SettingsManager(_make_real_hass(tmp_path), tmp_path)
+    (tmp_path / "settings.json").write_text(json.dumps({"keyboard": {"ctrl": {"horizontal": 5}}}), "utf-8")
+
+    first = run(manager.load_settings())
+    with patch("pathlib.Path.read_text", side_effect=AssertionError("disk read")), \
+         patch("pathlib.Path.exists", side_effect=AssertionError("disk stat")):
+        assert run(manager.load_settings()) == first
+    assert first["keyboard"]["ctrl"]["horizontal"] == 5
+
+
+def test_callers_and_listeners_get_copies(tmp_path):
+    """Mutating returned or pushed settings leaves the cache intact."""
+    manager = SettingsManager(_make_real_hass(tmp_path), tmp_path)
+    received = []
+    manager.async_add_listener(received.append)
+    manager.async_add_listener(received.append)
+
+    settings = run(manager.load_settings())
+    settings["keyboard"]["ctrl"]["horizontal"] = 99
+    assert run(manager.load_settings())["keyboard"]["ctrl"]["horizontal"] == 1
+    assert DEFAULT_SETTINGS["keyboard"]["ctrl"]["horizontal"] == 1
+
+    saved = {"keyboard": {"ctrl": {"horizontal": 2}}}
+    run(manager.save_settings(saved))
+    saved["keyboard"]["ctrl"]["horizontal"] = 3
+    received[0]["keyboard"]["ctrl"]["horizontal"] = 4
+    assert received[1]["keyboard"]["ctrl"]["horizontal"] == 2
+    assert run(manager.load_settings())["keyboard"]["ctrl"]["horizontal"] == 2
+
+
+def test_timer_pushes_external_change_to_listeners(tmp_path):
+    """Listeners receive an external edit without any caller loading the settings."""
+    import os
+
+    from custom_components.cronostar.storage import settings_manager as settings_mod
+
+    hass = _make_real_hass(tmp_path)
+    manager = SettingsManager(hass, tmp_path)
+    with patch.object(settings_mod, "async_track_time_interval", MagicMock(return_value=MagicMock())) as track:
+        manager.async_start()
+    recheck = track.call_args[0][1]
+
+    settings_file = tmp_path / "settings.json"
+    settings_file.write_text(json.dumps({"keyboard": {"ctrl": {"horizontal": 5}}}), "utf-8")
+    run(manager.load_settings())
+    received = []
+    manager.async_add_listener(received.append)
+
+    settings_file.write_text(json.dumps({"keyboard": {"ctrl": {"horizontal": 7}}}), "utf-8")
+    stat = settings_file.stat()
+    os.utime(settings_file, (stat.st_atime, stat.st_mtime + 10))
+
+    run(recheck(None))
+    assert [r["keyboard"]["ctrl"]["horizontal"] for r in received] == [7]
+    run(recheck(None))
+    assert len(received) == 1
+
+    manager.async_stop()
+    track.return_value.assert_called_once()
+
+def test_load_settings_picks_up_external_change(tmp_path):
+    """An external edit is detected once the recheck interval elapsed."""
+    import os
+
+    manager = SettingsManager(_make_real_hass(tmp_path), tmp_path)
+    settings_file = tmp_path / "settings.json"
+    settings_file.write_text(json.dumps({"keyboard": {"ctrl": {"horizontal": 5}}}), "utf-8")
+    run(manager.load_settings())
+
+    received = []
+    manager.async_add_listener(received.append)
+
+    settings_file.write_text(json.dumps({"keyboard": {"ctrl": {"horizontal": 7}}}), "utf-8")
+    stat = settings_file.stat()
+    os.utime(settings_file, (stat.st_atime, stat.st_mtime + 10))
+
+    # Within the recheck interval the memory copy is still served
+    assert run(manager.load_settings())["keyboard"]["ctrl"]["horizontal"] == 5
+
+    manager._checked_at -= 60
+    assert run(manager.load_settings())["keyboard"]["ctrl"]["horizontal"] == 7
+    assert len(received) == 1
+
+def test_save_settings_notifies_listeners(tmp_path):
+    manager = SettingsManager(_make_real_hass(tmp_path), tmp_path)
+    run(manager.load_settings())
+
+    received = []
+    remove = manager.async_add_listener(received.append)
+    assert run(manager.save_settings({"test": 1})) is True
+    assert received == [{"test": 1}]
+    # Saved settings are served without re-reading
+    assert run(manager.load_settings()) == {"test": 1}
+
+    remove()
+    run(manager.save_settings({"test": 2}))
+    assert len(received) == 1
+
+def test_failing_listener_does_not_break_save(tmp_path):
+    manager = SettingsManager(_make_real_hass(tmp_path), tmp_path)
+    received = []
+    manager.async_add_listener(MagicMock(side_effect=RuntimeError("boom")))
+    manager.async_add_listener(received.append)
+
+    assert run(manager.save_settings({"test": 1})) is True
+    assert received == [{"test": 1}]
@@ -0,0 +1,70 @@
+"""Test the storage change bus keeping coordinators coherent without re-reads."""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from custom_components.cronostar.storage.storage_manager import StorageManager
+
+FLAT = [{"time": "00:00", "value": 21.0}, {"time": "23:59", "value": 21.0}]
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def _save(storage, name, prefix, schedule=FLAT):
+    return run(storage.save_profile(name, "thermostat", {"schedule": schedule}, {}, prefix))
+
+
+def test_mutations_publish_cached_container(hass, tmp_path):
+    storage = StorageManager(hass, tmp_path / "profiles")
+    published = []
+    remove = storage.async_add_listener(lambda filename, container: published.append((filename, container)))
+
+    _save(storage, "Default", "cronostar_thermostat_k_")
+    _save(storage, "Eco", "cronostar_thermostat_k_")
+    filename, container = published[-1]
+    assert container is storage._cache[filename]
+    assert list(container["profiles"]) == ["Default", "Eco"]
+
+    run(storage.delete_profile("Eco", "thermostat", "cronostar_thermostat_k_"))
+    assert list(published[-1][1]["profiles"]) == ["Default"]
+    run(storage.delete_profile("Default", "thermostat", "cronostar_thermostat_k_"))
+    assert published[-1] == (filename, None)
+
+    remove()
+    _save(storage, "Default", "cronostar_thermostat_k_")
+    assert len(published) == 4
+
+
+def test_coordinator_follows_saves_without_rereads(mock_coordinator, tmp_path):
+    coord = mock_coordinator
+    storage = coord.storage_manager = StorageManager(coord.hass, tmp_path / "profiles")
+    coord.hass.services.async_call = AsyncMock()
+    coord.async_track_storage()
+    coord.async_track_storage()
+    assert len(storage._listeners) == 1
+
+    prefix = coord.canonical_prefix
+    with patch.object(storage, "list_profiles", wraps=storage.list_profiles) as listing, \
+            patch.object(storage, "load_profile_cached", wraps=storage.load_profile_cached) as loading:
+        _save(storage, "Default", prefix)
+        _save(storage, "Eco", prefix, [{"time": "00:00", "value": 17.0}, {"time": "23:59", "value": 17.0}])
+        for task in [c[0][0] for c in coord.hass.async_create_task.call_args_list]:
+            run(task)
+        listing.assert_not_called()
+        loading.assert_not_called()
+
+    assert coord.available_profiles == ["Default", "Eco"]
+    assert coord.current_value == 21.0
+    assert coord.data == coord._state_data()
+    coord.hass.services.async_call.assert_awaited_once_with(
+        "climate", "set_temperature", {"entity_id": "climate.test_entity", "temperature": 21.0}, blocking=True
+    )
+
+    # Other controllers' containers are ignored
+    calls = coord.hass.async_create_task.call_count
+    _save(storage, "Default", "cronostar_thermostat_other_")
+    assert coord.hass.async_create_task.call_count == calls
+
+    run(coord.async_shutdown())
+    assert storage._listeners == []
@@ -0,0 +1,255 @@
+"""Test Storage Manager journaled mode."""
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+from custom_components.cronostar.storage.journal import OP_SAVE_PROFILE, ProfileJournal
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+PREFIX = "cronostar_thermostat_k_"
+FILENAME = "cronostar_thermostat_k_data.json"
+
+
+def _make_hass(tmp_path):
+    hass = MagicMock()
+    hass.config.path = MagicMock(return_value=str(tmp_path))
+
+    async def fake_executor(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = fake_executor
+    return hass
+
+
+def _make_storage(tmp_path, journal_enabled=True):
+    from custom_components.cronostar.storage.storage_manager import StorageManager
+    return StorageManager(_make_hass(tmp_path), tmp_path / "profiles", journal_enabled=journal_enabled)
+
+
+def _save(storage, name, value):
+    return run(storage.save_profile(
+        profile_name=name,
+        preset_type="thermostat",
+        profile_data={"schedule": [{"time": "08:00", "value": value}]},
+        metadata={},
+        global_prefix=PREFIX,
+    ))
+
+
+def _read_main(storage):
+    return json.loads((storage.profiles_dir / FILENAME).read_text(encoding="utf-8"))
+
+
+# ---------------------------------------------------------------------------
+# Journaled writes
+# ---------------------------------------------------------------------------
+
+def test_first_save_writes_container_not_journal(tmp_path):
+    """A brand-new container is written in full so it stays discoverable."""
+    storage = _make_storage(tmp_path)
+    assert _save(storage, "Comfort", 21.0) is True
+
+    assert "Comfort" in _read_main(storage)["profiles"]
+    assert not storage._journal.path_for(FILENAME).exists()
+
+
+def test_subsequent_save_appends_to_journal(tmp_path):
+    """Edits to an existing container only append a journal record."""
+    storage = _make_storage(tmp_path)
+    _save(storage, "Comfort", 21.0)
+    main_before = (storage.profiles_dir / FILENAME).read_text(encoding="utf-8")
+
+    _save(storage, "Eco", 18.0)
+
+    assert (storage.profiles_dir / FILENAME).read_text(encoding="utf-8") == main_before
+    records = storage._journal.read(FILENAME)
+    assert [r["op"] for r in records] == [OP_SAVE_PROFILE]
+    assert records[0]["profile"] == "Eco"
+    # The cache reflects the change without re-reading
+    assert "Eco" in storage._cache[FILENAME]["profiles"]
+
+
+def test_fresh_manager_replays_journal(tmp_path):
+    """Readers replay pending records onto the container snapshot."""
+    storage = _make_storage(tmp_path)
+    _save(storage, "Comfort", 21.0)
+    _save(storage, "Eco", 18.0)
+    run(storage.update_active_profile("thermostat", PREFIX, "Eco"))
+
+    reader = _make_storage(tmp_path)
+    container = run(reader.load_profile_cached(FILENAME))
+
+    assert set(container["profiles"]) == {"Comfort", "Eco"}
+    assert container["meta"]["last_active_profile"] == "Eco"
+
+
+def test_delete_profile_is_journaled(tmp_path):
+    storage = _make_storage(tmp_path)
+    _save(storage, "Comfort", 21.0)
+    _save(storage, "Eco", 18.0)
+
+    assert run(storage.delete_profile("Eco", "thermostat", PREFIX)) is True
+
+    reader = _make_storage(tmp_path)
+    assert set(run(reader.load_profile_cached(FILENAME))["profiles"]) == {"Comfort"}
+
+
+def test_deleting_last_profile_removes_journal(tmp_path):
+    storage = _make_storage(tmp_path)
+    _save(storage, "Comfort", 21.0)
+    run(storage.update_enabled_state("thermostat", PREFIX, False))
+    assert storage._journal.path_for(FILENAME).exists()
+
+    assert run(storage.delete_profile("Comfort", "thermostat", PREFIX)) is True
+
+    assert not (storage.profiles_dir / FILENAME).exists()
+    assert not storage._journal.path_for(FILENAME).exists()
+
+
+def test_disabled_journal_ignores_log_on_load(tmp_path):
+    """Plain mode reads only the main file."""
+    storage = _make_storage(tmp_path)
+    _save(storage, "Comfort", 21.0)
+    _save(storage, "Eco", 18.0)
+
+    plain = _make_storage(tmp_path, journal_enabled=False)
+    assert set(run(plain.load_profile_cached(FILENAME))["profiles"]) == {"Comfort"}
+
+
+# ---------------------------------------------------------------------------
+# Compaction
+# ---------------------------------------------------------------------------
+
+def test_compact_folds_journal_into_container(tmp_path):
+    storage = _make_storage(tmp_path)
+    _save(storage, "Comfort", 21.0)
+    _save(storage, "Eco", 18.0)
+
+    assert run(storage.async_compact()) == 1
+
+    assert set(_read_main(storage)["profiles"]) == {"Comfort", "Eco"}
+    assert not storage._journal.path_for(FILENAME).exists()
+    assert FILENAME not in storage._journal_state
+
+
+def test_compact_runs_when_journal_disabled(tmp_path):
+    """Logs left by a previous journaled session are never lost."""
+    storage = _make_storage(tmp_path)
+    _save(storage, "Comfort", 21.0)
+    _save(storage, "Eco", 18.0)
+
+    plain = _make_storage(tmp_path, journal_enabled=False)
+    assert run(plain.async_compact()) == 1
+    assert set(_read_main(plain)["profiles"]) == {"Comfort", "Eco"}
+
+
+def test_compact_without_journal_is_noop(tmp_path):
+    storage = _make_storage(tmp_path)
+    _save(storage, "Comfort", 21.0)
+    assert run(storage.async_compact(FILENAME)) == 0
+
+
+def test_record_threshold_triggers_compaction(tmp_path):
+    storage = _make_storage(tmp_path)
+    _save(storage, "Comfort", 21.0)
+
+    with patch("custom_components.cronostar.storage.storage_manager.JOURNAL_MAX_RECORDS", 3):
+        for i in range(3):
+            _save(storage, f"P{i}", 20.0 + i)
+
+    assert not storage._journal.path_for(FILENAME).exists()
+    assert set(_read_main(storage)["profiles"]) == {"Comfort", "P0", "P1", "P2"}
+
+
+def test_age_threshold_compacts_due_journals(tmp_path):
+    storage = _make_storage(tmp_path)
+    _save(storage, "Comfort", 21.0)
+    _save(storage, "Eco", 18.0)
+    assert run(storage.async_compact_due()) == 0
+
+    storage._journal_state[FILENAME]["since"] -= 7200
+    assert run(storage.async_compact_due()) == 1
+    assert not storage._journal.path_for(FILENAME).exists()
+
+
+def test_timer_compacts_idle_journal(tmp_path):
+    from custom_components.cronostar.storage import storage_manager as storage_mod
+
+    storage = _make_storage(tmp_path)
+    unsub = MagicMock()
+    with patch.object(storage_mod, "async_track_time_interval", MagicMock(return_value=unsub)) as track:
+        storage.async_start()
+        storage.async_start()
+    track.assert_called_once()
+    tick = track.call_args[0][1]
+
+    _save(storage, "Comfort", 21.0)
+    _save(storage, "Eco", 18.0)
+    run(tick(None))
+    assert storage._journal.path_for(FILENAME).exists()
+
+    # No further writes: the age threshold alone folds the journal
+    storage._journal_state[FILENAME]["since"] -= 7200
+    run(tick(None))
+    assert not storage._journal.path_for(FILENAME).exists()
+    assert set(_read_main(storage)["profiles"]) == {"Comfort", "Eco"}
+
+    storage.async_stop()
+    unsub.assert_called_once()
+
+
+def test_get_history_returns_pending_records(tmp_path):
+    storage = _make_storage(tmp_path)
+    _save(storage, "Comfort", 21.0)
+    _save(storage, "Eco", 18.0)
+    run(storage.update_active_profile("thermostat", PREFIX, "Eco"))
+
+    history = run(storage.get_history(FILENAME))
+    assert [r["op"] for r in history] == ["save_profile", "update_meta"]
+    assert all("ts" in r for r in history)
+
+
+# ---------------------------------------------------------------------------
+# ProfileJournal
+# ---------------------------------------------------------------------------
+
+def test_journal_skips_torn_trailing_line(tmp_path):
+    journal = ProfileJournal(tmp_path)
+    journal.append(FILENAME, {"op": "update_meta", "meta": {"a": 1}})
+    with open(journal.path_for(FILENAME), "a", encoding="utf-8") as f:
+        f.write('{"op": "update_me')
+
+    records = journal.read(FILENAME)
+    assert len(records) == 1
+
+
+def test_journal_replay_ignores_unknown_ops():
+    container = {"meta": {}, "profiles": {"A": {}}}
+    ProfileJournal.replay(container, [{"op": "bogus"}, {"op": "delete_profile", "profile": "A"}])
+    assert container["profiles"] == {}
+
+
+def test_journal_files_are_not_listed_as_profiles(tmp_path):
+    storage = _make_storage(tmp_path)
+    _save(storage, "Comfort", 21.0)
+    _save(storage, "Eco", 18.0)
+
+    assert run(storage.list_profiles()) == [FILENAME]
+    assert storage._journal.list_journaled() == [FILENAME]
+
+
+def test_journal_serializes_compact_schedules(tmp_path):
+    from custom_components.cronostar.storage.compact_schedule import CompactSchedule
+
+    points = [{"time": "06:00", "value": 20.0}, {"time": "22:00", "value": 17.5}]
+    journal = ProfileJournal(tmp_path)
+    journal.append(FILENAME, {"op": OP_SAVE_PROFILE, "profile": "Default", "data": {"schedule": CompactSchedule.from_points(points)}})
+    assert journal.read(FILENAME)[0]["data"]["schedule"] == points
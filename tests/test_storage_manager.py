@@ -501,6 +501,24 @@ def test_get_cached_containers_filter_prefix(tmp_path):
     assert len(result) == 1
 
 
+def test_cached_containers_carry_precomputed_filter_keys(tmp_path):
+    """Canonical preset/prefix keys are computed when a container is cached."""
+    hass = _make_hass(tmp_path)
+    storage = _make_storage(hass, tmp_path)
+    _write_container(storage.profiles_dir / "cronostar_lamp_data.json", {"meta": {"preset_type": "plug", "global_prefix": "cronostar_switch_lamp_"}, "profiles": {}})
+    _write_container(storage.profiles_dir / "cronostar_legacy_data.json", {"meta": {"preset_type": "generic_switch"}, "profiles": {}})
+
+    assert run(storage.list_profiles(preset_type="light")) == ["cronostar_lamp_data.json", "cronostar_legacy_data.json"]
+    assert storage._cache_keys["cronostar_lamp_data.json"] == ("generic_switch", "cronostar_switch_lamp_", "lamp")
+    # Meta prefix wins; the filename is only consulted when meta has none
+    assert run(storage.list_profiles(preset_type="switch", prefix="cronostar_switch_lamp")) == ["cronostar_lamp_data.json"]
+    assert run(storage.list_profiles(prefix="cronostar_legacy_")) == ["cronostar_legacy_data.json"]
+    assert [f for f, _ in run(storage.get_cached_containers(preset_type="outlet", global_prefix="cronostar_switch_lamp"))] == ["cronostar_lamp_data.json"]
+
+    run(storage.clear_cache())
+    assert storage._cache_keys == {}
+
+
 def test_get_cached_containers_skips_non_dict(tmp_path):
     """Test che elementi non-dict vengano ignorati."""
     hass = _make_hass(tmp_path)
@@ -532,7 +550,7 @@ def test_update_active_profile_success(tmp_path):
     _write_container(storage.profiles_dir / filename, container)
 
     with patch(
-        "custom_components.cronostar.utils.filename_builder.build_profile_filename",
+        "custom_components.cronostar.storage.storage_manager.build_profile_filename",
         return_value=filename,
     ):
         ok = run(storage.update_active_profile("thermostat", "cronostar_thermostat_k_", "Comfort"))
@@ -553,7 +571,7 @@ def test_update_enabled_state(tmp_path):
     )
 
     with patch(
-        "custom_components.cronostar.utils.filename_builder.build_profile_filename",
+        "custom_components.cronostar.storage.storage_manager.build_profile_filename",
         return_value=filename,
     ):
         ok = run(storage.update_enabled_state("thermostat", "cronostar_thermostat_k_", False))
@@ -564,7 +582,7 @@ def test_update_enabled_state(tmp_path):
 
     # Update back to True
     with patch(
-        "custom_components.cronostar.utils.filename_builder.build_profile_filename",
+        "custom_components.cronostar.storage.storage_manager.build_profile_filename",
         return_value=filename,
     ):
         ok = run(storage.update_enabled_state("thermostat", "cronostar_thermostat_k_", True))
@@ -580,7 +598,7 @@ def test_update_enabled_state_missing_container(tmp_path):
     storage = _make_storage(hass, tmp_path)
 
     with patch(
-        "custom_components.cronostar.utils.filename_builder.build_profile_filename",
+        "custom_components.cronostar.storage.storage_manager.build_profile_filename",
         return_value="nonexistent.json",
     ):
         ok = run(storage.update_enabled_state("thermostat", "prefix_", False))
@@ -594,7 +612,7 @@ def test_update_active_profile_missing_container(tmp_path):
     storage = _make_storage(hass, tmp_path)
 
     with patch(
-        "custom_components.cronostar.utils.filename_builder.build_profile_filename",
+        "custom_components.cronostar.storage.storage_manager.build_profile_filename",
         return_value="nonexistent.json",
     ):
         ok = run(storage.update_active_profile("thermostat", "prefix_", "Comfort"))
@@ -608,7 +626,7 @@ def test_update_active_profile_exception(tmp_path):
     storage = _make_storage(hass, tmp_path)
 
     with patch(
-        "custom_components.cronostar.utils.filename_builder.build_profile_filename",
+        "custom_components.cronostar.storage.storage_manager.build_profile_filename",
         side_effect=Exception("error"),
     ):
         ok = run(storage.update_active_profile("thermostat", "prefix_", "Comfort"))
@@ -0,0 +1,303 @@
+"""Test SQLite storage backend."""
+import asyncio
+import json
+import sqlite3
+from unittest.mock import MagicMock
+
+from custom_components.cronostar.const import STORAGE_BACKEND_JSON, STORAGE_BACKEND_SQLITE
+from custom_components.cronostar.storage.sqlite_store import SQLITE_DB_FILENAME, SqliteProfileStore
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _make_hass(tmp_path):
+    hass = MagicMock()
+    hass.config.path = MagicMock(return_value=str(tmp_path))
+
+    async def fake_executor(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = fake_executor
+    return hass
+
+
+def _make_storage(tmp_path):
+    from custom_components.cronostar.storage.storage_manager import StorageManager
+    return StorageManager(_make_hass(tmp_path), tmp_path / "profiles")
+
+
+def _save(storage, name, prefix="cronostar_thermostat_k_", preset="thermostat", schedule=None):
+    return run(storage.save_profile(
+        profile_name=name,
+        preset_type=preset,
+        profile_data={"schedule": schedule or [{"time": "08:00", "value": 21.0}, {"time": "22:00", "value": 17.5}]},
+        metadata={"target_entity": "climate.k"},
+        global_prefix=prefix,
+    ))
+
+
+def _container(name="Comfort"):
+    return {
+        "meta": {"preset_type": "thermostat", "global_prefix": "cronostar_thermostat_k_", "is_enabled": True},
+        "profiles": {
+            name: {
+                "schedule": [{"time": "00:00", "value": 18.0}, {"time": "07:30", "value": 21.0, "note": "wake"}],
+                "updated_at": "2026-01-01T00:00:00",
+            },
+        },
+    }
+
+
+# ---------------------------------------------------------------------------
+# SqliteProfileStore
+# ---------------------------------------------------------------------------
+
+def test_store_uses_wal_and_indexes(tmp_path):
+    store = SqliteProfileStore(tmp_path / SQLITE_DB_FILENAME)
+    store.open()
+    store.close()
+
+    conn = sqlite3.connect(tmp_path / SQLITE_DB_FILENAME)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"idx_containers_preset", "idx_containers_prefix"} <= indexes
+    conn.close()
+
+
+def test_store_container_roundtrip(tmp_path):
+    store = SqliteProfileStore(tmp_path / SQLITE_DB_FILENAME)
+    store.open()
+    container = _container()
+
+    store.write_container("cronostar_thermostat_k_data.json", container)
+
+    assert store.read_container("cronostar_thermostat_k_data.json") == container
+    assert store.read_container("missing.json") == {}
+    store.close()
+
+
+def test_store_list_filters_by_preset_and_prefix(tmp_path):
+    store = SqliteProfileStore(tmp_path / SQLITE_DB_FILENAME)
+    store.open()
+    store.write_container("cronostar_a_data.json", {"meta": {"preset_type": "thermostat", "global_prefix": "cronostar_a_"}, "profiles": {}})
+    store.write_container("cronostar_b_data.json", {"meta": {"preset_type": "switch", "global_prefix": "cronostar_b_"}, "profiles": {}})
+    # Legacy container without meta prefix: derived from the filename
+    store.write_container("cronostar_c_data.json", {"meta": {"preset_type": "thermostat"}, "profiles": {}})
+
+    assert store.list_containers() == ["cronostar_a_data.json", "cronostar_b_data.json", "cronostar_c_data.json"]
+    assert store.list_containers(preset_type="thermostat") == ["cronostar_a_data.json", "cronostar_c_data.json"]
+    # Switch aliases are normalized on both sides
+    assert store.list_containers(preset_type="generic_switch") == ["cronostar_b_data.json"]
+    assert store.list_containers(prefix="cronostar_c") == ["cronostar_c_data.json"]
+    assert store.list_containers(preset_type="thermostat", prefix="cronostar_b_") == []
+    store.close()
+
+
+def test_store_single_profile_updates(tmp_path):
+    store = SqliteProfileStore(tmp_path / SQLITE_DB_FILENAME)
+    store.open()
+    fname = "cronostar_thermostat_k_data.json"
+    store.write_container(fname, _container())
+    stamp = store.get_mtime(fname)
+
+    store.upsert_profile(fname, "Eco", {"schedule": [{"time": "00:00", "value": 16.0}]}, {"preset_type": "thermostat", "global_prefix": "cronostar_thermostat_k_"})
+    assert store.get_mtime(fname) > stamp
+    assert set(store.read_container(fname)["profiles"]) == {"Comfort", "Eco"}
+
+    assert store.delete_profile(fname, "Comfort") == 1
+    assert store.update_meta(fname, {"last_active_profile": "Eco"}) is True
+    container = store.read_container(fname)
+    assert list(container["profiles"]) == ["Eco"]
+    assert container["meta"]["last_active_profile"] == "Eco"
+
+    assert store.delete_container(fname) is True
+    assert store.exists(fname) is False
+    # Points cascade with their container
+    assert store._conn.execute("SELECT COUNT(*) FROM schedule_points").fetchone()[0] == 0
+    store.close()
+
+
+def test_store_json_import_export(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    container = _container()
+    (src / "cronostar_thermostat_k_data.json").write_text(json.dumps(container), "utf-8")
+    (src / "cronostar_broken_data.json").write_text("{not json", "utf-8")
+
+    store = SqliteProfileStore(tmp_path / SQLITE_DB_FILENAME)
+    store.open()
+    assert store.import_json_dir(src) == 1
+
+    dst = tmp_path / "dst"
+    assert store.export_json_dir(dst) == 1
+    assert json.loads((dst / "cronostar_thermostat_k_data.json").read_text("utf-8")) == container
+    store.close()
+
+
+LEGACY_FIXTURES = {
+    "cronostar_a_data.json": {"meta": {"preset_type": "thermostat", "global_prefix": "cronostar_a_"}, "profiles": {}},
+    "cronostar_ev_b_data.json": {"meta": {"preset_type": "ev", "global_prefix": "cronostar_ev_b_"}, "profiles": {}},
+    # No meta at all: thermostat, listed by filename base
+    "cronostar_legacy_data.json": {"profiles": {}},
+    # Pre-meta layout with a top-level preset type
+    "cronostar_old_switch_data.json": {"preset_type": "switch", "profiles": {}},
+    # Meta prefix differing from the filename
+    "cronostar_c_data.json": {"meta": {"global_prefix": "cronostar_moved_"}, "profiles": {}},
+}
+
+
+def test_backends_list_legacy_containers_alike(tmp_path):
+    profiles_dir = tmp_path / "profiles"
+    storage = _make_storage(tmp_path)
+    for filename, container in LEGACY_FIXTURES.items():
+        (profiles_dir / filename).write_text(json.dumps(container), "utf-8")
+
+    store = SqliteProfileStore(tmp_path / SQLITE_DB_FILENAME)
+    store.open()
+    assert store.import_json_dir(profiles_dir) == len(LEGACY_FIXTURES)
+
+    presets = [None, "thermostat", "generic_switch", "ev_charging"]
+    prefixes = [None, "cronostar_a_", "cronostar_legacy", "cronostar_old_switch_", "cronostar_c_", "cronostar_moved", "cronostar_ev_b"]
+    for preset in presets:
+        for prefix in prefixes:
+            assert store.list_containers(preset, prefix) == run(storage.list_profiles(preset, prefix)), (preset, prefix)
+    assert store.list_containers("thermostat", "cronostar_legacy_") == ["cronostar_legacy_data.json"]
+    store.close()
+
+
+def test_store_reindexes_databases_from_older_versions(tmp_path):
+    store = SqliteProfileStore(tmp_path / SQLITE_DB_FILENAME)
+    store.open()
+    store.write_container("cronostar_legacy_data.json", {"profiles": {}})
+    # Keys as written before the listing matched the JSON backend
+    store._conn.execute("UPDATE containers SET preset_type = '', global_prefix = 'cronostar_legacy_'")
+    store._conn.execute("PRAGMA user_version = 1")
+    store.close()
+
+    store.open()
+    assert store.list_containers(preset_type="thermostat") == ["cronostar_legacy_data.json"]
+    assert store._conn.execute("SELECT global_prefix FROM containers").fetchone()[0] == ""
+    store.close()
+
+
+# ---------------------------------------------------------------------------
+# StorageManager with the SQLite backend
+# ---------------------------------------------------------------------------
+
+def test_switch_to_sqlite_imports_json_layout(tmp_path):
+    storage = _make_storage(tmp_path)
+    _save(storage, "Comfort")
+    _save(storage, "Away", prefix="cronostar_thermostat_z_")
+
+    assert run(storage.async_set_backend(STORAGE_BACKEND_SQLITE)) is True
+    assert storage.backend_name == STORAGE_BACKEND_SQLITE
+    assert (storage.profiles_dir / SQLITE_DB_FILENAME).exists()
+
+    files = run(storage.list_profiles(preset_type="thermostat", prefix="cronostar_thermostat_k_"))
+    assert files == ["cronostar_thermostat_k_data.json"]
+    container = run(storage.load_profile_cached(files[0]))
+    assert container["profiles"]["Comfort"]["schedule"][1]["value"] == 17.5
+    # Cache re-populated from the new backend
+    assert len(run(storage.get_cached_containers())) == 2
+
+
+def test_sqlite_backend_mutations_do_not_touch_json(tmp_path):
+    storage = _make_storage(tmp_path)
+    _save(storage, "Comfort")
+    json_file = storage.profiles_dir / "cronostar_thermostat_k_data.json"
+    json_before = json_file.read_text("utf-8")
+    run(storage.async_set_backend(STORAGE_BACKEND_SQLITE))
+
+    assert _save(storage, "Eco") is True
+    assert run(storage.update_active_profile("thermostat", "cronostar_thermostat_k_", "Eco")) is True
+    assert run(storage.update_enabled_state("thermostat", "cronostar_thermostat_k_", False)) is True
+    assert run(storage.delete_profile("Comfort", "thermostat", "cronostar_thermostat_k_")) is True
+
+    assert json_file.read_text("utf-8") == json_before
+    assert run(storage.get_profile_list("thermostat", "cronostar_thermostat_k_")) == ["Eco"]
+
+    # A fresh reader sees the same data
+    reader = _make_storage(tmp_path)
+    run(reader.async_set_backend(STORAGE_BACKEND_SQLITE))
+    container = run(reader.load_profile_cached("cronostar_thermostat_k_data.json"))
+    assert list(container["profiles"]) == ["Eco"]
+    assert container["meta"]["last_active_profile"] == "Eco"
+    assert container["meta"]["is_enabled"] is False
+    run(reader.async_close())
+    run(storage.async_close())
+
+
+def test_sqlite_cache_hit_until_changed(tmp_path):
+    storage = _make_storage(tmp_path)
+    run(storage.async_set_backend(STORAGE_BACKEND_SQLITE))
+    _save(storage, "Comfort")
+    fname = "cronostar_thermostat_k_data.json"
+
+    first = run(storage.load_profile_cached(fname))
+    assert run(storage.load_profile_cached(fname)) is first
+
+    storage.backend.update_meta(fname, {"title": "changed elsewhere"})
+    reloaded = run(storage.load_profile_cached(fname))
+    assert reloaded is not first
+    assert reloaded["meta"]["title"] == "changed elsewhere"
+
+
+def test_sqlite_delete_controller_files(tmp_path):
+    storage = _make_storage(tmp_path)
+    run(storage.async_set_backend(STORAGE_BACKEND_SQLITE))
+    _save(storage, "Comfort")
+
+    assert run(storage.delete_controller_files("cronostar_thermostat_k_")) is True
+    assert run(storage.list_profiles()) == []
+    assert run(storage.delete_controller_files("cronostar_thermostat_k_")) is False
+
+
+def test_switch_back_to_json_exports_and_drops_database(tmp_path):
+    storage = _make_storage(tmp_path)
+    run(storage.async_set_backend(STORAGE_BACKEND_SQLITE))
+    _save(storage, "Comfort")
+    _save(storage, "Eco")
+
+    assert run(storage.async_set_backend(STORAGE_BACKEND_JSON)) is True
+    assert storage.backend is None
+    assert not (storage.profiles_dir / SQLITE_DB_FILENAME).exists()
+
+    data = json.loads((storage.profiles_dir / "cronostar_thermostat_k_data.json").read_text("utf-8"))
+    assert set(data["profiles"]) == {"Comfort", "Eco"}
+    assert run(storage.list_profiles()) == ["cronostar_thermostat_k_data.json"]
+
+
+def test_set_backend_same_value_is_noop(tmp_path):
+    storage = _make_storage(tmp_path)
+    assert run(storage.async_set_backend(STORAGE_BACKEND_JSON)) is True
+    assert not (storage.profiles_dir / SQLITE_DB_FILENAME).exists()
+
+
+def test_sqlite_ignores_journal_mode(tmp_path):
+    storage = _make_storage(tmp_path)
+    _save(storage, "Comfort")
+    storage.journal_enabled = True
+    run(storage.async_set_backend(STORAGE_BACKEND_SQLITE))
+
+    _save(storage, "Eco")
+
+    assert not storage._journal.path_for("cronostar_thermostat_k_data.json").exists()
+    assert run(storage.async_compact()) == 0
+
+
+def test_export_selected_containers(tmp_path):
+    storage = _make_storage(tmp_path)
+    run(storage.async_set_backend(STORAGE_BACKEND_SQLITE))
+    _save(storage, "Comfort")
+    _save(storage, "Away", prefix="cronostar_thermostat_z_")
+
+    target = tmp_path / "export"
+    target.mkdir()
+    assert run(storage.async_export_json(["cronostar_thermostat_z_data.json"], target)) == 1
+    assert [p.name for p in target.iterdir()] == ["cronostar_thermostat_z_data.json"]
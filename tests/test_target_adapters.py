@@ -0,0 +1,95 @@
+"""Test the target adapter registry and its use by the coordinator and apply_now."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.cronostar import coordinator as coordinator_mod
+from custom_components.cronostar.const import DOMAIN
+from custom_components.cronostar.setup.services import setup_services
+from custom_components.cronostar.utils.target_adapters import (
+    TARGET_ADAPTERS,
+    OnOffAdapter,
+    TargetAdapter,
+    ValueAdapter,
+    register_target_adapter,
+    resolve_target,
+)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.mark.parametrize(
+    ("entity_id", "value", "expected"),
+    [
+        ("climate.a", 21.5, ("climate", "set_temperature", {"entity_id": "climate.a", "temperature": 21.5})),
+        ("switch.a", 1, ("switch", "turn_on", {"entity_id": "switch.a"})),
+        ("fan.a", 0, ("fan", "turn_off", {"entity_id": "fan.a"})),
+        ("input_number.a", 3.5, ("input_number", "set_value", {"entity_id": "input_number.a", "value": 3.5})),
+        ("number.a", 16, ("number", "set_value", {"entity_id": "number.a", "value": 16})),
+        ("cover.a", 42.7, ("cover", "set_cover_position", {"entity_id": "cover.a", "position": 42})),
+        ("water_heater.a", 55.0, ("water_heater", "set_temperature", {"entity_id": "water_heater.a", "temperature": 55.0})),
+        ("humidifier.a", 45.0, ("humidifier", "set_humidity", {"entity_id": "humidifier.a", "humidity": 45})),
+        ("valve.a", 30.0, ("valve", "set_valve_position", {"entity_id": "valve.a", "position": 30})),
+    ],
+)
+def test_adapter_payloads(entity_id, value, expected):
+    assert resolve_target(entity_id)(value) == expected
+
+
+def test_unknown_domain_and_registration():
+    assert resolve_target("sensor.a") is None
+    try:
+        register_target_adapter("siren", ValueAdapter("turn_on", "volume_level"))
+        assert resolve_target("siren.a")(0.5) == ("siren", "turn_on", {"entity_id": "siren.a", "volume_level": 0.5})
+    finally:
+        TARGET_ADAPTERS.pop("siren")
+
+
+def test_adapter_base_is_abstract():
+    with pytest.raises(TypeError):
+        TargetAdapter()
+
+
+def test_status_follows_registered_adapter(mock_coordinator):
+    coord = mock_coordinator
+    coord.logging_enabled = True
+    coord.target_entity = "siren.alarm"
+    coord.hass.services.async_call = AsyncMock()
+    try:
+        register_target_adapter("siren", OnOffAdapter())
+        with patch.object(coordinator_mod, "_LOGGER") as logger:
+            run(coord._update_target_entity(1.0))
+    finally:
+        TARGET_ADAPTERS.pop("siren")
+    assert logger.info.call_args_list[0][0][4] == "ON"
+
+
+def test_coordinator_resolves_target_once(mock_coordinator):
+    coord = mock_coordinator
+    coord.hass.services.async_call = AsyncMock()
+    with patch.object(coordinator_mod, "resolve_target", wraps=resolve_target) as resolve:
+        run(coord._update_target_entity(20.0))
+        run(coord._update_target_entity(21.0))
+        assert resolve.call_count == 1
+
+        coord.target_entity = "water_heater.boiler"
+        run(coord._update_target_entity(50.0))
+        assert resolve.call_count == 2
+
+    assert coord.hass.services.async_call.call_args_list[-1][0] == ("water_heater", "set_temperature", {"entity_id": "water_heater.boiler", "temperature": 50.0})
+
+
+def test_apply_now_uses_adapters(hass):
+    ps = MagicMock()
+    ps.get_profile_data = AsyncMock(return_value={"schedule": [{"time": "00:00", "value": 40.0}]})
+    hass.data[DOMAIN] = {"settings_manager": MagicMock()}
+    with patch("custom_components.cronostar.setup.services.ProfileService", return_value=ps):
+        run(setup_services(hass, MagicMock()))
+    handler = hass.services.async_register.call_args_list[-1][0][2]
+
+    hass.services.async_call = AsyncMock()
+    run(handler(MagicMock(data={"target_entity": "humidifier.bedroom", "profile_name": "Default"})))
+    hass.services.async_call.assert_awaited_once_with("humidifier", "set_humidity", {"entity_id": "humidifier.bedroom", "humidity": 40}, blocking=True)
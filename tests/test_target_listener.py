@@ -0,0 +1,73 @@
+"""Test target availability pushed by the state change listener."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.cronostar import coordinator as coordinator_mod
+from custom_components.cronostar.utils.retry_queue import get_retry_queue
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def _event(state):
+    return MagicMock(data={"new_state": None if state is None else MagicMock(state=state)})
+
+
+def _tracked(coord, state):
+    coord.hass.states.async_set("climate.test_entity", state)
+    track = MagicMock(return_value=MagicMock())
+    with patch.object(coordinator_mod, "async_track_state_change_event", track):
+        coord.async_track_target()
+        coord.async_track_target()
+    track.assert_called_once_with(coord.hass, ["climate.test_entity"], coord._async_target_changed)
+    return track.return_value
+
+
+def test_comeback_applies_immediately(mock_coordinator):
+    coord = mock_coordinator
+    _tracked(coord, "unavailable")
+    assert coord._target_available is False
+    coord.apply_schedule = AsyncMock()
+
+    run(coord._async_target_changed(_event("heat")))
+    coord.apply_schedule.assert_awaited_once()
+    assert coord.data == coord._state_data()
+
+    # Attribute-only updates keep the target available: nothing to do
+    run(coord._async_target_changed(_event("heat")))
+    assert coord.apply_schedule.await_count == 1
+
+
+def test_no_work_while_unavailable(mock_coordinator):
+    coord = mock_coordinator
+    _tracked(coord, "heat")
+    coord.apply_schedule = AsyncMock()
+    get_retry_queue(coord.hass).add("climate.test_entity", 20.0, AsyncMock())
+
+    run(coord._async_target_changed(_event(None)))
+    assert get_retry_queue(coord.hass).pending == 0
+    coord.apply_schedule.assert_not_called()
+
+    coord.hass.states.get = MagicMock()
+    run(coord._async_update_data())
+    coord.apply_schedule.assert_not_called()
+    coord.hass.states.get.assert_not_called()
+
+
+def test_comeback_waits_for_deferred_startup(mock_coordinator):
+    coord = mock_coordinator
+    _tracked(coord, "unknown")
+    coord.apply_deferred = True
+    coord.apply_schedule = AsyncMock()
+    run(coord._async_target_changed(_event("heat")))
+    coord.apply_schedule.assert_not_called()
+    assert coord._target_available is True
+
+
+def test_shutdown_removes_listener(mock_coordinator):
+    coord = mock_coordinator
+    unsub = _tracked(coord, "heat")
+    run(coord.async_shutdown())
+    unsub.assert_called_once()
+    assert coord._unsub_target is None
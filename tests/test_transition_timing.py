@@ -0,0 +1,81 @@
+"""Test point-in-time transitions armed at schedule breakpoints."""
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.cronostar import coordinator as coordinator_mod
+from custom_components.cronostar.sensor import CronoStarApplyLagSensor
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def _stepped(coord, schedule):
+    coord.preset_type = "generic_switch"
+    coord.target_entity = "switch.heater"
+    coord.hass.states.async_set("switch.heater", "off")
+    coord.storage_manager.list_profiles = AsyncMock(return_value=["f.json"])
+    coord.storage_manager.load_profile_cached = AsyncMock(return_value={"profiles": {"Default": {"schedule": schedule}}})
+
+
+def test_transition_armed_at_breakpoint_second(mock_coordinator):
+    coord = mock_coordinator
+    _stepped(coord, [{"time": "00:00", "value": 0}, {"time": "06:30", "value": 1}])
+    track = MagicMock(return_value=MagicMock())
+
+    with patch.object(coordinator_mod, "async_track_point_in_time", track), patch.object(coordinator_mod, "datetime") as mock_dt:
+        mock_dt.now.return_value = datetime(2024, 1, 1, 6, 29, 41, 500000)
+        run(coord.apply_schedule())
+        mock_dt.now.return_value = datetime(2024, 1, 1, 6, 29, 55)
+        run(coord.apply_schedule())
+
+    track.assert_called_once()
+    _, action, due = track.call_args[0]
+    assert action == coord._async_handle_transition
+    assert due == datetime(2024, 1, 1, 6, 30).astimezone()
+
+
+def test_transition_applies_and_records_lag(mock_coordinator):
+    coord = mock_coordinator
+    _stepped(coord, [{"time": "00:00", "value": 0}, {"time": "06:30", "value": 1}])
+    coord._transition_due = datetime.now().astimezone()
+    coord.hass.services.async_call = AsyncMock()
+
+    with patch.object(coordinator_mod, "async_track_point_in_time", MagicMock(return_value=MagicMock())):
+        run(coord._async_handle_transition(coord._transition_due))
+
+    coord.hass.services.async_call.assert_awaited_once()
+    stats = coord.metrics.timer_stats("coordinator.apply_lag")
+    assert stats["count"] == 1 and stats["max_ms"] < 1000
+    assert coord._breakpoint_due is None
+    assert coord.data == coord._state_data()
+    assert CronoStarApplyLagSensor(coord).native_value == coord.metrics.percentile("coordinator.apply_lag", 95)
+
+    # Regular polls are not transitions: no lag sample
+    run(coord.apply_schedule())
+    assert coord.metrics.timer_stats("coordinator.apply_lag")["count"] == 1
+
+
+def test_transition_skipped_while_deferred(mock_coordinator):
+    coord = mock_coordinator
+    coord.apply_deferred = True
+    coord.apply_schedule = AsyncMock()
+    run(coord._async_handle_transition(datetime.now().astimezone()))
+    coord.apply_schedule.assert_not_called()
+
+
+def test_disable_and_shutdown_cancel_transition(mock_coordinator):
+    coord = mock_coordinator
+    unsub = MagicMock()
+    coord._unsub_transition = unsub
+    coord._transition_due = datetime.now().astimezone()
+    coord.is_enabled = False
+
+    run(coord.apply_schedule())
+    unsub.assert_called_once()
+    assert coord._unsub_transition is None and coord._transition_due is None
+
+    coord._unsub_transition = unsub
+    run(coord.async_shutdown())
+    assert unsub.call_count == 2
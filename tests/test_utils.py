@@ -100,3 +100,18 @@ def test_build_profile_filename():
     assert build_profile_filename("thermostat", "kitchen") == "cronostar_kitchen_data.json"
     assert build_profile_filename("thermostat", "") == "cronostar_default_data.json"
     assert build_profile_filename("thermostat", "cronostar_thermostat_kitchen_") == "cronostar_thermostat_kitchen_data.json"
+
+def test_normalization_is_memoized(caplog):
+    """Alias resolution and filenames are memoized; alias warnings are logged once per input."""
+    import logging
+    from custom_components.cronostar.utils import filename_builder, prefix_normalizer
+
+    prefix_normalizer._canonical_preset_type.cache_clear()
+    with caplog.at_level(logging.WARNING):
+        assert [normalize_preset_type(" Plug ") for _ in range(5)] == ["generic_switch"] * 5
+    assert caplog.text.count("Preset discrepancy") == 1
+    assert prefix_normalizer._canonical_preset_type.cache_info().hits == 4
+
+    filename_builder._filename_for_prefix.cache_clear()
+    assert build_profile_filename("thermostat", "kitchen") == build_profile_filename("thermostat", "kitchen_")
+    assert filename_builder._filename_for_prefix.cache_info().hits == 1
@@ -0,0 +1,116 @@
+"""Test per-weekday schedules compiled into weekly breakpoint tables."""
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.cronostar.storage.compact_schedule import CompactSchedule, compact_container
+from custom_components.cronostar.utils.schedule_table import WEEK_MINUTES, ScheduleTable, compile_week_table, week_minute
+
+WEEKDAY = [{"time": "00:00", "value": 18.0}, {"time": "07:00", "value": 21.0}, {"time": "22:00", "value": 18.0}]
+WEEKEND = [{"time": "00:00", "value": 18.0}, {"time": "09:00", "value": 22.0}]
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+# ---------------------------------------------------------------------------
+# ScheduleTable
+# ---------------------------------------------------------------------------
+
+def test_week_minute():
+    # 2024-01-01 is a Monday
+    assert week_minute(datetime(2024, 1, 1, 0, 0)) == 0
+    assert week_minute(datetime(2024, 1, 6, 9, 30)) == 5 * 1440 + 570
+    assert week_minute(datetime(2024, 1, 7, 23, 59)) == WEEK_MINUTES - 1
+
+
+def test_compile_falls_back_to_base_schedule():
+    assert compile_week_table({"schedule": WEEKDAY}) is None
+    assert compile_week_table({"schedule": WEEKDAY, "weekdays": {}}) is None
+
+    table = compile_week_table({"schedule": CompactSchedule.from_points(WEEKDAY), "weekdays": {"sat": WEEKEND, "sun": WEEKEND}})
+    assert len(table) == 5 * 3 + 2 * 2
+    assert table.minutes == sorted(table.minutes)
+    # Friday 23:00 still uses the weekday schedule, Saturday 10:00 the weekend one
+    assert table.value_at(4 * 1440 + 23 * 60, stepped=True) == 18.0
+    assert table.value_at(5 * 1440 + 10 * 60, stepped=True) == 22.0
+
+
+def test_interpolation_wraps_around_the_week():
+    table = ScheduleTable([(6 * 1440 + 1380, 10.0), (60, 20.0)])  # Sunday 23:00 -> Monday 01:00
+    assert table.value_at(0) == 15.0
+    assert table.value_at(6 * 1440 + 1380) == 10.0
+    assert table.value_at(0, stepped=True) == 10.0
+    assert ScheduleTable([]).value_at(0) is None
+
+
+def test_next_change_crosses_days():
+    table = compile_week_table({"schedule": WEEKDAY, "weekdays": {"sat": WEEKEND, "sun": WEEKEND}})
+
+    # Friday 22:30 (18.0): next change is Saturday 09:00
+    assert table.next_change(4 * 1440 + 22 * 60 + 30, 18.0) == ("09:00", 90 + 540)
+
+    # Sunday 22:00 (22.0): next change is Monday 00:00 (18.0) across the week boundary
+    assert table.next_change(6 * 1440 + 1320, 22.0) == ("00:00", 120)
+
+    # Saturday 08:00: next change is 09:00 the same day
+    assert table.next_change(5 * 1440 + 480, 18.0) == ("09:00", 60)
+
+    assert ScheduleTable([(0, 1.0), (600, 1.0)]).next_change(10, 1.0) is None
+
+
+# ---------------------------------------------------------------------------
+# Coordinator / services
+# ---------------------------------------------------------------------------
+
+def test_coordinator_applies_weekday_schedule(mock_coordinator):
+    coord = mock_coordinator
+    coord._update_target_entity = AsyncMock()
+    profile = {"schedule": WEEKDAY, "weekdays": {"sat": WEEKEND}}
+    coord.selected_profile = "Default"
+    coord.storage_manager.list_profiles = AsyncMock(return_value=["f.json"])
+    coord.storage_manager.load_profile_cached = AsyncMock(return_value={"profiles": {"Default": profile}})
+
+    with patch("custom_components.cronostar.coordinator.datetime") as mock_dt:
+        mock_dt.now.return_value = datetime(2024, 1, 6, 8, 0)  # Saturday
+        run(coord.apply_schedule())
+        table = coord._table_cache[3]
+        run(coord.apply_schedule())
+
+    assert coord._table_cache[3] is table  # compiled once while the profile is unchanged
+    value, next_change = coord._update_target_entity.call_args[0]
+    assert value == 21.56  # interpolated between 00:00 (18) and 09:00 (22)
+    assert next_change == ("09:00", 60)
+
+
+def test_save_profile_stores_validated_weekdays(profile_service):
+    profile_service.get_profile_data = AsyncMock(return_value={"error": "Profile not found"})
+    call = MagicMock()
+    call.data = {
+        "profile_name": "Comfort",
+        "preset_type": "thermostat",
+        "global_prefix": "cronostar_thermostat_k_",
+        "schedule": WEEKDAY,
+        "weekdays": {"Saturday": WEEKEND, "sun": [], "holiday": WEEKEND},
+    }
+    run(profile_service.save_profile(call))
+
+    profile_data = profile_service.storage.save_profile.call_args[1]["profile_data"]
+    assert profile_data["weekdays"] == {"sat": WEEKEND}
+
+
+def test_save_profile_keeps_existing_weekdays(profile_service):
+    profile_service.get_profile_data = AsyncMock(return_value={"profile_name": "Comfort", "schedule": WEEKDAY, "weekdays": {"sun": WEEKEND}})
+    call = MagicMock()
+    call.data = {"profile_name": "Comfort", "preset_type": "thermostat", "global_prefix": "cronostar_thermostat_k_", "schedule": WEEKDAY}
+    run(profile_service.save_profile(call))
+
+    assert profile_service.storage.save_profile.call_args[1]["profile_data"]["weekdays"] == {"sun": WEEKEND}
+
+
+def test_compact_container_packs_weekdays():
+    container = {"profiles": {"Comfort": {"schedule": list(WEEKDAY), "weekdays": {"sat": list(WEEKEND)}}}}
+    compact_container(container)
+    assert isinstance(container["profiles"]["Comfort"]["weekdays"]["sat"], CompactSchedule)
+    assert container["profiles"]["Comfort"]["weekdays"]["sat"] == WEEKEND